@@ -0,0 +1,159 @@
+"""
+목적:
+- 드라이버 스크립트가 공유하는 환경/인자 처리 유틸을 제공한다.
+
+설명:
+- `.env` 파싱, 필수 환경 변수 확인, 불리언/임베딩 파싱, LLM 팩토리 로딩을 한곳에 둔다.
+- 캐시/numpy 파싱 같은 최적화를 한 번만 구현해 모든 드라이버가 함께 사용한다.
+- 결과 출력은 pydantic-core 직렬화 바이트를 stdout 바이너리 버퍼에 바로 쓴다.
+- 라이브러리(`vtree_search`)가 아닌 드라이버 전용 모듈이다.
+
+디자인 패턴:
+- 함수형 유틸 모듈(Function Utility Module).
+
+참조:
+- scripts/run-search.py
+- scripts/run-ingestion.py
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+import os
+import sys
+import warnings
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+
+import numpy as np
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+_TRUE_VALUES: frozenset[str] = frozenset(("1", "true", "yes", "y"))
+_FALSE_VALUES: frozenset[str] = frozenset(("0", "false", "no", "n"))
+
+
+def load_env_file(path: Path) -> None:
+    if not path.exists():
+        raise RuntimeError(f"환경 파일이 존재하지 않습니다: {path}")
+
+    # 같은 프로세스에서 재호출되면 (경로, 수정 시각) 캐시로 파싱을 건너뛴다.
+    parsed = _parse_env_file(path.resolve(), path.stat().st_mtime_ns)
+    os.environ.update(parsed)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_env_file(path: Path, mtime_ns: int) -> dict[str, str]:
+    # mtime_ns는 파일 변경 시 캐시를 무효화하기 위한 키로만 사용한다.
+    del mtime_ns
+    parsed: dict[str, str] = {}
+    # 파일 전체 문자열과 줄 목록을 따로 만들지 않도록 한 줄씩 스트리밍한다.
+    with path.open(encoding="utf-8") as env_file:
+        for raw_line in env_file:
+            line = raw_line.strip()
+            if not line or line[0] == "#":
+                continue
+            eq = line.find("=")
+            if eq < 0:
+                continue
+
+            key = line[:eq].strip()
+            parsed[key] = _unquote_strip(line, eq + 1)
+    return parsed
+
+
+def _unquote_strip(text: str, start: int = 0) -> str:
+    # 공백 제거와 따옴표 제거를 인덱스 이동으로 처리해 최종 값 슬라이스 하나만 만든다.
+    i, j = start, len(text)
+    while i < j and text[i].isspace():
+        i += 1
+    while j > i and text[j - 1].isspace():
+        j -= 1
+    if j - i >= 2 and text[i] == text[j - 1] and text[i] in "\"'":
+        i += 1
+        j -= 1
+    return text[i:j]
+
+
+def ensure_required_env(keys: Sequence[str], env: Mapping[str, str]) -> None:
+    # 빈 문자열도 누락으로 취급하는 기존 의미는 유지하고, 전부 있으면 목록을 만들지 않는다.
+    if all(env.get(key) for key in keys):
+        return
+    missing = [key for key in keys if not env.get(key)]
+    raise RuntimeError(f"필수 환경 변수가 누락되었습니다: {', '.join(missing)}")
+
+
+def parse_bool_env(env: Mapping[str, str], key: str, default: str) -> bool:
+    raw = env.get(key, default).strip().lower()
+    if raw in _TRUE_VALUES:
+        return True
+    if raw in _FALSE_VALUES:
+        return False
+    raise RuntimeError(f"불리언 환경 변수 형식이 잘못되었습니다: {key}={raw}")
+
+
+def parse_embedding(raw: str, expected_dim: int, option_name: str = "--embedding") -> list[float]:
+    # 토큰 수는 C 레벨 count로 먼저 확인해 차원이 틀린 입력은 파싱 전에 거절한다.
+    token_count = raw.count(",") + 1
+    if token_count != expected_dim:
+        raise RuntimeError(_dim_mismatch_message(option_name, expected_dim, token_count))
+
+    values = _parse_embedding_numpy(raw, option_name)
+    if values.size != expected_dim:
+        raise RuntimeError(_dim_mismatch_message(option_name, expected_dim, values.size))
+    return values.tolist()
+
+
+def _dim_mismatch_message(option_name: str, expected_dim: int, actual: int) -> str:
+    return (
+        f"{option_name} 길이가 VTREE_EMBEDDING_DIM과 일치하지 않습니다: "
+        f"expected={expected_dim}, actual={actual}"
+    )
+
+
+def _parse_embedding_numpy(raw: str, option_name: str) -> np.ndarray:
+    # 토큰 파싱은 numpy C 루프에서 한 번에 수행하고, 계약 경계에서만 list로 변환한다.
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            return np.fromstring(raw, sep=",", dtype=np.float64)
+        except (DeprecationWarning, ValueError) as exc:
+            raise RuntimeError(f"{option_name} 형식이 잘못되었습니다: {exc}") from exc
+
+
+def emit_model(tag: str, model: BaseModel) -> None:
+    """`[tag] {json}` 형식으로 모델을 한 줄 출력한다."""
+    # print로 쓴 텍스트 버퍼와 순서가 섞이지 않도록 먼저 비운 뒤 바이너리 버퍼에 직접 쓴다.
+    sys.stdout.flush()
+    buffer = sys.stdout.buffer
+    buffer.write(tag.encode())
+    buffer.write(b" ")
+    buffer.write(to_json(model))
+    buffer.write(b"\n")
+    buffer.flush()
+
+
+def resolve_loop_factory():
+    # uvloop은 `vtree-search[uvloop]` 선택 의존성이다. 미설치면 기본 루프를 쓰되 그 사실을 stderr에 남긴다.
+    try:
+        import uvloop
+    except ImportError:
+        print("[info] uvloop 미설치: 기본 asyncio 이벤트 루프를 사용합니다 (설치: vtree-search[uvloop])", file=sys.stderr)
+        return None
+    return uvloop.new_event_loop
+
+
+@functools.cache
+def load_factory(spec: str):
+    if ":" not in spec:
+        raise RuntimeError("--llm-factory 형식은 module:function 이어야 합니다")
+    module_name, function_name = spec.split(":", 1)
+    module = importlib.import_module(module_name)
+    return getattr(module, function_name)
+
+
+@functools.cache
+def create_llm(spec: str):
+    # 같은 프로세스에서 main()이 반복 실행되어도 LLM 클라이언트는 한 번만 생성해 재사용한다.
+    return load_factory(spec)()
@@ -6,11 +6,13 @@
 - 라이브러리 본체는 환경 파일을 직접 읽지 않는다.
 - 이 스크립트는 파일 경로 기반 page 노드 생성 후 summary/page 업서트를 수행한다.
 - 표/이미지 주석은 LangChain LLM을 팩토리 함수로 주입해 처리한다.
+- `uvloop`이 설치되어 있으면 이벤트 루프로 사용한다. (선택 의존성 `vtree-search[uvloop]`, 미설치 시 기본 asyncio 루프)
 
 디자인 패턴:
 - 드라이버(Driver Script).
 
 참조:
+- scripts/_driver.py
 - src_py/vtree_search/config/models.py
 - src_py/vtree_search/ingestion/ingestor.py
 """
@@ -19,20 +21,28 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import importlib
 import os
 import sys
+from collections.abc import Mapping
 from pathlib import Path
 
+from _driver import (
+    create_llm,
+    emit_model,
+    ensure_required_env,
+    load_env_file,
+    parse_bool_env,
+    parse_embedding,
+    resolve_loop_factory,
+)
 from vtree_search import (
     IngestionConfig,
-    IngestionPreprocessConfig,
     IngestionSummaryNode,
-    PostgresConfig,
     VtreeIngestor,
 )
+from vtree_search.config import INGESTION_CONFIG_ADAPTER
 
-REQUIRED_ENV_KEYS = [
+REQUIRED_ENV_KEYS = (
     "POSTGRES_HOST",
     "POSTGRES_PORT",
     "POSTGRES_USER",
@@ -45,10 +55,10 @@ REQUIRED_ENV_KEYS = [
     "VTREE_SUMMARY_TABLE",
     "VTREE_PAGE_TABLE",
     "VTREE_EMBEDDING_DIM",
-]
+)
 
 
-def parse_args() -> argparse.Namespace:
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Vtree Ingestion 드라이버")
     parser.add_argument("--document-id", required=True, help="대상 문서 ID")
     parser.add_argument("--parent-node-id", required=True, help="page 노드의 부모(summary) 노드 ID")
@@ -84,112 +94,88 @@ def parse_args() -> argparse.Namespace:
         default=".env",
         help="루트 기준 환경 파일 경로 (기본: .env)",
     )
-    return parser.parse_args()
-
-
-def load_env_file(path: Path) -> None:
-    if not path.exists():
-        raise RuntimeError(f"환경 파일이 존재하지 않습니다: {path}")
-
-    for raw_line in path.read_text(encoding="utf-8").splitlines():
-        line = raw_line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "=" not in line:
-            continue
-
-        key, value = line.split("=", 1)
-        key = key.strip()
-        value = value.strip().strip('"').strip("'")
-        os.environ[key] = value
-
-
-def ensure_required_env() -> None:
-    missing = [key for key in REQUIRED_ENV_KEYS if not os.environ.get(key)]
-    if missing:
-        raise RuntimeError(f"필수 환경 변수가 누락되었습니다: {', '.join(missing)}")
-
-
-def parse_bool_env(key: str, default: str) -> bool:
-    raw = os.environ.get(key, default).strip().lower()
-    if raw in {"1", "true", "yes", "y"}:
-        return True
-    if raw in {"0", "false", "no", "n"}:
-        return False
-    raise RuntimeError(f"불리언 환경 변수 형식이 잘못되었습니다: {key}={raw}")
-
-
-def parse_embedding(raw: str, expected_dim: int) -> list[float]:
-    values = [float(token.strip()) for token in raw.split(",") if token.strip()]
-    if len(values) != expected_dim:
-        raise RuntimeError(
-            "--summary-embedding 길이가 VTREE_EMBEDDING_DIM과 일치하지 않습니다: "
-            f"expected={expected_dim}, actual={len(values)}"
-        )
-    return values
-
-
-def build_config() -> IngestionConfig:
-    postgres = PostgresConfig(
-        host=os.environ["POSTGRES_HOST"],
-        port=int(os.environ["POSTGRES_PORT"]),
-        user=os.environ["POSTGRES_USER"],
-        password=os.environ["POSTGRES_PASSWORD"],
-        database=os.environ["POSTGRES_DATABASE"],
-        summary_table=os.environ["VTREE_SUMMARY_TABLE"],
-        page_table=os.environ["VTREE_PAGE_TABLE"],
-        embedding_dim=int(os.environ["VTREE_EMBEDDING_DIM"]),
-        pool_min=int(os.environ["POSTGRES_POOL_MIN"]),
-        pool_max=int(os.environ["POSTGRES_POOL_MAX"]),
-        connect_timeout_ms=int(os.environ["POSTGRES_CONNECT_TIMEOUT_MS"]),
-        statement_timeout_ms=int(os.environ["POSTGRES_STATEMENT_TIMEOUT_MS"]),
-    )
+    return parser
 
-    preprocess = IngestionPreprocessConfig(
-        max_chunk_chars=int(os.environ.get("INGEST_MAX_CHUNK_CHARS", "1024")),
-        sample_per_extension=parse_bool_env("INGEST_SAMPLE_PER_EXTENSION", "false"),
-        enable_table_annotation=parse_bool_env("INGEST_ENABLE_TABLE_ANNOTATION", "true"),
-        enable_image_annotation=parse_bool_env("INGEST_ENABLE_IMAGE_ANNOTATION", "true"),
-        asset_output_dir=os.environ.get("INGEST_ASSET_OUTPUT_DIR", "data/ingestion-assets"),
-    )
 
-    return IngestionConfig(
-        postgres=postgres,
-        preprocess=preprocess,
-    )
+# 같은 프로세스에서 main()이 반복 실행되어도 파서는 한 번만 구성한다.
+_PARSER = _build_parser()
 
 
-def load_factory(spec: str):
-    if ":" not in spec:
-        raise RuntimeError("--llm-factory 형식은 module:function 이어야 합니다")
-    module_name, function_name = spec.split(":", 1)
-    module = importlib.import_module(module_name)
-    return getattr(module, function_name)
+def parse_args() -> argparse.Namespace:
+    return _PARSER.parse_args()
+
+
+def build_config(env: Mapping[str, str]) -> IngestionConfig:
+    postgres = {
+        "host": env["POSTGRES_HOST"],
+        "port": int(env["POSTGRES_PORT"]),
+        "user": env["POSTGRES_USER"],
+        "password": env["POSTGRES_PASSWORD"],
+        "database": env["POSTGRES_DATABASE"],
+        "summary_table": env["VTREE_SUMMARY_TABLE"],
+        "page_table": env["VTREE_PAGE_TABLE"],
+        "embedding_dim": int(env["VTREE_EMBEDDING_DIM"]),
+        "pool_min": int(env["POSTGRES_POOL_MIN"]),
+        "pool_max": int(env["POSTGRES_POOL_MAX"]),
+        "connect_timeout_ms": int(env["POSTGRES_CONNECT_TIMEOUT_MS"]),
+        "statement_timeout_ms": int(env["POSTGRES_STATEMENT_TIMEOUT_MS"]),
+    }
+
+    preprocess = {
+        "max_chunk_chars": int(env.get("INGEST_MAX_CHUNK_CHARS", "1024")),
+        "sample_per_extension": parse_bool_env(env, "INGEST_SAMPLE_PER_EXTENSION", "false"),
+        "enable_table_annotation": parse_bool_env(env, "INGEST_ENABLE_TABLE_ANNOTATION", "true"),
+        "enable_image_annotation": parse_bool_env(env, "INGEST_ENABLE_IMAGE_ANNOTATION", "true"),
+        "annotation_concurrency": int(env.get("INGEST_ANNOTATION_CONCURRENCY", "8")),
+        "max_parallel_files": int(env.get("INGEST_MAX_PARALLEL_FILES", "4")),
+        "max_image_edge": int(env.get("INGEST_MAX_IMAGE_EDGE", "1536")),
+        "lossless_images": parse_bool_env(env, "INGEST_LOSSLESS_IMAGES", "false"),
+        "asset_output_dir": env.get("INGEST_ASSET_OUTPUT_DIR", "data/ingestion-assets"),
+    }
+
+    data = {
+        "postgres": postgres,
+        "preprocess": preprocess,
+    }
+    return INGESTION_CONFIG_ADAPTER.validate_python(data)
 
 
 async def main() -> int:
     args = parse_args()
     repo_root = Path(__file__).resolve().parents[1]
     load_env_file(repo_root / args.env_file)
-    ensure_required_env()
+    # os.environ 프록시 조회를 반복하지 않도록 환경 변수를 한 번만 dict로 복사해 읽는다.
+    env = dict(os.environ)
+    ensure_required_env(REQUIRED_ENV_KEYS, env)
 
-    config = build_config()
-    summary_embedding = parse_embedding(
-        raw=args.summary_embedding,
-        expected_dim=config.postgres.embedding_dim,
-    )
+    config = build_config(env)
 
     annotation_enabled = (
         config.preprocess.enable_table_annotation or config.preprocess.enable_image_annotation
     )
-    llm = None
+    llm_task: asyncio.Task | None = None
     if annotation_enabled:
         if not args.llm_factory:
             raise RuntimeError(
                 "표/이미지 주석이 활성화되어 있어 --llm-factory가 필요합니다"
             )
-        factory = load_factory(args.llm_factory)
-        llm = factory()
+        # LLM 클라이언트 초기화는 스레드에서 먼저 시작해 임베딩 파싱과 겹치게 한다.
+        llm_task = asyncio.create_task(asyncio.to_thread(create_llm, args.llm_factory))
+
+    try:
+        # 파싱도 스레드에서 수행해 이벤트 루프가 LLM 초기화 태스크를 실제로 시작하게 한다.
+        summary_embedding = await asyncio.to_thread(
+            parse_embedding,
+            raw=args.summary_embedding,
+            expected_dim=config.postgres.embedding_dim,
+            option_name="--summary-embedding",
+        )
+    except BaseException:
+        if llm_task is not None:
+            llm_task.cancel()
+            await asyncio.gather(llm_task, return_exceptions=True)
+        raise
+    llm = None if llm_task is None else await llm_task
 
     summary_node = IngestionSummaryNode(
         node_id=args.summary_node_id,
@@ -209,13 +195,14 @@ async def main() -> int:
         sample=args.sample,
     )
 
-    print("[ingestion-result]", result.model_dump_json(ensure_ascii=False))
+    emit_model("[ingestion-result]", result)
     return 0
 
 
 if __name__ == "__main__":
     try:
-        raise SystemExit(asyncio.run(main()))
+        with asyncio.Runner(loop_factory=resolve_loop_factory()) as runner:
+            raise SystemExit(runner.run(main()))
     except Exception as exc:  # noqa: BLE001
         print(f"[error] {exc}", file=sys.stderr)
         raise SystemExit(1)
@@ -5,12 +5,15 @@
 설명:
 - 라이브러리 본체는 환경 파일을 직접 읽지 않는다.
 - 이 스크립트는 검색 잡 제출 -> 워커 1회 실행 -> 결과 조회 흐름을 데모한다.
+- `--serve`를 주면 제출 없이 `run_worker_forever`로 상주 워커를 실행한다. (이벤트 루프 하나로 BLOCK 대기)
 - LLM은 LangChain 객체를 팩토리 함수로 생성해 인자로 주입한다.
+- `uvloop`이 설치되어 있으면 이벤트 루프로 사용한다. (선택 의존성 `vtree-search[uvloop]`, 미설치 시 기본 asyncio 루프)
 
 디자인 패턴:
 - 드라이버(Driver Script).
 
 참조:
+- scripts/_driver.py
 - src_py/vtree_search/config/models.py
 - src_py/vtree_search/search/engine.py
 """
@@ -19,14 +22,24 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import importlib
 import os
 import sys
+from collections.abc import Mapping
 from pathlib import Path
 
-from vtree_search import PostgresConfig, RedisQueueConfig, SearchConfig, VTreeSearchEngine
-
-REQUIRED_ENV_KEYS = [
+from _driver import (
+    create_llm,
+    emit_model,
+    ensure_required_env,
+    load_env_file,
+    parse_bool_env,
+    parse_embedding,
+    resolve_loop_factory,
+)
+from vtree_search import SearchConfig, VTreeSearchEngine
+from vtree_search.config import SEARCH_CONFIG_ADAPTER
+
+REQUIRED_ENV_KEYS = (
     "POSTGRES_HOST",
     "POSTGRES_PORT",
     "POSTGRES_USER",
@@ -53,16 +66,20 @@ REQUIRED_ENV_KEYS = [
     "JOB_MAX_RETRIES",
     "JOB_RETRY_BASE_MS",
     "JOB_RETRY_MAX_MS",
-]
+)
 
 
-def parse_args() -> argparse.Namespace:
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Vtree Search 드라이버")
-    parser.add_argument("--query", required=True, help="검색 질의 텍스트")
+    parser.add_argument("--query", help="검색 질의 텍스트 (`--serve`가 아니면 필수)")
     parser.add_argument(
         "--embedding",
-        required=True,
-        help="콤마로 구분된 임베딩 벡터 (예: 0.1,0.2,0.3)",
+        help="콤마로 구분된 임베딩 벡터 (예: 0.1,0.2,0.3, `--serve`가 아니면 필수)",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="잡을 제출하지 않고 상주 워커(run_worker_forever)로 큐를 계속 처리",
     )
     parser.add_argument("--top-k", type=int, default=5, help="최종 후보 개수")
     parser.add_argument("--worker", default="run-search-worker", help="워커 이름")
@@ -76,144 +93,124 @@ def parse_args() -> argparse.Namespace:
         default=".env",
         help="루트 기준 환경 파일 경로 (기본: .env)",
     )
-    return parser.parse_args()
-
-
-def load_env_file(path: Path) -> None:
-    if not path.exists():
-        raise RuntimeError(f"환경 파일이 존재하지 않습니다: {path}")
+    return parser
 
-    for raw_line in path.read_text(encoding="utf-8").splitlines():
-        line = raw_line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "=" not in line:
-            continue
 
-        key, value = line.split("=", 1)
-        key = key.strip()
-        value = value.strip().strip('"').strip("'")
-        os.environ[key] = value
+# 같은 프로세스에서 main()이 반복 실행되어도 파서는 한 번만 구성한다.
+_PARSER = _build_parser()
 
 
-def ensure_required_env() -> None:
-    missing = [key for key in REQUIRED_ENV_KEYS if not os.environ.get(key)]
-    if missing:
-        raise RuntimeError(f"필수 환경 변수가 누락되었습니다: {', '.join(missing)}")
-
-
-def parse_embedding(raw: str, expected_dim: int) -> list[float]:
-    values = [float(token.strip()) for token in raw.split(",") if token.strip()]
-    if len(values) != expected_dim:
-        raise RuntimeError(
-            "--embedding 길이가 VTREE_EMBEDDING_DIM과 일치하지 않습니다: "
-            f"expected={expected_dim}, actual={len(values)}"
-        )
-    return values
-
-
-def build_config() -> SearchConfig:
-    postgres = PostgresConfig(
-        host=os.environ["POSTGRES_HOST"],
-        port=int(os.environ["POSTGRES_PORT"]),
-        user=os.environ["POSTGRES_USER"],
-        password=os.environ["POSTGRES_PASSWORD"],
-        database=os.environ["POSTGRES_DATABASE"],
-        summary_table=os.environ["VTREE_SUMMARY_TABLE"],
-        page_table=os.environ["VTREE_PAGE_TABLE"],
-        embedding_dim=int(os.environ["VTREE_EMBEDDING_DIM"]),
-        pool_min=int(os.environ["POSTGRES_POOL_MIN"]),
-        pool_max=int(os.environ["POSTGRES_POOL_MAX"]),
-        connect_timeout_ms=int(os.environ["POSTGRES_CONNECT_TIMEOUT_MS"]),
-        statement_timeout_ms=int(os.environ["POSTGRES_STATEMENT_TIMEOUT_MS"]),
-    )
-
-    redis = RedisQueueConfig(
-        host=os.environ["REDIS_HOST"],
-        port=int(os.environ["REDIS_PORT"]),
-        db=int(os.environ["REDIS_DB"]),
-        username=os.environ.get("REDIS_USERNAME") or None,
-        password=os.environ.get("REDIS_PASSWORD") or None,
-        use_ssl=parse_bool_env("REDIS_USE_SSL", "false"),
-        module_name_search=os.environ.get("REDIS_MODULE_SEARCH", "VtreeSearch"),
-        module_name_ingestion=os.environ.get("REDIS_MODULE_INGESTION", "VtreeIngestor"),
-        stream_search=os.environ["REDIS_STREAM_SEARCH"],
-        stream_search_dlq=os.environ["REDIS_STREAM_SEARCH_DLQ"],
-        consumer_group=os.environ["REDIS_CONSUMER_GROUP"],
-        queue_max_len=int(os.environ["QUEUE_MAX_LEN"]),
-        queue_reject_at=int(os.environ["QUEUE_REJECT_AT"]),
-        result_ttl_sec=int(os.environ["JOB_RESULT_TTL_SEC"]),
-        worker_block_ms=int(os.environ["WORKER_BLOCK_MS"]),
-    )
-
-    return SearchConfig(
-        postgres=postgres,
-        redis=redis,
-        worker_concurrency=int(os.environ["WORKER_CONCURRENCY"]),
-        max_retries=int(os.environ["JOB_MAX_RETRIES"]),
-        retry_base_ms=int(os.environ["JOB_RETRY_BASE_MS"]),
-        retry_max_ms=int(os.environ["JOB_RETRY_MAX_MS"]),
-    )
-
-
-def parse_bool_env(key: str, default: str) -> bool:
-    raw = os.environ.get(key, default).strip().lower()
-    if raw in {"1", "true", "yes", "y"}:
-        return True
-    if raw in {"0", "false", "no", "n"}:
-        return False
-    raise RuntimeError(f"불리언 환경 변수 형식이 잘못되었습니다: {key}={raw}")
-
-
-def load_factory(spec: str):
-    if ":" not in spec:
-        raise RuntimeError("--llm-factory 형식은 module:function 이어야 합니다")
-    module_name, function_name = spec.split(":", 1)
-    module = importlib.import_module(module_name)
-    return getattr(module, function_name)
+def parse_args() -> argparse.Namespace:
+    args = _PARSER.parse_args()
+    if not args.serve and (args.query is None or args.embedding is None):
+        _PARSER.error("--serve 없이 실행하려면 --query와 --embedding이 필요합니다")
+    return args
+
+
+def build_config(env: Mapping[str, str]) -> SearchConfig:
+    postgres = {
+        "host": env["POSTGRES_HOST"],
+        "port": int(env["POSTGRES_PORT"]),
+        "user": env["POSTGRES_USER"],
+        "password": env["POSTGRES_PASSWORD"],
+        "database": env["POSTGRES_DATABASE"],
+        "summary_table": env["VTREE_SUMMARY_TABLE"],
+        "page_table": env["VTREE_PAGE_TABLE"],
+        "embedding_dim": int(env["VTREE_EMBEDDING_DIM"]),
+        "pool_min": int(env["POSTGRES_POOL_MIN"]),
+        "pool_max": int(env["POSTGRES_POOL_MAX"]),
+        "connect_timeout_ms": int(env["POSTGRES_CONNECT_TIMEOUT_MS"]),
+        "statement_timeout_ms": int(env["POSTGRES_STATEMENT_TIMEOUT_MS"]),
+    }
+
+    redis = {
+        "host": env["REDIS_HOST"],
+        "port": int(env["REDIS_PORT"]),
+        "db": int(env["REDIS_DB"]),
+        "username": env.get("REDIS_USERNAME") or None,
+        "password": env.get("REDIS_PASSWORD") or None,
+        "use_ssl": parse_bool_env(env, "REDIS_USE_SSL", "false"),
+        "module_name_search": env.get("REDIS_MODULE_SEARCH", "VtreeSearch"),
+        "module_name_ingestion": env.get("REDIS_MODULE_INGESTION", "VtreeIngestor"),
+        "stream_search": env["REDIS_STREAM_SEARCH"],
+        "stream_search_dlq": env["REDIS_STREAM_SEARCH_DLQ"],
+        "stream_search_delayed": env.get("REDIS_STREAM_SEARCH_DELAYED", "search:jobs:delayed"),
+        "consumer_group": env["REDIS_CONSUMER_GROUP"],
+        "queue_max_len": int(env["QUEUE_MAX_LEN"]),
+        "queue_reject_at": int(env["QUEUE_REJECT_AT"]),
+        "result_ttl_sec": int(env["JOB_RESULT_TTL_SEC"]),
+        "worker_block_ms": int(env["WORKER_BLOCK_MS"]),
+        "worker_block_max_ms": int(env.get("WORKER_BLOCK_MAX_MS", "10000")),
+        "claim_idle_ms": int(env.get("WORKER_CLAIM_IDLE_MS", "60000")),
+        "result_compress_min_bytes": int(env.get("JOB_RESULT_COMPRESS_MIN_BYTES", "0")),
+        "pool_max": int(env.get("REDIS_POOL_MAX", "16")),
+    }
+
+    data = {
+        "postgres": postgres,
+        "redis": redis,
+        "worker_concurrency": int(env["WORKER_CONCURRENCY"]),
+        "worker_batch_size": int(env.get("WORKER_BATCH_SIZE", "16")),
+        "llm_filter_enabled": parse_bool_env(env, "SEARCH_LLM_FILTER_ENABLED", "true"),
+        "query_quantization": env.get("SEARCH_QUERY_QUANTIZATION", "fp32"),
+        "max_retries": int(env["JOB_MAX_RETRIES"]),
+        "retry_base_ms": int(env["JOB_RETRY_BASE_MS"]),
+        "retry_max_ms": int(env["JOB_RETRY_MAX_MS"]),
+    }
+    return SEARCH_CONFIG_ADAPTER.validate_python(data)
 
 
 async def main() -> int:
     args = parse_args()
     repo_root = Path(__file__).resolve().parents[1]
     load_env_file(repo_root / args.env_file)
-    ensure_required_env()
+    # os.environ 프록시 조회를 반복하지 않도록 환경 변수를 한 번만 dict로 복사해 읽는다.
+    env = dict(os.environ)
+    ensure_required_env(REQUIRED_ENV_KEYS, env)
 
-    config = build_config()
-    embedding = parse_embedding(args.embedding, config.postgres.embedding_dim)
+    config = build_config(env)
+    llm = create_llm(args.llm_factory)
+    engine = VTreeSearchEngine(config=config, llm=llm)
 
-    factory = load_factory(args.llm_factory)
-    llm = factory()
+    try:
+        if args.serve:
+            print(f"[worker] serving worker={args.worker}")
+            await engine.run_worker_forever(worker_name=args.worker)
+            return 0
 
-    engine = VTreeSearchEngine(config=config, llm=llm)
+        embedding = parse_embedding(args.embedding, config.postgres.embedding_dim)
 
-    accepted = engine.submit_search(
-        query_text=args.query,
-        query_embedding=embedding,
-        top_k=args.top_k,
-    )
-    print("[submit]", accepted.model_dump_json(ensure_ascii=False))
+        accepted = engine.submit_search(
+            query_text=args.query,
+            query_embedding=embedding,
+            top_k=args.top_k,
+        )
+        emit_model("[submit]", accepted)
 
-    processed = await engine.run_worker_once(worker_name=args.worker, max_items=1)
-    print(f"[worker] processed={processed}")
+        processed = await engine.run_worker_once(worker_name=args.worker, max_items=1)
+        print(f"[worker] processed={processed}")
 
-    status = engine.get_job(accepted.job_id)
-    print("[status]", status.model_dump_json(ensure_ascii=False))
+        status = engine.get_job(accepted.job_id)
+        emit_model("[status]", status)
 
-    if status.state == "SUCCEEDED":
-        result = engine.fetch_result(accepted.job_id)
-        print("[result]", result.model_dump_json(ensure_ascii=False))
-    elif status.state == "FAILED":
-        raise RuntimeError(status.last_error or "검색 작업이 실패했습니다")
-    else:
-        print("[notice] 아직 결과가 준비되지 않았습니다")
+        if status.state == "SUCCEEDED":
+            result = engine.fetch_result(accepted.job_id)
+            emit_model("[result]", result)
+        elif status.state == "FAILED":
+            raise RuntimeError(status.last_error or "검색 작업이 실패했습니다")
+        else:
+            print("[notice] 아직 결과가 준비되지 않았습니다")
 
-    return 0
+        return 0
+    finally:
+        # 워커 큐 커넥션은 이 이벤트 루프에 묶여 있으므로 루프가 닫히기 전에 스레드 풀과 함께 정리한다.
+        await engine.aclose()
 
 
 if __name__ == "__main__":
     try:
-        raise SystemExit(asyncio.run(main()))
+        with asyncio.Runner(loop_factory=resolve_loop_factory()) as runner:
+            raise SystemExit(runner.run(main()))
     except Exception as exc:  # noqa: BLE001
         print(f"[error] {exc}", file=sys.stderr)
         raise SystemExit(1)
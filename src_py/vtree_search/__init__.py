@@ -5,6 +5,7 @@
 설명:
 - 라이브러리 핵심 클래스는 `VtreeIngestor`, `VTreeSearchEngine` 두 가지다.
 - 설정/인터페이스/예외/LLM 어댑터를 함께 노출한다.
+- 엔진/적재기/LangChain 어댑터는 첫 접근 시점에 지연 import 해 패키지 import 비용을 줄인다.
 
 디자인 패턴:
 - 퍼사드(Facade).
@@ -14,6 +15,11 @@
 - src_py/vtree_search/search/engine.py
 """
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .config.models import (
     IngestionConfig,
     IngestionPreprocessConfig,
@@ -45,16 +51,42 @@ from .exceptions import (
     QueueOverloadedError,
     VtreeSearchError,
 )
-from .ingestion.ingestor import VtreeIngestor
-from .llm import (
-    LangChainIngestionAnnotationLLM,
-    LangChainSearchFilterLLM,
-    SearchFilterCandidate,
-    SearchFilterDecision,
-)
-from .search.engine import VTreeSearchEngine
+from .llm.contracts import SearchFilterCandidate, SearchFilterDecision
 from .version import __version__
 
+if TYPE_CHECKING:
+    from .ingestion.ingestor import VtreeIngestor
+    from .llm.langchain_ingestion import LangChainIngestionAnnotationLLM
+    from .llm.langchain_search import LangChainSearchFilterLLM
+    from .search.engine import VTreeSearchEngine
+
+# 공개 이름 -> (모듈 경로, 속성명). LangChain/파서 의존성을 끌어오는 클래스만 지연 로딩한다.
+_LAZY_ATTRS: dict[str, tuple[str, str]] = {
+    "VtreeIngestor": ("vtree_search.ingestion.ingestor", "VtreeIngestor"),
+    "VTreeSearchEngine": ("vtree_search.search.engine", "VTreeSearchEngine"),
+    "LangChainIngestionAnnotationLLM": (
+        "vtree_search.llm.langchain_ingestion",
+        "LangChainIngestionAnnotationLLM",
+    ),
+    "LangChainSearchFilterLLM": ("vtree_search.llm.langchain_search", "LangChainSearchFilterLLM"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    target = _LAZY_ATTRS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr_name = target
+    value = getattr(importlib.import_module(module_name), attr_name)
+    # 이후 접근은 모듈 전역에서 바로 찾도록 캐시한다.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
 __all__ = [
     "__version__",
     "VTreeSearchEngine",
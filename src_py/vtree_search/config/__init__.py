@@ -13,6 +13,8 @@
 """
 
 from .models import (
+    INGESTION_CONFIG_ADAPTER,
+    SEARCH_CONFIG_ADAPTER,
     IngestionConfig,
     IngestionPreprocessConfig,
     PostgresConfig,
@@ -26,4 +28,6 @@ __all__ = [
     "SearchConfig",
     "IngestionPreprocessConfig",
     "IngestionConfig",
+    "SEARCH_CONFIG_ADAPTER",
+    "INGESTION_CONFIG_ADAPTER",
 ]
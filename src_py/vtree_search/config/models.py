@@ -5,6 +5,7 @@
 설명:
 - Postgres/Redis/워커 제어 값을 단일 모델로 관리한다.
 - LLM은 설정 파일이 아닌 Python 인자 주입으로 전달한다.
+- 최상위 설정은 모듈 로드 시 만든 `TypeAdapter`로 dict를 바로 검증할 수 있다.
 
 디자인 패턴:
 - 값 객체(Value Object).
@@ -17,12 +18,37 @@
 
 from __future__ import annotations
 
+import re
+from typing import Any, Literal, Self
 from urllib.parse import quote
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    field_validator,
+    model_validator,
+)
 
+_POOL_RANGE_ERROR = "pool_max는 pool_min 이상이어야 합니다"
+_REJECT_THRESHOLD_ERROR = "queue_reject_at은 queue_max_len 이하이어야 합니다"
+_RETRY_WINDOW_ERROR = "retry_max_ms는 retry_base_ms 이상이어야 합니다"
+_BLOCK_WINDOW_ERROR = "worker_block_max_ms는 worker_block_ms 이상이어야 합니다"
+# 질의 벡터의 큐 전송 형식. fp32는 원본 그대로, fp16/int8은 Rust에서 f32로 복원한다.
+QueryQuantization = Literal["fp32", "fp16", "int8"]
+# `quote(..., safe="")`가 그대로 두는 문자만으로 이뤄진 값(빈 문자열 포함)은 인코딩을 건너뛴다.
+_DSN_UNRESERVED_RE = re.compile(r"[A-Za-z0-9_.~-]*")
 
-class PostgresConfig(BaseModel):
+
+class _ConfigModel(BaseModel):
+    """설정 모델 공통 베이스."""
+
+    # 검증 스키마는 import 시점이 아니라 첫 검증/생성 시점에 만든다.
+    model_config = ConfigDict(defer_build=True)
+
+
+class PostgresConfig(_ConfigModel):
     """Postgres 연결 및 테이블 설정 모델."""
 
     host: str = Field(min_length=1)
@@ -43,19 +69,40 @@ class PostgresConfig(BaseModel):
     def validate_pool_max(cls, value: int, info) -> int:
         pool_min = info.data.get("pool_min", 1)
         if value < pool_min:
-            raise ValueError("pool_max는 pool_min 이상이어야 합니다")
+            raise ValueError(_POOL_RANGE_ERROR)
         return value
 
     def to_dsn(self) -> str:
         """Rust 계층 전달용 Postgres DSN을 생성한다."""
-        user = quote(self.user, safe="")
-        password = quote(self.password, safe="")
+        user = _quote_dsn_part(self.user)
+        password = _quote_dsn_part(self.password)
         host = self.host.strip()
-        database = quote(self.database, safe="")
+        database = _quote_dsn_part(self.database)
         return f"postgresql://{user}:{password}@{host}:{self.port}/{database}"
 
+    def to_bridge_payload(self) -> dict[str, Any]:
+        """Rust 브릿지 요청의 `postgres` 항목을 생성한다.
+
+        설정은 실행 중 바뀌지 않으므로 호출자는 생성 시 한 번 만들어 재사용한다.
+        """
+        return {
+            "dsn": self.to_dsn(),
+            "summary_table": self.summary_table,
+            "page_table": self.page_table,
+            "pool_min": self.pool_min,
+            "pool_max": self.pool_max,
+            "connect_timeout_ms": self.connect_timeout_ms,
+            "statement_timeout_ms": self.statement_timeout_ms,
+        }
+
 
-class RedisQueueConfig(BaseModel):
+def _quote_dsn_part(value: str) -> str:
+    if _DSN_UNRESERVED_RE.fullmatch(value):
+        return value
+    return quote(value, safe="")
+
+
+class RedisQueueConfig(_ConfigModel):
     """Redis Streams 큐 제어 설정 모델."""
 
     host: str = Field(min_length=1)
@@ -68,54 +115,78 @@ class RedisQueueConfig(BaseModel):
     module_name_ingestion: str = Field(default="VtreeIngestor", min_length=1)
     stream_search: str = Field(default="search:jobs", min_length=1)
     stream_search_dlq: str = Field(default="search:jobs:dlq", min_length=1)
+    stream_search_delayed: str = Field(default="search:jobs:delayed", min_length=1)
     consumer_group: str = Field(default="vtree-search-group", min_length=1)
     queue_max_len: int = Field(default=200, ge=1)
     queue_reject_at: int = Field(default=180, ge=1)
     result_ttl_sec: int = Field(default=900, ge=1)
     worker_block_ms: int = Field(default=1_000, ge=1)
+    worker_block_max_ms: int = Field(default=10_000, ge=1)
+    claim_idle_ms: int = Field(default=60_000, ge=0)
+    result_compress_min_bytes: int = Field(default=0, ge=0)
+    pool_max: int = Field(default=16, ge=1)
 
     @field_validator("queue_reject_at")
     @classmethod
     def validate_reject_threshold(cls, value: int, info) -> int:
         queue_max_len = info.data.get("queue_max_len", 200)
         if value > queue_max_len:
-            raise ValueError("queue_reject_at은 queue_max_len 이하이어야 합니다")
+            raise ValueError(_REJECT_THRESHOLD_ERROR)
         return value
 
+    @model_validator(mode="after")
+    def validate_block_window(self) -> Self:
+        # 두 값 중 하나만 지정되고 나머지가 기본값이어도 검사하도록 모델 단위로 확인한다.
+        if self.worker_block_max_ms < self.worker_block_ms:
+            raise ValueError(_BLOCK_WINDOW_ERROR)
+        return self
 
-class SearchConfig(BaseModel):
+
+class SearchConfig(_ConfigModel):
     """검색 엔진 설정 모델."""
 
     postgres: PostgresConfig
     redis: RedisQueueConfig
     worker_concurrency: int = Field(default=4, ge=1)
+    worker_batch_size: int = Field(default=16, ge=1)
     max_retries: int = Field(default=3, ge=0)
     retry_base_ms: int = Field(default=200, ge=1)
     retry_max_ms: int = Field(default=2_000, ge=1)
     entry_limit: int = Field(default=3, ge=1)
     page_limit: int = Field(default=50, ge=1)
+    llm_filter_enabled: bool = True
+    query_quantization: QueryQuantization = "fp32"
 
     @field_validator("retry_max_ms")
     @classmethod
     def validate_retry_window(cls, value: int, info) -> int:
         retry_base_ms = info.data.get("retry_base_ms", 200)
         if value < retry_base_ms:
-            raise ValueError("retry_max_ms는 retry_base_ms 이상이어야 합니다")
+            raise ValueError(_RETRY_WINDOW_ERROR)
         return value
 
 
-class IngestionPreprocessConfig(BaseModel):
+class IngestionPreprocessConfig(_ConfigModel):
     """파일 전처리/청킹 설정 모델."""
 
     max_chunk_chars: int = Field(default=1_024, ge=256)
     sample_per_extension: bool = Field(default=False)
     enable_table_annotation: bool = Field(default=True)
     enable_image_annotation: bool = Field(default=True)
+    annotation_concurrency: int = Field(default=8, ge=1)
+    max_parallel_files: int = Field(default=4, ge=1)
+    max_image_edge: int = Field(default=1_536, ge=256)
+    lossless_images: bool = Field(default=False)
     asset_output_dir: str = Field(default="data/ingestion-assets", min_length=1)
 
 
-class IngestionConfig(BaseModel):
+class IngestionConfig(_ConfigModel):
     """적재 엔진 설정 모델."""
 
     postgres: PostgresConfig
     preprocess: IngestionPreprocessConfig = Field(default_factory=IngestionPreprocessConfig)
+
+
+# dict 입력을 생성자 경유 없이 바로 검증하도록 최상위 설정 어댑터를 한 번만 만든다.
+SEARCH_CONFIG_ADAPTER: TypeAdapter[SearchConfig] = TypeAdapter(SearchConfig)
+INGESTION_CONFIG_ADAPTER: TypeAdapter[IngestionConfig] = TypeAdapter(IngestionConfig)
@@ -4,6 +4,7 @@
 
 설명:
 - summary/page 노드 업서트 인터페이스을 명시해 Rust 적재 브릿지와 동기화한다.
+- summary 임베딩은 `list[float]` 또는 float32 원시 바이트로 받을 수 있다.
 
 디자인 패턴:
 - DTO(Data Transfer Object).
@@ -16,6 +17,8 @@ from __future__ import annotations
 
 from pydantic import BaseModel, Field
 
+from vtree_search.contracts.vector_types import EmbeddingVector
+
 
 class IngestionSummaryNode(BaseModel):
     """summary 노드 적재 모델."""
@@ -24,7 +27,7 @@ class IngestionSummaryNode(BaseModel):
     document_id: str = Field(min_length=1)
     path: str = Field(min_length=1)
     summary_text: str = Field(min_length=1)
-    embedding: list[float] = Field(min_length=1)
+    embedding: EmbeddingVector = Field(min_length=1)
     metadata: dict[str, object] | None = Field(default=None)
 
 
@@ -4,6 +4,7 @@
 
 설명:
 - 검색 제출 시 필요한 질의/벡터/옵션 정보를 명시적으로 검증한다.
+- 질의 임베딩은 `list[float]`, 1차원 배열, float32 원시 바이트로 받아 float32 little-endian 바이트로 보관한다.
 
 디자인 패턴:
 - DTO(Data Transfer Object).
@@ -16,12 +17,14 @@ from __future__ import annotations
 
 from pydantic import BaseModel, Field
 
+from vtree_search.contracts.vector_types import Float32EmbeddingBytes
+
 
 class SearchSubmission(BaseModel):
     """검색 큐 제출 모델."""
 
     job_id: str = Field(min_length=1)
     query_text: str = Field(min_length=1)
-    query_embedding: list[float] = Field(min_length=1)
+    query_embedding: Float32EmbeddingBytes = Field(min_length=4)
     top_k: int = Field(default=5, ge=1)
     metadata: dict[str, object] | None = Field(default=None)
@@ -0,0 +1,126 @@
+"""
+목적:
+- 임베딩 벡터 입력 타입과 디코딩 유틸을 정의한다.
+
+설명:
+- 임베딩은 `list[float]`, 1차원 `numpy.ndarray`, `array.array`,
+  또는 float32 little-endian 원시 바이트(`bytes`/`memoryview`)로 받을 수 있다.
+- 배열/바이트 입력은 인터페이스 경계에서 C 수준 변환으로 한 번만 디코딩하고, 이후 계층은 `list[float]`만 다룬다.
+- 검색 질의처럼 Rust로 그대로 넘기는 벡터는 `list[float]`를 거치지 않고 float32 little-endian 바이트로 정규화한다.
+- 전송량을 더 줄여야 하면 float32 바이트를 fp16 또는 대칭 int8(벡터당 scale 1개)로 양자화한다.
+
+디자인 패턴:
+- 값 객체 타입 별칭(Annotated Type Alias).
+
+참조:
+- src_py/vtree_search/contracts/ingestion_models.py
+- src_py/vtree_search/contracts/search_models.py
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Annotated
+
+import numpy as np
+from pydantic import BeforeValidator
+
+_FLOAT32_LE = np.dtype("<f4")
+_FLOAT16_LE = np.dtype("<f2")
+
+EmbeddingInput = list[float] | np.ndarray | array | bytes | bytearray | memoryview
+
+
+def embedding_length(value: EmbeddingInput) -> int:
+    """임베딩 입력의 차원 수를 반환한다.
+
+    Raises:
+        ValueError: 배열이 1차원이 아니거나, 바이트 길이가 float32 크기(4바이트)의 배수가 아닌 경우.
+    """
+    if isinstance(value, np.ndarray):
+        if value.ndim != 1:
+            raise ValueError(f"임베딩 배열은 1차원이어야 합니다: ndim={value.ndim}")
+        return value.size
+    if isinstance(value, array):
+        return len(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        size = memoryview(value).nbytes
+        if size % _FLOAT32_LE.itemsize:
+            raise ValueError(f"float32 임베딩 바이트 길이는 4의 배수여야 합니다: {size}")
+        return size // _FLOAT32_LE.itemsize
+    return len(value)
+
+
+def decode_embedding(value: object) -> object:
+    """배열/float32 원시 바이트 임베딩을 `list[float]`로 디코딩한다. 그 외 입력은 그대로 둔다."""
+    if isinstance(value, (np.ndarray, array)):
+        embedding_length(value)
+        # 이미 부동소수 배열이면 float64 중간 배열을 만들지 않고 바로 Python float 목록으로 꺼낸다.
+        if _is_float_array(value):
+            return value.tolist()
+        return np.asarray(value, dtype=np.float64).tolist()
+    if not isinstance(value, (bytes, bytearray, memoryview)):
+        return value
+    embedding_length(value)
+    return np.frombuffer(value, dtype=_FLOAT32_LE).tolist()
+
+
+def encode_embedding_f32(value: object) -> object:
+    """임베딩 입력을 연속된 float32 little-endian 바이트로 정규화한다. 이미 바이트면 복사 없이 검증만 한다."""
+    if isinstance(value, bytes):
+        embedding_length(value)
+        return value
+    if isinstance(value, (bytearray, memoryview)):
+        embedding_length(value)
+        return bytes(value)
+    if isinstance(value, np.ndarray) and value.dtype == _FLOAT32_LE and value.flags.c_contiguous:
+        # 이미 연속된 float32 LE 배열이면 변환 없이 버퍼를 한 번만 복사한다.
+        embedding_length(value)
+        return value.tobytes()
+    if isinstance(value, (np.ndarray, array, list, tuple)):
+        # 중첩 리스트가 다차원 배열로 바뀌어 조용히 평탄화되지 않도록 변환 결과의 차원을 확인한다.
+        converted = np.ascontiguousarray(value, dtype=_FLOAT32_LE)
+        embedding_length(converted)
+        return converted.tobytes()
+    return value
+
+
+def quantize_embedding_f32(data: bytes, dtype: str) -> tuple[bytes, float]:
+    """float32 LE 임베딩 바이트를 `dtype`(fp32/fp16/int8) 바이트와 역양자화 scale로 변환한다.
+
+    int8은 최대 절댓값을 127에 맞추는 대칭 양자화이며, fp32/fp16의 scale은 1.0이다.
+
+    Raises:
+        ValueError: 지원하지 않는 dtype인 경우.
+    """
+    if dtype == "fp32":
+        return data, 1.0
+    vector = np.frombuffer(data, dtype=_FLOAT32_LE)
+    if dtype == "fp16":
+        return vector.astype(_FLOAT16_LE).tobytes(), 1.0
+    if dtype == "int8":
+        peak = float(np.max(np.abs(vector))) if vector.size else 0.0
+        scale = peak / 127.0 if peak > 0.0 else 1.0
+        quantized = np.clip(np.rint(vector / scale), -127, 127).astype(np.int8)
+        return quantized.tobytes(), scale
+    raise ValueError(f"지원하지 않는 양자화 형식입니다: {dtype}")
+
+
+def _is_float_array(value: np.ndarray | array) -> bool:
+    if isinstance(value, np.ndarray):
+        return value.dtype.kind == "f"
+    return value.typecode in "fd"
+
+
+EmbeddingVector = Annotated[list[float], BeforeValidator(decode_embedding)]
+Float32EmbeddingBytes = Annotated[bytes, BeforeValidator(encode_embedding_f32)]
+
+__all__ = [
+    "EmbeddingInput",
+    "EmbeddingVector",
+    "Float32EmbeddingBytes",
+    "decode_embedding",
+    "embedding_length",
+    "encode_embedding_f32",
+    "quantize_embedding_f32",
+]
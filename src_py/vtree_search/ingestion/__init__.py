@@ -4,6 +4,8 @@
 
 설명:
 - 외부에는 `VtreeIngestor`를 기본 진입점으로 제공한다.
+- 공개 심볼은 첫 접근 시점에 지연 import 해, `ingestion.prompts`만 쓰는 모듈이
+  적재기/파서를 불러오며 순환 import를 만들지 않게 한다.
 
 디자인 패턴:
 - 모듈 퍼사드(Module Facade).
@@ -12,7 +14,33 @@
 - src_py/vtree_search/ingestion/ingestor.py
 """
 
-from .ingestor import VtreeIngestor
-from .source_parser import SourceParser, build_source_parser
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .ingestor import VtreeIngestor
+    from .source_parser import SourceParser, build_source_parser
+
+_LAZY_ATTRS: dict[str, str] = {
+    "VtreeIngestor": "vtree_search.ingestion.ingestor",
+    "SourceParser": "vtree_search.ingestion.source_parser",
+    "build_source_parser": "vtree_search.ingestion.source_parser",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = ["VtreeIngestor", "SourceParser", "build_source_parser"]
@@ -94,13 +94,23 @@ def estimate_docx_paragraph_layout(
     text: str,
     font_size: float,
     usable_width_pt: float,
+    style: object | None = None,
 ) -> dict[str, float | int]:
-    """문단의 A4 레이아웃 추정값(줄수/높이/간격)을 계산한다."""
+    """문단의 A4 레이아웃 추정값(줄수/높이/간격)을 계산한다.
 
-    line_spacing_pt = _resolve_docx_line_spacing_pt(paragraph=paragraph, font_size=font_size)
+    style을 넘기면 문단 스타일 조회(python-docx의 스타일 ID 검색)를 생략하고 그 값을 재사용한다.
+    """
+
+    if style is None:
+        style = getattr(paragraph, "style", None)
+    line_spacing_pt = _resolve_docx_line_spacing_pt(
+        paragraph=paragraph,
+        style=style,
+        font_size=font_size,
+    )
     char_spacing_pt = _extract_docx_char_spacing_pt(paragraph)
-    space_before_pt = _resolve_docx_space_pt(paragraph=paragraph, field_name="space_before")
-    space_after_pt = _resolve_docx_space_pt(paragraph=paragraph, field_name="space_after")
+    space_before_pt = _resolve_docx_space_pt(paragraph=paragraph, style=style, field_name="space_before")
+    space_after_pt = _resolve_docx_space_pt(paragraph=paragraph, style=style, field_name="space_after")
     line_count_estimated = _estimate_wrapped_line_count(
         text=text,
         font_size=font_size,
@@ -195,15 +205,16 @@ def advance_docx_page_state(
     return block_start_page, page_num, used_height
 
 
-def is_docx_page_break_before(paragraph: object) -> bool:
-    """문단의 page-break-before 설정을 확인한다."""
+def is_docx_page_break_before(paragraph: object, style: object | None = None) -> bool:
+    """문단의 page-break-before 설정을 확인한다. style을 넘기면 스타일 조회를 생략한다."""
 
     paragraph_format = getattr(paragraph, "paragraph_format", None)
     current_value = getattr(paragraph_format, "page_break_before", None)
     if current_value is not None:
         return bool(current_value)
 
-    style = getattr(paragraph, "style", None)
+    if style is None:
+        style = getattr(paragraph, "style", None)
     style_format = getattr(style, "paragraph_format", None)
     style_value = getattr(style_format, "page_break_before", None)
     if style_value is None:
@@ -211,7 +222,7 @@ def is_docx_page_break_before(paragraph: object) -> bool:
     return bool(style_value)
 
 
-def _resolve_docx_line_spacing_pt(*, paragraph: object, font_size: float) -> float:
+def _resolve_docx_line_spacing_pt(*, paragraph: object, style: object, font_size: float) -> float:
     """문단 줄간격을 pt 단위로 정규화한다."""
 
     paragraph_format = getattr(paragraph, "paragraph_format", None)
@@ -220,7 +231,6 @@ def _resolve_docx_line_spacing_pt(*, paragraph: object, font_size: float) -> flo
     if resolved is not None:
         return resolved
 
-    style = getattr(paragraph, "style", None)
     style_format = getattr(style, "paragraph_format", None)
     style_spacing = getattr(style_format, "line_spacing", None)
     resolved = _coerce_docx_line_spacing_value_pt(style_spacing, font_size=font_size)
@@ -231,7 +241,7 @@ def _resolve_docx_line_spacing_pt(*, paragraph: object, font_size: float) -> flo
     return max(8.0, float(font_size) * 1.5)
 
 
-def _resolve_docx_space_pt(*, paragraph: object, field_name: str) -> float:
+def _resolve_docx_space_pt(*, paragraph: object, style: object, field_name: str) -> float:
     """문단 전/후 간격(space_before/space_after)을 pt 단위로 추출한다."""
 
     paragraph_format = getattr(paragraph, "paragraph_format", None)
@@ -240,7 +250,6 @@ def _resolve_docx_space_pt(*, paragraph: object, field_name: str) -> float:
     if resolved is not None:
         return max(0.0, float(resolved))
 
-    style = getattr(paragraph, "style", None)
     style_format = getattr(style, "paragraph_format", None)
     style_value = getattr(style_format, field_name, None)
     resolved = _length_to_pt(style_value, default=None)
@@ -21,6 +21,8 @@ import asyncio
 from pathlib import Path
 from typing import Any
 
+from pydantic_core import to_json
+
 from vtree_search.config.models import IngestionConfig
 from vtree_search.contracts.ingestion_models import (
     IngestionDocument,
@@ -28,6 +30,7 @@ from vtree_search.contracts.ingestion_models import (
     IngestionResult,
     IngestionSummaryNode,
 )
+from vtree_search.exceptions import IngestionProcessingError
 from vtree_search.ingestion.source_parser import build_source_parser
 from vtree_search.llm.langchain_ingestion import LangChainIngestionAnnotationLLM
 from vtree_search.runtime.bridge import RustRuntimeBridge
@@ -47,18 +50,18 @@ class VtreeIngestor:
             None if llm is None else LangChainIngestionAnnotationLLM(chat_model=llm)
         )
         self._runtime_bridge = runtime_bridge or RustRuntimeBridge()
+        # DSN 인코딩을 포함한 postgres 요청 항목은 설정이 고정이므로 한 번만 만든다.
+        self._postgres_payload = config.postgres.to_bridge_payload()
 
     async def upsert_document(self, document: IngestionDocument) -> IngestionResult:
         """문서 단위 summary/page 노드를 upsert한다."""
         payload = self._build_ingestion_payload(
             operation="upsert_document",
             document_id=document.document_id,
-            summary_nodes=[node.model_dump() for node in document.summary_nodes],
-            page_nodes=[node.model_dump() for node in document.page_nodes],
+            summary_nodes=document.summary_nodes,
+            page_nodes=document.page_nodes,
         )
-
-        response = await asyncio.to_thread(self._runtime_bridge.execute_ingestion_job, payload)
-        return IngestionResult.model_validate(response)
+        return await self._run_bridge(payload)
 
     async def upsert_pages(self, document_id: str, pages: list[IngestionPageNode]) -> IngestionResult:
         """페이지 노드만 upsert한다."""
@@ -66,11 +69,9 @@ class VtreeIngestor:
             operation="upsert_pages",
             document_id=document_id,
             summary_nodes=[],
-            page_nodes=[node.model_dump() for node in pages],
+            page_nodes=pages,
         )
-
-        response = await asyncio.to_thread(self._runtime_bridge.execute_ingestion_job, payload)
-        return IngestionResult.model_validate(response)
+        return await self._run_bridge(payload)
 
     async def rebuild_summary_embeddings(self, document_id: str) -> IngestionResult:
         """summary 노드 갱신 트리거를 실행한다."""
@@ -80,9 +81,7 @@ class VtreeIngestor:
             summary_nodes=[],
             page_nodes=[],
         )
-
-        response = await asyncio.to_thread(self._runtime_bridge.execute_ingestion_job, payload)
-        return IngestionResult.model_validate(response)
+        return await self._run_bridge(payload)
 
     async def build_page_nodes_from_path(
         self,
@@ -135,25 +134,36 @@ class VtreeIngestor:
         )
         return await self.upsert_document(document)
 
+    async def _run_bridge(self, payload: bytes) -> IngestionResult:
+        # Rust 브릿지는 DB 작업 동안 GIL을 풀므로, 스레드 오프로드 중에도 이벤트 루프가 계속 진행된다.
+        response = await asyncio.to_thread(self._runtime_bridge.execute_ingestion_job_json, payload)
+        return _to_ingestion_result(response)
+
     def _build_ingestion_payload(
         self,
         operation: str,
         document_id: str | None,
-        summary_nodes: list[dict[str, Any]],
-        page_nodes: list[dict[str, Any]],
-    ) -> dict[str, Any]:
-        return {
-            "operation": operation,
-            "document_id": document_id,
-            "summary_nodes": summary_nodes,
-            "page_nodes": page_nodes,
-            "postgres": {
-                "dsn": self._config.postgres.to_dsn(),
-                "summary_table": self._config.postgres.summary_table,
-                "page_table": self._config.postgres.page_table,
-                "pool_min": self._config.postgres.pool_min,
-                "pool_max": self._config.postgres.pool_max,
-                "connect_timeout_ms": self._config.postgres.connect_timeout_ms,
-                "statement_timeout_ms": self._config.postgres.statement_timeout_ms,
-            },
-        }
+        summary_nodes: list[IngestionSummaryNode],
+        page_nodes: list[IngestionPageNode],
+    ) -> bytes:
+        # 봉투는 Rust 적재 브릿지 요청 형태의 평범한 dict로 만들고, postgres 항목은 미리 만든 dict를 공유한다.
+        # 노드는 이미 검증된 모델이므로 pydantic-core가 모델 직렬화기로 한 번에 JSON 바이트로 변환한다.
+        return to_json(
+            {
+                "operation": operation,
+                "document_id": document_id,
+                "summary_nodes": summary_nodes,
+                "page_nodes": page_nodes,
+                "postgres": self._postgres_payload,
+            }
+        )
+
+
+def _to_ingestion_result(response: Any) -> IngestionResult:
+    # 필드 타입은 Rust 적재 브릿지(IngestionResultPayload)가 보장하므로 재검증 없이 모델을 만든다.
+    # 다만 응답 자체가 객체가 아니면 원인 위치에서 바로 실패시킨다.
+    if not isinstance(response, dict):
+        raise IngestionProcessingError(
+            f"Rust 적재 브릿지 응답이 객체가 아닙니다: type={type(response).__name__}"
+        )
+    return IngestionResult.model_construct(**response)
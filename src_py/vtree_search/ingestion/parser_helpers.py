@@ -4,6 +4,7 @@
 
 설명:
 - 표 HTML 직렬화, 청킹, DOCX 제목 레벨 추정, PDF 이미지 bbox 변환을 담당한다.
+- PDF 이미지 bbox는 `(N, 4)` NumPy 배열로 다뤄 좌표 변환/필터링을 일괄 처리한다.
 
 디자인 패턴:
 - 함수형 유틸 모듈(Function Utility Module).
@@ -14,14 +15,12 @@
 
 from __future__ import annotations
 
-import math
 import re
-from dataclasses import dataclass
-from html import escape
+from collections.abc import Iterable, Sequence
 from pathlib import Path
-from statistics import median
-from typing import Any, Sequence, cast
+from typing import Any, cast
 
+import numpy as np
 from PIL import Image
 
 from vtree_search.ingestion.source_types import ExtractedBlock
@@ -30,16 +29,22 @@ _MIN_IMAGE_WIDTH_PX = 120
 _MIN_IMAGE_HEIGHT_PX = 120
 _MIN_IMAGE_AREA_PX = 30_000
 _CROP_PADDING_PX = 4
-
-
-@dataclass(frozen=True, slots=True)
-class PdfImageBox:
-    """PDF 페이지 내 이미지 bbox 모델."""
-
-    x0: float
-    top: float
-    x1: float
-    bottom: float
+_EMPTY_BOXES = np.empty((0, 4), dtype=np.float64)
+_EMPTY_ROWS = np.empty(0, dtype=np.intp)
+_EMPTY_PIXEL_BOXES = np.empty((0, 4), dtype=np.int64)
+# `str.isalnum()`이 거짓인 문자(밑줄 제외)와 정확히 같은 집합이다. 밑줄은 어차피 밑줄로 치환된다.
+_NON_LABEL_CHAR_RE = re.compile(r"\W")
+_HEADING_STYLE_RE = re.compile(r"(?:heading|제목)\s*(\d+)")
+# `html.escape(quote=True)`와 같은 치환을 C 수준 단일 패스로 수행하는 변환 테이블.
+_HTML_ESCAPE = str.maketrans(
+    {
+        "&": "&amp;",
+        "<": "&lt;",
+        ">": "&gt;",
+        '"': "&quot;",
+        "'": "&#x27;",
+    }
+)
 
 
 def pick_one_file_per_extension(paths: list[Path]) -> list[Path]:
@@ -57,46 +62,47 @@ def pick_one_file_per_extension(paths: list[Path]) -> list[Path]:
 
 def serialize_docx_table(table: object) -> str:
     """DOCX Table 객체를 HTML 문자열로 변환한다."""
-    rows_html: list[str] = []
-    for row in getattr(table, "rows", []):
-        cells_html: list[str] = []
-        has_text = False
-        for cell in getattr(row, "cells", []):
-            value = str(getattr(cell, "text", "") or "")
-            normalized = value.strip()
-            if normalized:
-                has_text = True
-            escaped = "<br/>".join(escape(line.strip()) for line in value.splitlines() if line.strip())
-            cells_html.append(f"<td>{escaped}</td>")
-
-        if cells_html and has_text:
-            rows_html.append(f"<tr>{''.join(cells_html)}</tr>")
-
-    if not rows_html:
-        return ""
-    return f"<table><tbody>{''.join(rows_html)}</tbody></table>"
+    return _rows_to_html(
+        [str(getattr(cell, "text", "") or "") for cell in getattr(row, "cells", [])]
+        for row in getattr(table, "rows", [])
+    )
 
 
 def table_matrix_to_html(raw_table: Sequence[Sequence[object | None]]) -> str:
     """pdfplumber 표 행렬을 HTML 문자열로 변환한다."""
-    row_html_list: list[str] = []
-    for raw_row in raw_table:
-        cell_html_list: list[str] = []
-        has_non_empty = False
-        for raw_cell in raw_row:
-            value = "" if raw_cell is None else str(raw_cell)
-            normalized = value.strip()
-            if normalized:
-                has_non_empty = True
-            escaped = "<br/>".join(escape(line.strip()) for line in value.splitlines() if line.strip())
-            cell_html_list.append(f"<td>{escaped}</td>")
-
-        if cell_html_list and has_non_empty:
-            row_html_list.append(f"<tr>{''.join(cell_html_list)}</tr>")
-
-    if not row_html_list:
+    return _rows_to_html(
+        ["" if raw_cell is None else str(raw_cell) for raw_cell in raw_row]
+        for raw_row in raw_table
+    )
+
+
+def _rows_to_html(rows: Iterable[list[str]]) -> str:
+    """셀 문자열 행 목록을 단일 버퍼에 이어 붙여 HTML 표로 만든다."""
+    parts: list[str] = ["<table><tbody>"]
+    append = parts.append
+    has_rows = False
+    for cells in rows:
+        if not cells or not any(value.strip() for value in cells):
+            continue
+        has_rows = True
+        append("<tr>")
+        for value in cells:
+            append("<td>")
+            if value.strip():
+                append(
+                    "<br/>".join(
+                        stripped.translate(_HTML_ESCAPE)
+                        for stripped in (line.strip() for line in value.splitlines())
+                        if stripped
+                    )
+                )
+            append("</td>")
+        append("</tr>")
+
+    if not has_rows:
         return ""
-    return f"<table><tbody>{''.join(row_html_list)}</tbody></table>"
+    append("</tbody></table>")
+    return "".join(parts)
 
 
 def max_docx_font_size(paragraph: object) -> float | None:
@@ -116,11 +122,12 @@ def max_docx_font_size(paragraph: object) -> float | None:
 
 def estimate_docx_body_font_size(paragraphs: list[object]) -> float:
     """문서 본문 폰트 크기를 추정한다."""
-    sizes: list[float] = []
-    for paragraph in paragraphs:
-        size = max_docx_font_size(paragraph)
-        if size is not None and size > 0:
-            sizes.append(float(size))
+    return estimate_body_font_size(max_docx_font_size(paragraph) for paragraph in paragraphs)
+
+
+def estimate_body_font_size(font_sizes: Iterable[float | None]) -> float:
+    """문단별 최대 폰트 크기 목록으로 본문 폰트 크기를 추정한다. (None/0 이하는 무시)"""
+    sizes = [float(size) for size in font_sizes if size is not None and size > 0]
     return _estimate_body_font_size_from_samples(sizes)
 
 
@@ -138,15 +145,14 @@ def resolve_docx_heading_level(
     return _infer_heading_level(font_size=font_size, body_font_size=body_font_size, text=text)
 
 
-def extract_pdf_image_boxes(page: object) -> list[PdfImageBox]:
-    """pdfplumber 페이지에서 이미지 bbox 후보 목록을 추출한다."""
+def extract_pdf_image_boxes(page: object) -> np.ndarray:
+    """pdfplumber 페이지에서 이미지 bbox 후보를 `(N, 4)` 배열(x0, top, x1, bottom)로 추출한다."""
     raw_images = list(getattr(page, "images", []) or [])
     page_height = _to_float(getattr(page, "height", None))
-    if page_height is None or page_height <= 0:
-        return []
+    if page_height is None or page_height <= 0 or not raw_images:
+        return _EMPTY_BOXES
 
-    boxes: list[PdfImageBox] = []
-    seen: set[tuple[float, float, float, float]] = set()
+    corners: list[tuple[float, float, float, float]] = []
     for raw in raw_images:
         x0 = _to_float(raw.get("x0"))
         x1 = _to_float(raw.get("x1"))
@@ -162,66 +168,64 @@ def extract_pdf_image_boxes(page: object) -> list[PdfImageBox]:
 
         if x0 is None or x1 is None or top is None or bottom is None:
             continue
-
-        left = min(x0, x1)
-        right = max(x0, x1)
-        top_value = min(top, bottom)
-        bottom_value = max(top, bottom)
-        if (right - left) <= 0 or (bottom_value - top_value) <= 0:
-            continue
-
-        key = (
-            round(left, 1),
-            round(top_value, 1),
-            round(right, 1),
-            round(bottom_value, 1),
+        corners.append((x0, top, x1, bottom))
+
+    if not corners:
+        return _EMPTY_BOXES
+
+    raw_boxes = np.asarray(corners, dtype=np.float64)
+    boxes = np.column_stack(
+        (
+            np.minimum(raw_boxes[:, 0], raw_boxes[:, 2]),
+            np.minimum(raw_boxes[:, 1], raw_boxes[:, 3]),
+            np.maximum(raw_boxes[:, 0], raw_boxes[:, 2]),
+            np.maximum(raw_boxes[:, 1], raw_boxes[:, 3]),
         )
-        if key in seen:
-            continue
-        seen.add(key)
-
-        boxes.append(
-            PdfImageBox(
-                x0=left,
-                top=top_value,
-                x1=right,
-                bottom=bottom_value,
-            )
-        )
-    return boxes
+    )
+    boxes = boxes[(boxes[:, 2] > boxes[:, 0]) & (boxes[:, 3] > boxes[:, 1])]
+
+    # 소수 첫째 자리로 반올림한 좌표가 같으면 같은 배치로 보고, 처음 등장한 행만 원래 순서대로 남긴다.
+    _, first_rows = np.unique(np.round(boxes, 1), axis=0, return_index=True)
+    return boxes[np.sort(first_rows)]
 
 
-def to_pixel_box(
+def to_pixel_boxes(
+    boxes: np.ndarray,
     *,
-    box: PdfImageBox,
     page_width: float,
     page_height: float,
     image_width: int,
     image_height: int,
-) -> tuple[int, int, int, int] | None:
-    """PDF 포인트 좌표 bbox를 렌더링 이미지 픽셀 좌표로 변환한다."""
-    if page_width <= 0 or page_height <= 0:
-        return None
-    if image_width <= 0 or image_height <= 0:
-        return None
-
-    left = int(math.floor((box.x0 / page_width) * image_width)) - _CROP_PADDING_PX
-    right = int(math.ceil((box.x1 / page_width) * image_width)) + _CROP_PADDING_PX
-    top = int(math.floor((box.top / page_height) * image_height)) - _CROP_PADDING_PX
-    bottom = int(math.ceil((box.bottom / page_height) * image_height)) + _CROP_PADDING_PX
-
-    left = max(0, left)
-    top = max(0, top)
-    right = min(image_width, right)
-    bottom = min(image_height, bottom)
-
-    width = right - left
-    height = bottom - top
-    if width <= 0 or height <= 0:
-        return None
-    if not is_usable_image_size(width=width, height=height):
-        return None
-    return left, top, right, bottom
+) -> tuple[np.ndarray, np.ndarray]:
+    """PDF 포인트 좌표 bbox 배열을 렌더링 이미지 픽셀 좌표로 일괄 변환한다.
+
+    Returns:
+        `(rows, pixel_boxes)`. `rows`는 입력 배열에서 살아남은 행 번호,
+        `pixel_boxes`는 해당 행의 `(left, top, right, bottom)` 정수 배열이다.
+    """
+    if page_width <= 0 or page_height <= 0 or image_width <= 0 or image_height <= 0 or not len(boxes):
+        return _EMPTY_ROWS, _EMPTY_PIXEL_BOXES
+
+    page_scale = np.array([page_width, page_height, page_width, page_height], dtype=np.float64)
+    image_scale = np.array([image_width, image_height, image_width, image_height], dtype=np.float64)
+    scaled = (boxes / page_scale) * image_scale
+    pixel = np.empty(scaled.shape, dtype=np.int64)
+    pixel[:, :2] = np.floor(scaled[:, :2]) - _CROP_PADDING_PX
+    pixel[:, 2:] = np.ceil(scaled[:, 2:]) + _CROP_PADDING_PX
+    np.clip(pixel[:, 0], 0, image_width, out=pixel[:, 0])
+    np.clip(pixel[:, 1], 0, image_height, out=pixel[:, 1])
+    np.clip(pixel[:, 2], None, image_width, out=pixel[:, 2])
+    np.clip(pixel[:, 3], None, image_height, out=pixel[:, 3])
+
+    width = pixel[:, 2] - pixel[:, 0]
+    height = pixel[:, 3] - pixel[:, 1]
+    usable = (
+        (width >= _MIN_IMAGE_WIDTH_PX)
+        & (height >= _MIN_IMAGE_HEIGHT_PX)
+        & (width * height >= _MIN_IMAGE_AREA_PX)
+    )
+    rows = np.flatnonzero(usable)
+    return rows, pixel[rows]
 
 
 def is_usable_image(image: Image.Image) -> bool:
@@ -246,31 +250,31 @@ def chunk_blocks(blocks: list[ExtractedBlock], max_chars: int) -> list[Extracted
 
     safe_max_chars = max(256, int(max_chars))
     chunked: list[ExtractedBlock] = []
+    chunked_append = chunked.append
     buffer: list[ExtractedBlock] = []
+    # 버퍼 텍스트 길이 합을 누적해 두어 블록마다 버퍼 전체를 다시 합산하지 않는다.
+    buffer_len = 0
 
     for block in blocks:
         if block.block_type in {"table", "image"}:
             if buffer:
-                chunked.append(flush_buffer(buffer))
-                buffer.clear()
-            chunked.append(block)
+                chunked_append(flush_buffer(buffer))
+                buffer = []
+                buffer_len = 0
+            chunked_append(block)
             continue
 
-        if not buffer:
-            buffer.append(block)
-            continue
-
-        current_len = sum(len(item.text) for item in buffer)
-        projected = current_len + len(block.text) + 2
-        if projected <= safe_max_chars:
-            buffer.append(block)
-            continue
+        block_len = len(block.text)
+        if buffer and buffer_len + block_len + 2 > safe_max_chars:
+            chunked_append(flush_buffer(buffer))
+            buffer = []
+            buffer_len = 0
 
-        chunked.append(flush_buffer(buffer))
-        buffer = [block]
+        buffer.append(block)
+        buffer_len += block_len
 
     if buffer:
-        chunked.append(flush_buffer(buffer))
+        chunked_append(flush_buffer(buffer))
 
     return chunked
 
@@ -293,8 +297,7 @@ def flush_buffer(buffer: list[ExtractedBlock]) -> ExtractedBlock:
 
 def to_ltree_label(value: str) -> str:
     """임의 문자열을 ltree 라벨 규칙으로 정규화한다."""
-    sanitized = "".join(char if char.isalnum() else "_" for char in value.strip())
-    sanitized = sanitized.strip("_")
+    sanitized = _NON_LABEL_CHAR_RE.sub("_", value.strip()).strip("_")
     if not sanitized:
         return "node"
     if sanitized[0].isdigit():
@@ -305,11 +308,10 @@ def to_ltree_label(value: str) -> str:
 def _parse_heading_level(style_name: str) -> int | None:
     if not style_name:
         return None
-    style_lower = style_name.lower()
-    matched = re.search(r"(heading|제목)\s*(\d+)", style_lower)
+    matched = _HEADING_STYLE_RE.search(style_name.lower())
     if not matched:
         return None
-    level = int(matched.group(2))
+    level = int(matched.group(1))
     return max(1, min(level, 6))
 
 
@@ -340,9 +342,10 @@ def _infer_heading_level(
 def _estimate_body_font_size_from_samples(sizes: list[float]) -> float:
     if not sizes:
         return 11.0
-    ordered = sorted(sizes)
-    cutoff = max(1, int(len(ordered) * 0.6))
-    return float(median(ordered[:cutoff]))
+    samples = np.asarray(sizes, dtype=np.float64)
+    cutoff = max(1, int(samples.size * 0.6))
+    # 하위 60%만 필요하므로 전체 정렬 대신 선택 알고리즘으로 앞쪽 cutoff개만 모은다.
+    return float(np.median(np.partition(samples, cutoff - 1)[:cutoff]))
 
 
 def _to_float(value: object) -> float | None:
@@ -352,8 +355,8 @@ def _to_float(value: object) -> float | None:
 
 
 __all__ = [
-    "PdfImageBox",
     "chunk_blocks",
+    "estimate_body_font_size",
     "estimate_docx_body_font_size",
     "extract_pdf_image_boxes",
     "is_usable_image",
@@ -363,5 +366,5 @@ __all__ = [
     "serialize_docx_table",
     "table_matrix_to_html",
     "to_ltree_label",
-    "to_pixel_box",
+    "to_pixel_boxes",
 ]
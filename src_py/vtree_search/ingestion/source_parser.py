@@ -5,6 +5,9 @@
 설명:
 - Markdown/PDF/DOCX 입력을 처리한다.
 - PDF 표/이미지, DOCX 표를 주석 서비스와 연결해 본문에 반영한다.
+- 주석 호출은 파일마다 `abatch` 한 번으로 묶고, 파일 파싱은 `max_parallel_files` 상한 안에서 동시에 진행한다.
+- 동시에 진행 중인 주석 LLM 호출 수는 파일 수와 무관하게 파싱 호출 전체에서 `annotation_concurrency`로 묶는다.
+- PDF/DOCX 파싱은 워커 스레드에서 실행하고, 스레드 안전하지 않은 pdfium 호출만 잠금으로 직렬화한다.
 - 추출 블록을 max_chunk_chars 기준으로 결합해 page 노드 목록으로 변환한다.
 
 디자인 패턴:
@@ -18,16 +21,27 @@
 
 from __future__ import annotations
 
-import uuid
+import asyncio
+import contextlib
+import itertools
+import math
+import os
+import re
+import threading
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
 from pathlib import Path
-from typing import Iterable
+from typing import Any, cast
 
 import pypdfium2 as pdfium
 from PIL import Image
 
-from vtree_search.config.models import IngestionConfig
+from vtree_search.config.models import IngestionConfig, IngestionPreprocessConfig
 from vtree_search.contracts.ingestion_models import IngestionPageNode
-from vtree_search.exceptions import ConfigurationError, DependencyUnavailableError, IngestionProcessingError
+from vtree_search.exceptions import (
+    ConfigurationError,
+    DependencyUnavailableError,
+    IngestionProcessingError,
+)
 from vtree_search.ingestion.docx_layout import (
     advance_docx_page_state,
     estimate_docx_paragraph_layout,
@@ -38,22 +52,28 @@ from vtree_search.ingestion.docx_layout import (
 )
 from vtree_search.ingestion.parser_helpers import (
     chunk_blocks,
-    estimate_docx_body_font_size,
+    estimate_body_font_size,
     extract_pdf_image_boxes,
-    is_usable_image,
     max_docx_font_size,
     pick_one_file_per_extension,
     resolve_docx_heading_level,
     serialize_docx_table,
     table_matrix_to_html,
     to_ltree_label,
-    to_pixel_box,
+    to_pixel_boxes,
 )
 from vtree_search.ingestion.source_types import ExtractedBlock
 from vtree_search.llm.langchain_ingestion import LangChainIngestionAnnotationLLM
 
 SUPPORTED_SUFFIXES = {".pdf", ".md", ".markdown", ".docx"}
 _RENDER_SCALE = 2.0
+_PNG_COMPRESS_LEVEL = 1
+_JPEG_QUALITY = 85
+_NODE_ID_BYTES = 16
+_MARKDOWN_PARAGRAPH_SPLIT_RE = re.compile(r"\n\s*\n")
+_WHITESPACE_RUN_RE = re.compile(r"\s+")
+# pdfium은 스레드 안전하지 않으므로 워커 스레드에서의 pdfium 호출을 프로세스 단위로 직렬화한다.
+_PDFIUM_LOCK = threading.Lock()
 
 
 class SourceParser:
@@ -73,11 +93,7 @@ class SourceParser:
         if not root.exists():
             raise IngestionProcessingError(f"입력 경로가 존재하지 않습니다: {root}")
 
-        files = [
-            path
-            for path in sorted(root.rglob("*"))
-            if path.is_file() and path.suffix.lower() in SUPPORTED_SUFFIXES
-        ]
+        files = sorted(_iter_supported_files(root))
 
         if sample is None:
             sample = self._config.preprocess.sample_per_extension
@@ -98,9 +114,23 @@ class SourceParser:
         if not paths:
             return []
 
-        extracted: list[ExtractedBlock] = []
-        for path in paths:
-            extracted.extend(await self._extract_blocks(path))
+        # 파일 단위 추출은 서로 독립이므로 동시에 진행하고, 결과는 입력 파일 순서대로 이어 붙인다.
+        # 파일 슬롯과 주석 예산은 이 호출의 이벤트 루프에서 만들어, 파서를 다른 루프에서 재사용해도 묶이지 않게 한다.
+        file_slots = asyncio.Semaphore(self._config.preprocess.max_parallel_files)
+        annotation_budget = _AnnotationBudget(self._config.preprocess.annotation_concurrency)
+        results = await asyncio.gather(
+            *(self._parse_one(path, file_slots, annotation_budget) for path in paths),
+            return_exceptions=True,
+        )
+        failures = [
+            (path, result)
+            for path, result in zip(paths, results, strict=True)
+            if isinstance(result, BaseException)
+        ]
+        if failures:
+            raise _aggregate_failures(failures)
+
+        extracted = list(itertools.chain.from_iterable(cast(list[list[ExtractedBlock]], results)))
 
         chunked = chunk_blocks(extracted, max_chars=self._config.preprocess.max_chunk_chars)
         return _to_page_nodes(
@@ -109,19 +139,33 @@ class SourceParser:
             blocks=chunked,
         )
 
-    async def _extract_blocks(self, path: Path) -> list[ExtractedBlock]:
+    async def _parse_one(
+        self,
+        path: Path,
+        file_slots: asyncio.Semaphore,
+        annotation_budget: _AnnotationBudget,
+    ) -> list[ExtractedBlock]:
+        async with file_slots:
+            return await self._extract_blocks(path, annotation_budget)
+
+    async def _extract_blocks(self, path: Path, annotation_budget: _AnnotationBudget) -> list[ExtractedBlock]:
         suffix = path.suffix.lower()
         if suffix in {".md", ".markdown"}:
-            return self._extract_markdown(path)
+            return await self._extract_markdown(path)
         if suffix == ".docx":
-            return await self._extract_docx(path)
+            return await self._extract_docx(path, annotation_budget)
         if suffix == ".pdf":
-            return await self._extract_pdf(path)
+            return await self._extract_pdf(path, annotation_budget)
         return []
 
-    def _extract_markdown(self, path: Path) -> list[ExtractedBlock]:
-        text = path.read_text(encoding="utf-8")
-        paragraphs = [" ".join(part.split()) for part in text.split("\n\n") if part.strip()]
+    async def _extract_markdown(self, path: Path) -> list[ExtractedBlock]:
+        text = await asyncio.to_thread(path.read_text, encoding="utf-8")
+        # 공백만 있는 줄도 문단 경계로 보고, 문단 내 공백 정규화는 정규식 엔진(C)에서 처리한다.
+        paragraphs = [
+            normalized
+            for part in _MARKDOWN_PARAGRAPH_SPLIT_RE.split(text)
+            if (normalized := _WHITESPACE_RUN_RE.sub(" ", part).strip())
+        ]
 
         blocks: list[ExtractedBlock] = []
         for index, paragraph in enumerate(paragraphs, start=1):
@@ -136,340 +180,529 @@ class SourceParser:
             )
         return blocks
 
-    async def _extract_docx(self, path: Path) -> list[ExtractedBlock]:
-        try:
-            from docx import Document as WordDocument
-        except Exception as exc:  # noqa: BLE001
-            raise DependencyUnavailableError(
-                f"DOCX 파싱을 위해 python-docx가 필요합니다: {exc}"
-            ) from exc
+    async def _extract_docx(self, path: Path, annotation_budget: _AnnotationBudget) -> list[ExtractedBlock]:
+        blocks, pending_tables = await asyncio.to_thread(
+            _parse_docx_blocks,
+            path,
+            collect_tables=self._config.preprocess.enable_table_annotation,
+        )
 
-        document = WordDocument(str(path))
-        paragraphs = [
-            paragraph
-            for paragraph in document.paragraphs
-            if getattr(paragraph, "text", None) and str(paragraph.text).strip()
-        ]
-        body_font_size = estimate_docx_body_font_size(paragraphs)
-        layout_metrics = resolve_docx_layout_metrics(document)
-        usable_width_pt = float(layout_metrics["usable_width_pt"])
-        usable_height_pt = float(layout_metrics["usable_height_pt"])
+        annotations, _ = await self._annotate_batch(
+            annotation_budget,
+            tables=[(html, page_text) for _, html, page_text in pending_tables],
+        )
+        for (table_block, _, _), annotated in zip(pending_tables, annotations, strict=True):
+            table_block.text = annotated
+        return blocks
 
-        blocks: list[ExtractedBlock] = []
-        page_texts: dict[int, list[str]] = {}
-        paragraph_index = 0
-        table_index = 0
-        current_page_num = 1
-        used_height_pt = 0.0
-
-        for block_type, block in iterate_docx_blocks(document):
-            if block_type == "paragraph":
-                paragraph = block
-                text = " ".join(str(getattr(paragraph, "text", "") or "").split())
-                if not text:
-                    continue
-
-                if is_docx_page_break_before(paragraph):
-                    current_page_num += 1
-                    used_height_pt = 0.0
-
-                paragraph_index += 1
-                font_size = max_docx_font_size(paragraph) or body_font_size
-                style = getattr(paragraph, "style", None)
-                style_name = str(getattr(style, "name", "") or "").strip()
-                heading_level = resolve_docx_heading_level(
-                    style_name=style_name,
-                    font_size=font_size,
-                    body_font_size=body_font_size,
-                    text=text,
-                )
-                paragraph_layout = estimate_docx_paragraph_layout(
-                    paragraph=paragraph,
-                    text=text,
-                    font_size=font_size,
-                    usable_width_pt=usable_width_pt,
-                )
-                block_height_pt = float(paragraph_layout["estimated_height_pt"])
-                page_num, current_page_num, used_height_pt = advance_docx_page_state(
-                    current_page_num=current_page_num,
-                    used_height_pt=used_height_pt,
-                    block_height_pt=block_height_pt,
-                    usable_height_pt=usable_height_pt,
-                )
+    async def _extract_pdf(self, path: Path, annotation_budget: _AnnotationBudget) -> list[ExtractedBlock]:
+        # 문서 열기/텍스트/표/이미지 렌더링은 모두 동기 CPU 작업이므로 한 번에 워커 스레드로 넘긴다.
+        page_texts, table_jobs, image_jobs = await asyncio.to_thread(
+            _parse_pdf_sources,
+            path,
+            self._config.preprocess,
+        )
 
-                metadata: dict[str, object] = {
-                    "layout_type": "docx_paragraph",
-                    "page_num": page_num,
-                    "block_type": "heading" if heading_level is not None else "paragraph",
-                    "heading_tag": f"H{heading_level}" if heading_level is not None else "BODY",
-                    "paragraph_index": paragraph_index,
-                    "font_size": round(float(font_size), 2),
-                    "body_font_size": round(float(body_font_size), 2),
-                    "line_spacing": round(float(paragraph_layout["line_spacing_pt"]), 2),
-                    "char_spacing": round(float(paragraph_layout["char_spacing_pt"]), 2),
-                    "space_before": round(float(paragraph_layout["space_before_pt"]), 2),
-                    "space_after": round(float(paragraph_layout["space_after_pt"]), 2),
-                    "line_count_estimated": int(paragraph_layout["line_count_estimated"]),
-                    "estimated_height_pt": round(block_height_pt, 2),
-                    "page_size": "A4",
-                }
-                if heading_level is not None:
-                    metadata["heading_level"] = heading_level
+        # 파싱이 끝난 뒤 표/이미지 주석을 하나의 배치로 보낸다.
+        table_bodies, image_bodies = await self._annotate_batch(
+            annotation_budget,
+            tables=[(html, _page_text(page_texts, page_num)) for page_num, html in table_jobs],
+            images=[(image_path, _page_text(page_texts, page_num)) for page_num, image_path in image_jobs],
+        )
+        tables_by_page: dict[int, list[str]] = {}
+        for (page_num, _), table_body in zip(table_jobs, table_bodies, strict=True):
+            tables_by_page.setdefault(page_num, []).append(table_body)
+        images_by_page: dict[int, list[tuple[str, Path]]] = {}
+        for (page_num, image_path), image_body in zip(image_jobs, image_bodies, strict=True):
+            images_by_page.setdefault(page_num, []).append((image_body, image_path))
 
+        source_file = path.as_posix()
+        blocks: list[ExtractedBlock] = []
+        for page_num, text in enumerate(page_texts, start=1):
+            if text:
                 blocks.append(
                     ExtractedBlock(
-                        source_file=path.as_posix(),
+                        source_file=source_file,
                         page_num=page_num,
-                        block_type="heading" if heading_level is not None else "paragraph",
+                        block_type="paragraph",
                         text=text,
-                        metadata=metadata,
+                        metadata={"layout_type": "pdf_text", "page_num": page_num},
                     )
                 )
-                page_texts.setdefault(page_num, []).append(text)
-                continue
 
-            table = block
-            html = serialize_docx_table(table)
-            if not html:
-                continue
-            if not self._config.preprocess.enable_table_annotation:
-                continue
-
-            table_index += 1
-            table_height_pt = estimate_docx_table_height(
-                table=table,
-                body_font_size=body_font_size,
-                usable_width_pt=usable_width_pt,
-            )
-            page_num, current_page_num, used_height_pt = advance_docx_page_state(
-                current_page_num=current_page_num,
-                used_height_pt=used_height_pt,
-                block_height_pt=table_height_pt,
-                usable_height_pt=usable_height_pt,
-            )
-            annotated = await self._annotate_table(
-                table_html=html,
-                page_text="\n".join(page_texts.get(page_num, [])),
-            )
-            blocks.append(
-                ExtractedBlock(
-                    source_file=path.as_posix(),
-                    page_num=page_num,
-                    block_type="table",
-                    text=annotated,
-                    metadata={
-                        "layout_type": "docx_table",
-                        "page_num": page_num,
-                        "block_type": "table",
-                        "table_index": table_index,
-                        "heading_tag": "BODY",
-                        "body_font_size": round(float(body_font_size), 2),
-                        "estimated_height_pt": round(float(table_height_pt), 2),
-                        "page_size": "A4",
-                    },
+            for table_index, table_body in enumerate(tables_by_page.get(page_num, []), start=1):
+                blocks.append(
+                    ExtractedBlock(
+                        source_file=source_file,
+                        page_num=page_num,
+                        block_type="table",
+                        text=table_body,
+                        metadata={
+                            "layout_type": "pdf_table",
+                            "page_num": page_num,
+                            "table_index": table_index,
+                        },
+                    )
                 )
-            )
 
+            for image_index, (image_body, image_path) in enumerate(
+                images_by_page.get(page_num, []),
+                start=1,
+            ):
+                blocks.append(
+                    ExtractedBlock(
+                        source_file=source_file,
+                        page_num=page_num,
+                        block_type="image",
+                        text=image_body,
+                        metadata={
+                            "layout_type": "pdf_image",
+                            "page_num": page_num,
+                            "image_index": image_index,
+                            "image_path": image_path.as_posix(),
+                        },
+                    )
+                )
         return blocks
 
-    async def _extract_pdf(self, path: Path) -> list[ExtractedBlock]:
-        table_by_page = await self._extract_pdf_tables(path)
-        image_by_page = await self._extract_pdf_images(path)
-        pdf = pdfium.PdfDocument(str(path))
-        blocks: list[ExtractedBlock] = []
-        try:
-            for page_index in range(len(pdf)):
-                page = pdf[page_index]
-                page_num = page_index + 1
-                text_page = None
-                try:
-                    text_page = page.get_textpage()
-                    text = " ".join(text_page.get_text_range().split())
-
-                    if text:
-                        blocks.append(
-                            ExtractedBlock(
-                                source_file=path.as_posix(),
-                                page_num=page_num,
-                                block_type="paragraph",
-                                text=text,
-                                metadata={"layout_type": "pdf_text", "page_num": page_num},
-                            )
-                        )
+    async def _annotate_batch(
+        self,
+        annotation_budget: _AnnotationBudget,
+        *,
+        tables: Sequence[tuple[str, str]] = (),
+        images: Sequence[tuple[Path, str]] = (),
+    ) -> tuple[list[str], list[str]]:
+        if not tables and not images:
+            return [], []
+
+        annotation = self._require_annotation_llm(kind="표" if tables else "이미지")
+        async with annotation_budget.reserve(len(tables) + len(images)) as max_concurrency:
+            return await annotation.annotate_batch(
+                tables=tables,
+                images=images,
+                max_concurrency=max_concurrency,
+            )
 
-                    for table_index, table_body in enumerate(table_by_page.get(page_num, []), start=1):
-                        blocks.append(
-                            ExtractedBlock(
-                                source_file=path.as_posix(),
-                                page_num=page_num,
-                                block_type="table",
-                                text=table_body,
-                                metadata={
-                                    "layout_type": "pdf_table",
-                                    "page_num": page_num,
-                                    "table_index": table_index,
-                                },
-                            )
-                        )
+    def _require_annotation_llm(self, kind: str) -> LangChainIngestionAnnotationLLM:
+        if self._annotation_llm is None:
+            raise ConfigurationError(
+                f"{kind} 주석이 활성화되어 있으나 llm 인자가 없습니다"
+            )
+        return self._annotation_llm
 
-                    for image_index, (image_body, image_path) in enumerate(
-                        image_by_page.get(page_num, []),
-                        start=1,
-                    ):
-                        blocks.append(
-                            ExtractedBlock(
-                                source_file=path.as_posix(),
-                                page_num=page_num,
-                                block_type="image",
-                                text=image_body,
-                                metadata={
-                                    "layout_type": "pdf_image",
-                                    "page_num": page_num,
-                                    "image_index": image_index,
-                                    "image_path": image_path.as_posix(),
-                                },
-                            )
-                        )
-                finally:
-                    if text_page is not None:
-                        text_page.close()
-                    page.close()
-        finally:
-            pdf.close()
-        return blocks
 
-    async def _extract_pdf_tables(self, path: Path) -> dict[int, list[str]]:
-        if not self._config.preprocess.enable_table_annotation:
-            return {}
+class _AnnotationBudget:
+    """파싱 호출 하나에서 동시에 진행 중인 주석 LLM 호출 수를 상한 안으로 묶는다."""
 
-        try:
-            import pdfplumber
-        except Exception as exc:  # noqa: BLE001
-            raise DependencyUnavailableError(
-                f"PDF 표 추출을 위해 pdfplumber가 필요합니다: {exc}"
-            ) from exc
+    def __init__(self, limit: int) -> None:
+        self._limit = limit
+        self._slots = asyncio.Semaphore(limit)
+        self._reserve_lock = asyncio.Lock()
 
-        tables_by_page: dict[int, list[str]] = {}
-        with pdfplumber.open(str(path)) as pdf:
-            for page_index, page in enumerate(pdf.pages, start=1):
-                page_text = " ".join((page.extract_text() or "").split())
-                raw_tables = page.extract_tables() or []
-                if not raw_tables:
-                    continue
-
-                for raw_table in raw_tables:
-                    html = table_matrix_to_html(raw_table)
-                    if not html:
-                        continue
-                    annotated = await self._annotate_table(
-                        table_html=html,
-                        page_text=page_text,
-                    )
-                    tables_by_page.setdefault(page_index, []).append(annotated)
+    @contextlib.asynccontextmanager
+    async def reserve(self, count: int) -> AsyncIterator[int]:
+        """`abatch` 항목 수만큼(상한 이내) 슬롯을 잡고, 잡은 슬롯 수를 배치의 `max_concurrency`로 돌려준다."""
+        wanted = min(count, self._limit)
+        acquired = 0
+        try:
+            # 여러 파일이 슬롯을 일부씩만 잡고 서로 기다리지 않도록 한 배치의 예약은 한 번에 끝낸다.
+            async with self._reserve_lock:
+                while acquired < wanted:
+                    await self._slots.acquire()
+                    acquired += 1
+            yield acquired
+        finally:
+            for _ in range(acquired):
+                self._slots.release()
 
-        return tables_by_page
 
-    async def _extract_pdf_images(self, path: Path) -> dict[int, list[tuple[str, Path]]]:
-        if not self._config.preprocess.enable_image_annotation:
-            return {}
+def build_source_parser(
+    config: IngestionConfig,
+    annotation_llm: LangChainIngestionAnnotationLLM | None = None,
+) -> SourceParser:
+    """설정 기반 SourceParser를 생성한다."""
+    return SourceParser(config=config, annotation_llm=annotation_llm)
 
-        try:
-            import pdfplumber
-        except Exception as exc:  # noqa: BLE001
-            raise DependencyUnavailableError(
-                f"PDF 이미지 위치 추출을 위해 pdfplumber가 필요합니다: {exc}"
-            ) from exc
 
-        output_dir = Path(self._config.preprocess.asset_output_dir).expanduser().resolve()
-        output_dir.mkdir(parents=True, exist_ok=True)
-        target_dir = output_dir / path.stem
-        target_dir.mkdir(parents=True, exist_ok=True)
+def _iter_supported_files(root: Path) -> Iterator[Path]:
+    """`os.scandir`로 트리를 순회하며 지원 확장자 파일만 돌려준다.
 
-        pdf = pdfium.PdfDocument(str(path))
-        images_by_page: dict[int, list[tuple[str, Path]]] = {}
+    확장자 검사를 이름 문자열에서 먼저 하므로 무관한 파일은 stat 없이 건너뛴다.
+    `rglob`과 같이 디렉터리 심볼릭 링크는 따라가지 않고, 읽을 수 없는 디렉터리는 무시한다.
+    """
+    pending = [os.fspath(root)]
+    while pending:
         try:
-            with pdfplumber.open(str(path)) as plumber_pdf:
-                page_count = min(len(pdf), len(plumber_pdf.pages))
-                for page_index in range(page_count):
-                    page_num = page_index + 1
-                    pdfium_page = pdf[page_index]
-                    text_page = None
-                    rendered = None
-                    rendered_image: Image.Image | None = None
-
-                    try:
-                        text_page = pdfium_page.get_textpage()
-                        page_text = " ".join(text_page.get_text_range().split())
-                        plumber_page = plumber_pdf.pages[page_index]
-                        image_boxes = extract_pdf_image_boxes(plumber_page)
-                        if not image_boxes:
-                            continue
-
-                        rendered = pdfium_page.render(scale=_RENDER_SCALE)
-                        rendered_image = rendered.to_pil()
-                        image_width, image_height = rendered_image.size
-                        page_width = float(getattr(plumber_page, "width", 0.0) or 0.0)
-                        page_height = float(getattr(plumber_page, "height", 0.0) or 0.0)
-
-                        for image_index, box in enumerate(image_boxes, start=1):
-                            pixel_box = to_pixel_box(
-                                box=box,
-                                page_width=page_width,
-                                page_height=page_height,
-                                image_width=image_width,
-                                image_height=image_height,
-                            )
-                            if pixel_box is None:
-                                continue
-
-                            cropped = rendered_image.crop(pixel_box)
-                            try:
-                                if not is_usable_image(cropped):
-                                    continue
-                                image_path = target_dir / f"page-{page_num:04d}-img-{image_index:03d}.png"
-                                cropped.save(str(image_path), format="PNG")
-                            finally:
-                                cropped.close()
-
-                            annotated = await self._annotate_image(
-                                image_path=image_path,
-                                page_text=page_text,
-                            )
-                            images_by_page.setdefault(page_num, []).append((annotated, image_path))
-                    finally:
-                        if rendered_image is not None:
-                            rendered_image.close()
-                        if rendered is not None:
-                            rendered.close()
-                        if text_page is not None:
-                            text_page.close()
-                        pdfium_page.close()
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif os.path.splitext(entry.name)[1].lower() in SUPPORTED_SUFFIXES and entry.is_file():
+                        yield Path(entry.path)
+        except OSError:
+            continue
+
+
+def _import_pdfplumber():
+    try:
+        import pdfplumber
+    except Exception as exc:  # noqa: BLE001
+        raise DependencyUnavailableError(
+            f"PDF 표/이미지 추출을 위해 pdfplumber가 필요합니다: {exc}"
+        ) from exc
+    return pdfplumber
+
+
+def _read_pdf_page_texts(pdf: pdfium.PdfDocument) -> list[str]:
+    """pdfium 문서의 페이지별 공백 정규화 텍스트를 순서대로 반환한다."""
+    texts: list[str] = []
+    for page_index in range(len(pdf)):
+        page = pdf[page_index]
+        text_page = None
+        try:
+            text_page = page.get_textpage()
+            texts.append(" ".join(text_page.get_text_range().split()))
         finally:
+            if text_page is not None:
+                text_page.close()
+            page.close()
+    return texts
+
+
+def _page_text(page_texts: list[str], page_num: int) -> str:
+    if 1 <= page_num <= len(page_texts):
+        return page_texts[page_num - 1]
+    return ""
+
+
+def _collect_pdf_tables(plumber_pdf: Any) -> list[tuple[int, str]]:
+    """pdfplumber 문서에서 `(page_num, table_html)` 주석 작업 목록을 만든다."""
+    jobs: list[tuple[int, str]] = []
+    for page_num, page in enumerate(plumber_pdf.pages, start=1):
+        for raw_table in page.extract_tables() or []:
+            html = table_matrix_to_html(raw_table)
+            if html:
+                jobs.append((page_num, html))
+    return jobs
+
+
+def _parse_pdf_sources(
+    path: Path,
+    preprocess: IngestionPreprocessConfig,
+) -> tuple[list[str], list[tuple[int, str]], list[tuple[int, Path]]]:
+    """PDF를 파싱해 `(페이지 텍스트 목록, 표 작업 목록, 이미지 작업 목록)`을 만든다.
+
+    pdfium/pdfplumber 문서는 파일당 한 번씩만 열고, 페이지 텍스트도 한 번만 뽑아 본문과 주석 문맥에 함께 쓴다.
+    워커 스레드에서 실행되므로 pdfium 호출은 `_PDFIUM_LOCK` 안에서만 수행한다.
+    """
+    pdfplumber = None
+    if preprocess.enable_table_annotation or preprocess.enable_image_annotation:
+        pdfplumber = _import_pdfplumber()
+
+    with _PDFIUM_LOCK:
+        pdf = pdfium.PdfDocument(str(path))
+    table_jobs: list[tuple[int, str]] = []
+    image_jobs: list[tuple[int, Path]] = []
+    try:
+        with _PDFIUM_LOCK:
+            page_texts = _read_pdf_page_texts(pdf)
+        if pdfplumber is not None:
+            with pdfplumber.open(str(path)) as plumber_pdf:
+                if preprocess.enable_table_annotation:
+                    table_jobs = _collect_pdf_tables(plumber_pdf)
+                if preprocess.enable_image_annotation:
+                    image_jobs = _collect_pdf_images(path, pdf, plumber_pdf, preprocess)
+    finally:
+        with _PDFIUM_LOCK:
             pdf.close()
-        return images_by_page
-
-    async def _annotate_table(self, *, table_html: str, page_text: str) -> str:
-        annotation = self._require_annotation_llm(kind="표")
-        return await annotation.annotate_table(table_html=table_html, page_text=page_text)
+    return page_texts, table_jobs, image_jobs
+
+
+def _collect_pdf_images(
+    path: Path,
+    pdf: pdfium.PdfDocument,
+    plumber_pdf: Any,
+    preprocess: IngestionPreprocessConfig,
+) -> list[tuple[int, Path]]:
+    """이미지 bbox 영역을 렌더링해 저장하고 `(page_num, image_path)` 주석 작업 목록을 반환한다."""
+    output_dir = Path(preprocess.asset_output_dir).expanduser().resolve()
+    image_suffix = ".png" if preprocess.lossless_images else ".jpg"
+    target_dir = output_dir / path.stem
+    target_dir.mkdir(parents=True, exist_ok=True)
+
+    plumber_pages = plumber_pdf.pages
+    jobs: list[tuple[int, Path]] = []
+    with _PDFIUM_LOCK:
+        pdf_page_count = len(pdf)
+    page_count = min(pdf_page_count, len(plumber_pages))
+    for page_index in range(page_count):
+        page_num = page_index + 1
+        plumber_page = plumber_pages[page_index]
+        image_boxes = extract_pdf_image_boxes(plumber_page)
+        if not len(image_boxes):
+            continue
+
+        regions: list[tuple[pdfium.PdfBitmap, Image.Image, Path]] = []
+        try:
+            with _PDFIUM_LOCK:
+                pdfium_page = pdf[page_index]
+                try:
+                    # 전체 페이지를 그리지 않고, 같은 픽셀 격자(`render`와 동일한 ceil 크기)에서 bbox 영역만 렌더링한다.
+                    image_width = math.ceil(pdfium_page.get_width() * _RENDER_SCALE)
+                    image_height = math.ceil(pdfium_page.get_height() * _RENDER_SCALE)
+                    page_width = float(getattr(plumber_page, "width", 0.0) or 0.0)
+                    page_height = float(getattr(plumber_page, "height", 0.0) or 0.0)
+
+                    rows, pixel_boxes = to_pixel_boxes(
+                        image_boxes,
+                        page_width=page_width,
+                        page_height=page_height,
+                        image_width=image_width,
+                        image_height=image_height,
+                    )
+                    for row, pixel_box in zip(rows.tolist(), pixel_boxes.tolist(), strict=True):
+                        bitmap = _render_region(
+                            pdfium_page,
+                            pixel_box,
+                            image_width=image_width,
+                            image_height=image_height,
+                        )
+                        image_path = target_dir / f"page-{page_num:04d}-img-{row + 1:03d}{image_suffix}"
+                        regions.append((bitmap, bitmap.to_pil(), image_path))
+                finally:
+                    pdfium_page.close()
+            if not regions:
+                continue
+            # 축소/인코딩은 PIL 작업이므로 pdfium 잠금 밖에서 수행한다.
+            _save_region_images(
+                [(image, image_path) for _, image, image_path in regions],
+                max_edge=preprocess.max_image_edge,
+                lossless=preprocess.lossless_images,
+            )
+            jobs.extend((page_num, image_path) for _, _, image_path in regions)
+        finally:
+            # PIL 이미지는 비트맵 버퍼를 공유하므로 이미지를 먼저 닫는다.
+            with _PDFIUM_LOCK:
+                for bitmap, image, _ in regions:
+                    image.close()
+                    bitmap.close()
+    return jobs
 
-    async def _annotate_image(self, *, image_path: Path, page_text: str) -> str:
-        annotation = self._require_annotation_llm(kind="이미지")
-        return await annotation.annotate_image(image_path=image_path, page_text=page_text)
 
-    def _require_annotation_llm(self, kind: str) -> LangChainIngestionAnnotationLLM:
-        if self._annotation_llm is None:
-            raise ConfigurationError(
-                f"{kind} 주석이 활성화되어 있으나 llm 인자가 없습니다"
+def _parse_docx_blocks(
+    path: Path,
+    *,
+    collect_tables: bool,
+) -> tuple[list[ExtractedBlock], list[tuple[ExtractedBlock, str, str]]]:
+    """DOCX를 파싱해 블록 목록과 `(표 블록, table_html, page_text)` 주석 작업 목록을 만든다.
+
+    python-docx 파싱과 레이아웃 추정은 모두 동기 CPU 작업이므로 워커 스레드에서 실행한다.
+    표 블록의 text는 주석 결과로 채울 수 있도록 빈 값으로 둔다.
+    """
+    try:
+        from docx import Document as WordDocument
+    except Exception as exc:  # noqa: BLE001
+        raise DependencyUnavailableError(
+            f"DOCX 파싱을 위해 python-docx가 필요합니다: {exc}"
+        ) from exc
+
+    document = WordDocument(str(path))
+    docx_blocks = iterate_docx_blocks(document)
+    # 문단 텍스트 정규화와 run 단위 최대 폰트 크기는 문단당 한 번만 계산해
+    # 본문 폰트 추정과 아래 레이아웃 루프가 함께 쓴다.
+    paragraph_samples: dict[int, tuple[str, float | None]] = {}
+    for block_index, (block_type, block) in enumerate(docx_blocks):
+        if block_type != "paragraph":
+            continue
+        text = " ".join(str(getattr(block, "text", "") or "").split())
+        if text:
+            paragraph_samples[block_index] = (text, max_docx_font_size(block))
+    body_font_size = estimate_body_font_size(size for _, size in paragraph_samples.values())
+    layout_metrics = resolve_docx_layout_metrics(document)
+    usable_width_pt = float(layout_metrics["usable_width_pt"])
+    usable_height_pt = float(layout_metrics["usable_height_pt"])
+
+    blocks: list[ExtractedBlock] = []
+    page_texts: dict[int, list[str]] = {}
+    pending_tables: list[tuple[ExtractedBlock, str, str]] = []
+    paragraph_index = 0
+    table_index = 0
+    current_page_num = 1
+    used_height_pt = 0.0
+    # `paragraph.style`은 호출마다 스타일 ID 검색을 하므로 pStyle 값별로 한 번만 조회한다.
+    style_cache: dict[str | None, tuple[object, str]] = {}
+
+    for block_index, (block_type, block) in enumerate(docx_blocks):
+        if block_type == "paragraph":
+            sample = paragraph_samples.get(block_index)
+            if sample is None:
+                continue
+            paragraph = block
+            text, max_font_size = sample
+
+            style_key = getattr(getattr(paragraph, "_p", None), "style", None)
+            cached_style = style_cache.get(style_key)
+            if cached_style is None:
+                resolved_style = getattr(paragraph, "style", None)
+                cached_style = (resolved_style, str(getattr(resolved_style, "name", "") or "").strip())
+                style_cache[style_key] = cached_style
+            style, style_name = cached_style
+
+            if is_docx_page_break_before(paragraph, style):
+                current_page_num += 1
+                used_height_pt = 0.0
+
+            paragraph_index += 1
+            font_size = max_font_size or body_font_size
+            heading_level = resolve_docx_heading_level(
+                style_name=style_name,
+                font_size=font_size,
+                body_font_size=body_font_size,
+                text=text,
+            )
+            paragraph_layout = estimate_docx_paragraph_layout(
+                paragraph=paragraph,
+                text=text,
+                font_size=font_size,
+                usable_width_pt=usable_width_pt,
+                style=style,
+            )
+            block_height_pt = float(paragraph_layout["estimated_height_pt"])
+            page_num, current_page_num, used_height_pt = advance_docx_page_state(
+                current_page_num=current_page_num,
+                used_height_pt=used_height_pt,
+                block_height_pt=block_height_pt,
+                usable_height_pt=usable_height_pt,
             )
-        return self._annotation_llm
 
+            metadata: dict[str, object] = {
+                "layout_type": "docx_paragraph",
+                "page_num": page_num,
+                "block_type": "heading" if heading_level is not None else "paragraph",
+                "heading_tag": f"H{heading_level}" if heading_level is not None else "BODY",
+                "paragraph_index": paragraph_index,
+                "font_size": round(float(font_size), 2),
+                "body_font_size": round(float(body_font_size), 2),
+                "line_spacing": round(float(paragraph_layout["line_spacing_pt"]), 2),
+                "char_spacing": round(float(paragraph_layout["char_spacing_pt"]), 2),
+                "space_before": round(float(paragraph_layout["space_before_pt"]), 2),
+                "space_after": round(float(paragraph_layout["space_after_pt"]), 2),
+                "line_count_estimated": int(paragraph_layout["line_count_estimated"]),
+                "estimated_height_pt": round(block_height_pt, 2),
+                "page_size": "A4",
+            }
+            if heading_level is not None:
+                metadata["heading_level"] = heading_level
 
-def build_source_parser(
-    config: IngestionConfig,
-    annotation_llm: LangChainIngestionAnnotationLLM | None = None,
-) -> SourceParser:
-    """설정 기반 SourceParser를 생성한다."""
-    return SourceParser(config=config, annotation_llm=annotation_llm)
+            blocks.append(
+                ExtractedBlock(
+                    source_file=path.as_posix(),
+                    page_num=page_num,
+                    block_type="heading" if heading_level is not None else "paragraph",
+                    text=text,
+                    metadata=metadata,
+                )
+            )
+            page_texts.setdefault(page_num, []).append(text)
+            continue
+
+        table = block
+        html = serialize_docx_table(table)
+        if not html:
+            continue
+        if not collect_tables:
+            continue
+
+        table_index += 1
+        table_height_pt = estimate_docx_table_height(
+            table=table,
+            body_font_size=body_font_size,
+            usable_width_pt=usable_width_pt,
+        )
+        page_num, current_page_num, used_height_pt = advance_docx_page_state(
+            current_page_num=current_page_num,
+            used_height_pt=used_height_pt,
+            block_height_pt=table_height_pt,
+            usable_height_pt=usable_height_pt,
+        )
+        table_block = ExtractedBlock(
+            source_file=path.as_posix(),
+            page_num=page_num,
+            block_type="table",
+            text="",
+            metadata={
+                "layout_type": "docx_table",
+                "page_num": page_num,
+                "block_type": "table",
+                "table_index": table_index,
+                "heading_tag": "BODY",
+                "body_font_size": round(float(body_font_size), 2),
+                "estimated_height_pt": round(float(table_height_pt), 2),
+                "page_size": "A4",
+            },
+        )
+        blocks.append(table_block)
+        # 주석 문맥은 표가 등장한 시점까지의 페이지 텍스트로 고정해 두고, 호출은 마지막에 모아서 실행한다.
+        pending_tables.append((table_block, html, "\n".join(page_texts.get(page_num, []))))
+    return blocks, pending_tables
+
+
+def _aggregate_failures(failures: list[tuple[Path, BaseException]]) -> BaseException:
+    """파일별 실패를 모아 첫 번째 예외에 나머지 실패 내역을 덧붙여 반환한다."""
+    first_path, first_error = failures[0]
+    if not isinstance(first_error, Exception):
+        # 취소/인터럽트는 집계하지 않고 그대로 전파한다.
+        return first_error
+    first_error.add_note(f"실패 파일: {first_path.as_posix()}")
+    for path, error in failures[1:]:
+        first_error.add_note(f"추가 실패 파일: {path.as_posix()} ({type(error).__name__}: {error})")
+    return first_error
+
+
+def _render_region(
+    page: pdfium.PdfPage,
+    pixel_box: list[int],
+    *,
+    image_width: int,
+    image_height: int,
+) -> pdfium.PdfBitmap:
+    """페이지 전체 렌더링 격자 기준 픽셀 bbox 영역만 비트맵으로 렌더링한다.
+
+    `render(crop=...)`는 각 변을 `ceil(pt * scale)` 픽셀만큼 잘라내므로,
+    픽셀 값을 scale로 나눈 포인트를 넘기면 전체 렌더링 후 자른 결과와 같은 영역이 나온다.
+    """
+    left, top, right, bottom = pixel_box
+    return page.render(
+        scale=_RENDER_SCALE,
+        crop=(
+            left / _RENDER_SCALE,
+            (image_height - bottom) / _RENDER_SCALE,
+            (image_width - right) / _RENDER_SCALE,
+            top / _RENDER_SCALE,
+        ),
+    )
+
+
+def _save_region_images(
+    images: list[tuple[Image.Image, Path]],
+    *,
+    max_edge: int,
+    lossless: bool,
+) -> None:
+    """렌더링한 bbox 이미지들을 저장한다.
+
+    최소 크기 기준은 `to_pixel_boxes`가 bbox 단계에서 이미 적용했으므로, 여기서는 긴 변만 max_edge로 줄인다.
+    저장 이미지는 주석 LLM 입력용이라 기본은 JPEG로 저장하고, lossless면 빠른 압축 수준의 PNG로 저장한다.
+    """
+    for image, image_path in images:
+        # thumbnail은 비율을 유지하며 제자리에서 줄이고, 이미 작으면 아무 작업도 하지 않는다.
+        image.thumbnail((max_edge, max_edge), Image.Resampling.BILINEAR)
+        if lossless:
+            image.save(str(image_path), format="PNG", optimize=False, compress_level=_PNG_COMPRESS_LEVEL)
+            continue
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        image.save(str(image_path), format="JPEG", quality=_JPEG_QUALITY, optimize=False)
 
 
 def _to_page_nodes(
@@ -478,29 +711,46 @@ def _to_page_nodes(
     parent_node_id: str,
     blocks: Iterable[ExtractedBlock],
 ) -> list[IngestionPageNode]:
-    doc_label = to_ltree_label(document_id)
-    parent_label = to_ltree_label(parent_node_id)
-
-    nodes: list[IngestionPageNode] = []
-    for index, block in enumerate(blocks, start=1):
-        node_id = uuid.uuid4().hex
-        path = f"{doc_label}.{parent_label}.p{max(1, block.page_num)}.b{index}"
-        metadata = dict(block.metadata)
-        metadata["source_file"] = block.source_file
-        metadata["block_type"] = block.block_type
-
-        image_url = str(metadata.get("image_path") or "").strip() or None
-
-        nodes.append(
-            IngestionPageNode(
-                node_id=node_id,
-                parent_node_id=parent_node_id,
-                document_id=document_id,
-                path=path,
-                content=block.text,
-                image_url=image_url,
-                metadata=metadata,
-            )
+    # 제너레이터 입력도 받을 수 있도록 한 번만 리스트로 만든다.
+    block_list = blocks if isinstance(blocks, list) else list(blocks)
+    # 경로의 문서/부모 라벨 부분은 모든 노드가 같으므로 접두어로 한 번만 만든다.
+    path_prefix = f"{to_ltree_label(document_id)}.{to_ltree_label(parent_node_id)}.p"
+    # 블록마다 uuid4()를 호출하는 대신 난수 바이트를 한 번에 받아 16바이트씩 잘라 node_id로 쓴다.
+    random_bytes = os.urandom(_NODE_ID_BYTES * len(block_list))
+
+    return [
+        _to_page_node(
+            block,
+            document_id=document_id,
+            parent_node_id=parent_node_id,
+            node_id=random_bytes[(index - 1) * _NODE_ID_BYTES : index * _NODE_ID_BYTES].hex(),
+            path=f"{path_prefix}{block.page_num if block.page_num > 0 else 1}.b{index}",
         )
+        for index, block in enumerate(block_list, start=1)
+    ]
 
-    return nodes
+
+def _to_page_node(
+    block: ExtractedBlock,
+    *,
+    document_id: str,
+    parent_node_id: str,
+    node_id: str,
+    path: str,
+) -> IngestionPageNode:
+    # 파싱 단계가 블록마다 새 metadata dict를 만들므로 복사하지 않고 그대로 갱신한다.
+    metadata = block.metadata
+    metadata["source_file"] = block.source_file
+    metadata["block_type"] = block.block_type
+
+    image_url = str(metadata.get("image_path") or "").strip() or None
+
+    return IngestionPageNode(
+        node_id=node_id,
+        parent_node_id=parent_node_id,
+        document_id=document_id,
+        path=path,
+        content=block.text,
+        image_url=image_url,
+        metadata=metadata,
+    )
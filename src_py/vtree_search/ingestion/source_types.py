@@ -20,7 +20,10 @@ from dataclasses import dataclass
 
 @dataclass(slots=True)
 class ExtractedBlock:
-    """문서에서 추출한 단일 블록 모델."""
+    """문서에서 추출한 단일 블록 모델.
+
+    metadata는 블록마다 새로 만든 dict이며 블록이 소유한다. 노드 변환 단계는 복사 없이 이 dict를 갱신한다.
+    """
 
     source_file: str
     page_num: int
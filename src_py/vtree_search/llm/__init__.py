@@ -4,6 +4,7 @@
 
 설명:
 - 검색 필터 DTO와 LangChain 어댑터를 외부에 노출한다.
+- LangChain 어댑터는 첫 접근 시점에 지연 import 해 DTO만 쓰는 경우 LangChain을 불러오지 않는다.
 
 디자인 패턴:
 - 모듈 퍼사드(Module Facade).
@@ -14,12 +15,38 @@
 - src_py/vtree_search/llm/langchain_ingestion.py
 """
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .contracts import (
     SearchFilterCandidate,
     SearchFilterDecision,
 )
-from .langchain_ingestion import LangChainIngestionAnnotationLLM
-from .langchain_search import LangChainSearchFilterLLM
+
+if TYPE_CHECKING:
+    from .langchain_ingestion import LangChainIngestionAnnotationLLM
+    from .langchain_search import LangChainSearchFilterLLM
+
+_LAZY_ATTRS: dict[str, str] = {
+    "LangChainIngestionAnnotationLLM": "vtree_search.llm.langchain_ingestion",
+    "LangChainSearchFilterLLM": "vtree_search.llm.langchain_search",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "SearchFilterCandidate",
@@ -4,6 +4,7 @@
 
 설명:
 - 표/이미지 입력을 프롬프트에 주입해 `[TBL]`/`[IMG]` 블록을 생성한다.
+- 파일 단위 주석은 `abatch` 한 번으로 묶어 보내, 배치를 지원하는 모델이 요청을 합쳐 처리할 수 있게 한다.
 - 응답 형식이 정의와 다르면 즉시 실패한다.
 
 디자인 패턴:
@@ -17,6 +18,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from pathlib import Path
 
 from langchain_core.prompts import ChatPromptTemplate
@@ -24,38 +26,42 @@ from langchain_core.prompts import ChatPromptTemplate
 from vtree_search.exceptions import IngestionProcessingError
 from vtree_search.ingestion.prompts import IMAGE_PROMPT, TABLE_PROMPT
 
+# 프롬프트 템플릿은 정적이므로 모듈 로드 시 한 번만 만들고 모든 인스턴스가 공유한다.
+_TABLE_TEMPLATE = ChatPromptTemplate.from_messages(
+    [
+        ("system", TABLE_PROMPT),
+        (
+            "human",
+            (
+                "page_text:\n{page_text}\n\n"
+                "table_html:\n{table_html}\n\n"
+                "형식 규칙을 지켜 출력하라."
+            ),
+        ),
+    ]
+)
+_IMAGE_TEMPLATE = ChatPromptTemplate.from_messages(
+    [
+        ("system", IMAGE_PROMPT),
+        (
+            "human",
+            (
+                "page_text:\n{page_text}\n\n"
+                "image_path:\n{image_path}\n\n"
+                "형식 규칙을 지켜 출력하라."
+            ),
+        ),
+    ]
+)
+
 
 class LangChainIngestionAnnotationLLM:
     """LangChain 채팅 모델을 적재 주석기로 감싸는 어댑터."""
 
     def __init__(self, chat_model) -> None:
         self._chat_model = chat_model
-        self._table_prompt = ChatPromptTemplate.from_messages(
-            [
-                ("system", TABLE_PROMPT),
-                (
-                    "human",
-                    (
-                        "page_text:\n{page_text}\n\n"
-                        "table_html:\n{table_html}\n\n"
-                        "형식 규칙을 지켜 출력하라."
-                    ),
-                ),
-            ]
-        )
-        self._image_prompt = ChatPromptTemplate.from_messages(
-            [
-                ("system", IMAGE_PROMPT),
-                (
-                    "human",
-                    (
-                        "page_text:\n{page_text}\n\n"
-                        "image_path:\n{image_path}\n\n"
-                        "형식 규칙을 지켜 출력하라."
-                    ),
-                ),
-            ]
-        )
+        self._table_prompt = _TABLE_TEMPLATE
+        self._image_prompt = _IMAGE_TEMPLATE
 
     async def annotate_table(self, *, table_html: str, page_text: str) -> str:
         prompt_value = self._table_prompt.invoke(
@@ -65,10 +71,7 @@ class LangChainIngestionAnnotationLLM:
             }
         )
         response = await self._chat_model.ainvoke(prompt_value)
-        text = _read_message_text(response)
-        if not text.startswith("[TBL]") or not text.endswith("[/TBL]"):
-            raise IngestionProcessingError("표 주석 LLM 응답 형식이 [TBL] 블록이 아닙니다")
-        return text
+        return _read_table_text(response)
 
     async def annotate_image(self, *, image_path: Path, page_text: str) -> str:
         prompt_value = self._image_prompt.invoke(
@@ -78,10 +81,54 @@ class LangChainIngestionAnnotationLLM:
             }
         )
         response = await self._chat_model.ainvoke(prompt_value)
-        text = _read_message_text(response)
-        if not text.startswith("[IMG]") or not text.endswith("[/IMG]"):
-            raise IngestionProcessingError("이미지 주석 LLM 응답 형식이 [IMG] 블록이 아닙니다")
-        return text
+        return _read_image_text(response)
+
+    async def annotate_batch(
+        self,
+        *,
+        tables: Sequence[tuple[str, str]] = (),
+        images: Sequence[tuple[Path, str]] = (),
+        max_concurrency: int,
+    ) -> tuple[list[str], list[str]]:
+        """`(table_html, page_text)`/`(image_path, page_text)` 목록을 한 번의 `abatch` 호출로 주석한다.
+
+        반환값은 입력 순서를 유지한 `(표 주석 목록, 이미지 주석 목록)`이다.
+        """
+        if not tables and not images:
+            return [], []
+
+        prompt_values = [
+            self._table_prompt.invoke({"table_html": table_html, "page_text": page_text})
+            for table_html, page_text in tables
+        ]
+        prompt_values.extend(
+            self._image_prompt.invoke({"image_path": image_path.as_posix(), "page_text": page_text})
+            for image_path, page_text in images
+        )
+        responses = await self._chat_model.abatch(
+            prompt_values,
+            config={"max_concurrency": max_concurrency},
+        )
+
+        table_count = len(tables)
+        return (
+            [_read_table_text(response) for response in responses[:table_count]],
+            [_read_image_text(response) for response in responses[table_count:]],
+        )
+
+
+def _read_table_text(message) -> str:
+    text = _read_message_text(message)
+    if not text.startswith("[TBL]") or not text.endswith("[/TBL]"):
+        raise IngestionProcessingError("표 주석 LLM 응답 형식이 [TBL] 블록이 아닙니다")
+    return text
+
+
+def _read_image_text(message) -> str:
+    text = _read_message_text(message)
+    if not text.startswith("[IMG]") or not text.endswith("[/IMG]"):
+        raise IngestionProcessingError("이미지 주석 LLM 응답 형식이 [IMG] 블록이 아닙니다")
+    return text
 
 
 def _read_message_text(message) -> str:
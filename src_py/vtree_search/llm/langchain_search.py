@@ -1,9 +1,10 @@
 """
 목적:
-- LangChain `ainvoke` 기반 검색 필터 어댑터를 제공한다.
+- LangChain `ainvoke`/`abatch` 기반 검색 필터 어댑터를 제공한다.
 
 설명:
 - 질문/후보 목록을 LLM에 전달해 후보별 keep/drop 판정을 JSON으로 받는다.
+- 워커 배치의 여러 잡은 `filter_many`로 모아 `abatch` 한 번에 제출한다.
 - 응답 형식 위반(잘못된 JSON/누락 node_id)은 즉시 오류로 처리한다.
 
 디자인 패턴:
@@ -16,9 +17,10 @@
 
 from __future__ import annotations
 
-import json
+from collections.abc import Sequence
 
 from langchain_core.prompts import ChatPromptTemplate
+from pydantic import TypeAdapter, ValidationError
 
 from vtree_search.exceptions import ConfigurationError
 from vtree_search.llm.contracts import (
@@ -26,31 +28,37 @@ from vtree_search.llm.contracts import (
     SearchFilterDecision,
 )
 
+_CANDIDATES_ADAPTER: TypeAdapter[list[SearchFilterCandidate]] = TypeAdapter(list[SearchFilterCandidate])
+_DECISIONS_ADAPTER: TypeAdapter[list[SearchFilterDecision]] = TypeAdapter(list[SearchFilterDecision])
+
+# 프롬프트 템플릿은 정적이므로 모듈 로드 시 한 번만 만들고 모든 인스턴스가 공유한다.
+_FILTER_TEMPLATE = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            (
+                "당신은 검색 후보 필터다. 반드시 JSON 배열만 반환한다. "
+                "각 항목 형식은 {{\"node_id\": str, \"keep\": bool, \"reason\": str}} 이다."
+            ),
+        ),
+        (
+            "human",
+            (
+                "질문:\n{question}\n\n"
+                "후보(JSON):\n{candidates_json}\n\n"
+                "모든 후보를 빠짐없이 1개씩 판단해 JSON 배열만 출력하라."
+            ),
+        ),
+    ]
+)
+
 
 class LangChainSearchFilterLLM:
     """LangChain 채팅 모델을 검색 필터로 감싸는 어댑터."""
 
     def __init__(self, chat_model) -> None:
         self._chat_model = chat_model
-        self._prompt = ChatPromptTemplate.from_messages(
-            [
-                (
-                    "system",
-                    (
-                        "당신은 검색 후보 필터다. 반드시 JSON 배열만 반환한다. "
-                        "각 항목 형식은 {\"node_id\": str, \"keep\": bool, \"reason\": str} 이다."
-                    ),
-                ),
-                (
-                    "human",
-                    (
-                        "질문:\n{question}\n\n"
-                        "후보(JSON):\n{candidates_json}\n\n"
-                        "모든 후보를 빠짐없이 1개씩 판단해 JSON 배열만 출력하라."
-                    ),
-                ),
-            ]
-        )
+        self._prompt = _FILTER_TEMPLATE
 
     async def filter(
         self,
@@ -58,30 +66,60 @@ class LangChainSearchFilterLLM:
         question: str,
         candidates: list[SearchFilterCandidate],
     ) -> list[SearchFilterDecision]:
-        candidates_json = json.dumps(
-            [candidate.model_dump() for candidate in candidates],
-            ensure_ascii=False,
-        )
-        prompt_value = self._prompt.invoke(
+        response = await self._chat_model.ainvoke(self._build_prompt(question, candidates))
+        return _parse_decisions(response, candidates)
+
+    async def filter_many(
+        self,
+        requests: Sequence[tuple[str, list[SearchFilterCandidate]]],
+    ) -> list[list[SearchFilterDecision] | Exception]:
+        """여러 `(질문, 후보 목록)` 요청을 채팅 모델 `abatch` 한 번으로 판정한다.
+
+        결과는 입력 순서를 유지한다. 요청별 실패는 예외를 던지지 않고 해당 위치에 예외 객체로 담는다.
+        """
+        if not requests:
+            return []
+
+        prompt_values = [self._build_prompt(question, candidates) for question, candidates in requests]
+        responses = await self._chat_model.abatch(prompt_values, return_exceptions=True)
+
+        outcomes: list[list[SearchFilterDecision] | Exception] = []
+        for (_, candidates), response in zip(requests, responses, strict=True):
+            if isinstance(response, Exception):
+                outcomes.append(response)
+                continue
+            try:
+                outcomes.append(_parse_decisions(response, candidates))
+            except (ConfigurationError, ValidationError) as exc:
+                outcomes.append(exc)
+        return outcomes
+
+    def _build_prompt(self, question: str, candidates: list[SearchFilterCandidate]):
+        # 후보 목록은 pydantic-core 직렬화기로 한 번에 JSON 문자열로 만든다(비 ASCII 문자는 그대로 유지).
+        candidates_json = _CANDIDATES_ADAPTER.dump_json(candidates).decode("utf-8")
+        return self._prompt.invoke(
             {
                 "question": question,
                 "candidates_json": candidates_json,
             }
         )
-        response = await self._chat_model.ainvoke(prompt_value)
-        response_text = _read_message_text(response)
 
-        try:
-            raw = json.loads(response_text)
-        except json.JSONDecodeError as exc:
-            raise ConfigurationError(f"검색 필터 LLM 응답 JSON 파싱 실패: {exc}") from exc
 
-        if not isinstance(raw, list):
-            raise ConfigurationError("검색 필터 LLM 응답은 JSON 배열이어야 합니다")
+def _parse_decisions(response, candidates: list[SearchFilterCandidate]) -> list[SearchFilterDecision]:
+    response_text = _read_message_text(response)
 
-        decisions = [SearchFilterDecision.model_validate(item) for item in raw]
-        _validate_decisions(candidates=candidates, decisions=decisions)
-        return decisions
+    # 중간 Python 객체 없이 JSON 파싱과 판정 모델 검증을 pydantic-core에서 한 번에 수행한다.
+    try:
+        decisions = _DECISIONS_ADAPTER.validate_json(response_text)
+    except ValidationError as exc:
+        error_type = exc.errors()[0]["type"] if exc.error_count() else ""
+        if error_type == "json_invalid":
+            raise ConfigurationError(f"검색 필터 LLM 응답 JSON 파싱 실패: {exc}") from exc
+        if error_type == "list_type":
+            raise ConfigurationError("검색 필터 LLM 응답은 JSON 배열이어야 합니다") from exc
+        raise
+    _validate_decisions(candidates=candidates, decisions=decisions)
+    return decisions
 
 
 def _read_message_text(message) -> str:
@@ -100,21 +138,19 @@ def _validate_decisions(
     candidates: list[SearchFilterCandidate],
     decisions: list[SearchFilterDecision],
 ) -> None:
-    expected_ids = {candidate.node_id for candidate in candidates}
-    seen_ids: set[str] = set()
+    # 후보 node_id를 한 번 적재하고 판정마다 제거해 미지/중복/누락을 단일 dict로 검사한다.
+    remaining = dict.fromkeys(candidate.node_id for candidate in candidates)
 
     for decision in decisions:
-        if decision.node_id not in expected_ids:
-            raise ConfigurationError(
-                f"검색 필터 LLM 응답 node_id가 후보 집합에 없습니다: {decision.node_id}"
-            )
-        if decision.node_id in seen_ids:
-            raise ConfigurationError(
-                f"검색 필터 LLM 응답 node_id가 중복되었습니다: {decision.node_id}"
-            )
-        seen_ids.add(decision.node_id)
-
-    missing_ids = expected_ids - seen_ids
-    if missing_ids:
-        missing_joined = ", ".join(sorted(missing_ids))
+        node_id = decision.node_id
+        if node_id in remaining:
+            del remaining[node_id]
+            continue
+        # 오류 경로에서만 후보 목록을 다시 훑어 미지/중복 원인을 구분한다.
+        if any(candidate.node_id == node_id for candidate in candidates):
+            raise ConfigurationError(f"검색 필터 LLM 응답 node_id가 중복되었습니다: {node_id}")
+        raise ConfigurationError(f"검색 필터 LLM 응답 node_id가 후보 집합에 없습니다: {node_id}")
+
+    if remaining:
+        missing_joined = ", ".join(sorted(remaining))
         raise ConfigurationError(f"검색 필터 LLM 응답 누락 node_id: {missing_joined}")
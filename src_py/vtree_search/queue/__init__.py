@@ -12,6 +12,11 @@
 - src_py/vtree_search/queue/redis_streams.py
 """
 
-from .redis_streams import QueueMessage, RedisSearchQueue
+from .redis_streams import (
+    AsyncRedisSearchQueue,
+    QueueMessage,
+    RedisSearchQueue,
+    decode_result_json,
+)
 
-__all__ = ["RedisSearchQueue", "QueueMessage"]
+__all__ = ["RedisSearchQueue", "AsyncRedisSearchQueue", "QueueMessage", "decode_result_json"]
@@ -4,7 +4,12 @@
 
 설명:
 - 작업 제출, 소비자 그룹 읽기, ACK, DLQ, 잡 상태 해시 저장을 담당한다.
+- 함께 실행되는 명령(잡 해시 갱신 + 스트림 적재)은 파이프라인 한 번의 왕복으로 보낸다.
+- 워커의 처리 시작(잡 조회 + 취소 확인 + RUNNING 전이)은 Lua 스크립트로 원자적으로 수행한다.
+- 커넥션 풀은 접속 정보가 같은 큐 인스턴스끼리 프로세스 단위로 공유한다.
 - 라이브러리 계층에서 큐 포화 조건을 검사해 빠른 거절을 지원한다.
+- `result_compress_min_bytes`가 0보다 크면 그 이상 크기의 result_json을 zstd로 압축해 저장한다.
+  (선택 의존성 `zstandard`, 미설치 상태로 압축을 켜면 큐 생성 시점에 실패한다)
 
 디자인 패턴:
 - 저장소 패턴(Repository Pattern).
@@ -16,13 +21,98 @@
 
 from __future__ import annotations
 
-import json
+import threading
+import time
+from base64 import b64decode, b64encode
+from collections.abc import Sequence
 from dataclasses import dataclass
-from datetime import UTC, datetime
+from functools import partial
+from itertools import chain
 from typing import Any
 
+from pydantic_core import to_json
+
 from vtree_search.config.models import RedisQueueConfig
-from vtree_search.exceptions import ConfigurationError, DependencyUnavailableError, QueueOverloadedError
+from vtree_search.exceptions import (
+    ConfigurationError,
+    DependencyUnavailableError,
+    QueueOverloadedError,
+)
+from vtree_search.shared.clock import utc_now_iso
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - 선택 의존성
+    zstandard: Any = None
+
+# 접속 정보별 공유 커넥션 풀. 생성 경합은 락으로 막는다.
+_POOLS: dict[tuple[object, ...], Any] = {}
+_POOLS_LOCK = threading.Lock()
+
+_JOB_KEY_PREFIX = "job:"
+
+# 압축 저장한 result_json 접두어. decode_responses 클라이언트가 str로 읽도록 zstd 프레임을 base64로 담는다.
+_ZSTD_PREFIX = "zstd:"
+_ZSTD_LEVEL = 3
+
+# XREADGROUP의 CLAIM 옵션(유휴 pending 항목을 새 메시지와 함께 회수)을 지원하는 최소 서버 버전.
+_READ_CLAIM_MIN_VERSION = (8, 4)
+
+# KEYS[1]=잡 해시 키, ARGV[1]=현재 시각, ARGV[2]=메시지 retries(없으면 ""), ARGV[3]=TTL(초),
+# ARGV[4]=payload_json 반환 여부("1"/"0").
+# 잡이 없으면 nil, 취소 요청이 있으면 CANCELED로, 아니면 RUNNING으로 전이한 뒤
+# {상태, retries, payload_json, module_name}을 돌려준다. payload를 반환하지 않으면 빈 문자열을 넣는다.
+_BEGIN_PROCESSING_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+  return nil
+end
+local fields
+if ARGV[4] == '1' then
+  fields = redis.call('HMGET', KEYS[1], 'canceled', 'retries', 'payload_json', 'module_name')
+else
+  fields = redis.call('HMGET', KEYS[1], 'canceled', 'retries', 'module_name')
+  fields[4] = fields[3]
+  fields[3] = false
+end
+local retries = ARGV[2]
+if retries == '' then
+  retries = fields[2] or ''
+end
+if retries == '' then
+  retries = '0'
+end
+if fields[1] == '1' then
+  redis.call('HSET', KEYS[1], 'state', 'CANCELED', 'canceled', '1', 'completed_at', ARGV[1], 'updated_at', ARGV[1])
+  redis.call('EXPIRE', KEYS[1], ARGV[3])
+  return {'CANCELED', retries, fields[3] or '', fields[4] or ''}
+end
+redis.call('HSET', KEYS[1], 'state', 'RUNNING', 'retries', retries, 'updated_at', ARGV[1])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return {'RUNNING', retries, fields[3] or '', fields[4] or ''}
+"""
+
+# KEYS[1]=잡 해시 키, ARGV[1]=TTL(초), ARGV[2..]=필드/값 쌍. HSET과 EXPIRE를 한 번의 명령으로 적용한다.
+_HSET_EXPIRE_LUA = """
+redis.call('HSET', KEYS[1], unpack(ARGV, 2))
+return redis.call('EXPIRE', KEYS[1], ARGV[1])
+"""
+
+# KEYS[1]=지연 재시도 ZSET, KEYS[2]=검색 스트림, ARGV[1]=현재 시각(ms), ARGV[2]=최대 이동 수, ARGV[3]=스트림 MAXLEN.
+# 실행 시각이 지난 재시도 메시지(멤버=필드 JSON)를 스트림으로 옮기고 {옮긴 수, 다음 실행 시각(ms) 또는 nil}을 돌려준다.
+_PROMOTE_DUE_LUA = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+for _, member in ipairs(due) do
+  local args = {}
+  for field, value in pairs(cjson.decode(member)) do
+    args[#args + 1] = field
+    args[#args + 1] = value
+  end
+  redis.call('XADD', KEYS[2], 'MAXLEN', '~', ARGV[3], '*', unpack(args))
+  redis.call('ZREM', KEYS[1], member)
+end
+local head = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+return {#due, head[2] or false}
+"""
 
 
 @dataclass(slots=True)
@@ -34,12 +124,28 @@ class QueueMessage:
     fields: dict[str, str]
 
 
+@dataclass(slots=True)
+class JobStart:
+    """워커 처리 시작 시점의 잡 상태 모델."""
+
+    state: str
+    retries: int
+    payload_json: str
+    module_name: str
+
+
 class RedisSearchQueue:
-    """검색 작업용 Redis Streams 큐 매니저."""
+    """검색 작업용 Redis Streams 큐 매니저.
+
+    제출/상태 조회/취소 경로를 담당하며, 워커의 읽기/상태 전이/ACK는 `AsyncRedisSearchQueue`가 맡는다.
+    """
 
     def __init__(self, config: RedisQueueConfig) -> None:
+        _require_result_codec(config)
         self._config = config
         self._redis = self._create_client(config)
+        # register_script는 EVALSHA를 먼저 시도하고 NOSCRIPT일 때만 본문을 보낸다.
+        self._hset_expire = self._redis.register_script(_HSET_EXPIRE_LUA)
 
     @staticmethod
     def _create_client(config: RedisQueueConfig):
@@ -48,15 +154,7 @@ class RedisSearchQueue:
         except Exception as exc:  # pragma: no cover - 런타임 환경 의존
             raise DependencyUnavailableError(f"redis 패키지를 불러오지 못했습니다: {exc}") from exc
 
-        return redis.Redis(
-            host=config.host,
-            port=config.port,
-            db=config.db,
-            username=config.username,
-            password=config.password,
-            ssl=config.use_ssl,
-            decode_responses=True,
-        )
+        return redis.Redis(connection_pool=_get_pool(redis, config))
 
     @property
     def config(self) -> RedisQueueConfig:
@@ -74,9 +172,8 @@ class RedisSearchQueue:
             )
         except Exception as exc:
             message = str(exc)
-            if "BUSYGROUP" in message:
-                return
-            raise ConfigurationError(f"Redis consumer group 생성 실패: {exc}") from exc
+            if "BUSYGROUP" not in message:
+                raise ConfigurationError(f"Redis consumer group 생성 실패: {exc}") from exc
 
     def queue_depth(self) -> int:
         """현재 검색 큐 길이를 반환한다."""
@@ -94,141 +191,35 @@ class RedisSearchQueue:
                 f"큐 포화 상태입니다: depth={depth}, reject_at={self._config.queue_reject_at}"
             )
 
-    def create_job_record(self, job_id: str, payload_json: str, module_name: str) -> None:
-        """잡 상태 해시를 초기화한다."""
-        now = _utc_now()
-        key = self._job_key(job_id)
-
-        mapping = {
-            "job_id": job_id,
-            "state": "PENDING",
-            "retries": "0",
-            "canceled": "0",
-            "created_at": now,
-            "updated_at": now,
-            "module_name": module_name,
-            "payload_json": payload_json,
-            "last_error": "",
-            "result_json": "",
-        }
-
-        self._redis.hset(key, mapping=mapping)
-        self._redis.expire(key, self._config.result_ttl_sec)
-
-    def enqueue(
-        self,
-        job_id: str,
-        payload_json: str,
-        retries: int = 0,
-        module_name: str = "",
-    ) -> str:
-        """검색 큐에 작업을 추가한다."""
-        self._truncate_if_needed()
-
-        fields = {
-            "job_id": job_id,
-            "payload_json": payload_json,
-            "retries": str(retries),
-            "module_name": module_name,
-            "enqueued_at": _utc_now(),
-        }
-
-        message_id = self._redis.xadd(self._config.stream_search, fields=fields)
-        return str(message_id)
-
-    def read(self, consumer_name: str, count: int = 1) -> list[QueueMessage]:
-        """소비자 그룹에서 작업을 읽는다."""
-        response = self._redis.xreadgroup(
-            groupname=self._config.consumer_group,
-            consumername=consumer_name,
-            streams={self._config.stream_search: ">"},
-            count=count,
-            block=self._config.worker_block_ms,
-        )
-
-        messages: list[QueueMessage] = []
-        for stream, items in response:
-            for message_id, fields in items:
-                field_map = {str(key): str(value) for key, value in fields.items()}
-                messages.append(
-                    QueueMessage(
-                        stream=str(stream),
-                        message_id=str(message_id),
-                        fields=field_map,
-                    )
-                )
-
-        return messages
-
-    def ack(self, message: QueueMessage) -> None:
-        """처리 완료된 메시지를 ACK 한다."""
-        self._redis.xack(message.stream, self._config.consumer_group, message.message_id)
-
-    def move_to_dlq(self, message: QueueMessage, error_message: str) -> None:
-        """실패 메시지를 DLQ로 이동한다."""
-        fields = dict(message.fields)
-        fields["moved_at"] = _utc_now()
-        fields["error"] = error_message
-        self._redis.xadd(self._config.stream_search_dlq, fields=fields)
-
-    def get_job_record(self, job_id: str) -> dict[str, str] | None:
-        """잡 상태 해시를 조회한다."""
-        values = self._redis.hgetall(self._job_key(job_id))
-        if not values:
-            return None
-        return {str(key): str(value) for key, value in values.items()}
-
-    def update_job_record(self, job_id: str, mapping: dict[str, Any]) -> None:
-        """잡 상태 해시를 부분 업데이트한다."""
+    def submit_job(self, job_id: str, payload_json: str | bytes, module_name: str) -> str:
+        """잡 상태 해시 초기화와 큐 적재를 파이프라인 한 번의 왕복으로 처리한다."""
+        now = utc_now_iso()
         key = self._job_key(job_id)
-        normalized = {str(key_): _normalize(value) for key_, value in mapping.items()}
-        normalized["updated_at"] = _utc_now()
-        self._redis.hset(key, mapping=normalized)
-        self._redis.expire(key, self._config.result_ttl_sec)
-
-    def mark_succeeded(self, job_id: str, result: dict[str, Any]) -> None:
-        """잡을 성공 상태로 마킹한다."""
-        self.update_job_record(
-            job_id,
-            {
-                "state": "SUCCEEDED",
-                "result_json": json.dumps(result, ensure_ascii=False),
-                "completed_at": _utc_now(),
-                "last_error": "",
-            },
-        )
-
-    def mark_failed(self, job_id: str, error_message: str, retries: int) -> None:
-        """잡을 실패 상태로 마킹한다."""
-        self.update_job_record(
-            job_id,
-            {
-                "state": "FAILED",
-                "retries": str(retries),
-                "last_error": error_message,
-                "completed_at": _utc_now(),
-            },
-        )
-
-    def mark_running(self, job_id: str, retries: int) -> None:
-        """잡을 실행 상태로 마킹한다."""
-        self.update_job_record(
-            job_id,
-            {
-                "state": "RUNNING",
-                "retries": str(retries),
-            },
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.hset(key, mapping=_new_job_mapping(job_id, payload_json, module_name, now))
+        pipe.expire(key, self._config.result_ttl_sec)
+        pipe.xadd(
+            self._config.stream_search,
+            fields=_message_fields(job_id, payload_json, 0, module_name, now),
+            maxlen=self._config.queue_max_len,
+            approximate=True,
         )
-
-    def mark_pending_retry(self, job_id: str, retries: int, error_message: str) -> None:
-        """재시도를 위해 잡을 대기 상태로 되돌린다."""
-        self.update_job_record(
-            job_id,
-            {
-                "state": "PENDING",
-                "retries": str(retries),
-                "last_error": error_message,
-            },
+        return str(pipe.execute()[-1])
+
+    def get_job_fields(self, job_id: str, fields: Sequence[str]) -> dict[str, str] | None:
+        """잡 상태 해시에서 필요한 필드만 HMGET으로 조회한다.
+
+        값이 없는 필드는 결과에서 빠지며, 해시가 없으면 None을 반환한다.
+        """
+        values = self._redis.hmget(self._job_key(job_id), fields)
+        record = {field: value for field, value in zip(fields, values, strict=True) if value is not None}
+        return record or None
+
+    def update_job_record(self, job_id: str, mapping: dict[str, str]) -> None:
+        """잡 상태 해시를 부분 업데이트한다. 값은 호출부에서 문자열로 만들어 넘긴다."""
+        self._hset_expire(
+            keys=[self._job_key(job_id)],
+            args=[self._config.result_ttl_sec, "updated_at", utc_now_iso(), *chain.from_iterable(mapping.items())],
         )
 
     def mark_canceled(self, job_id: str) -> None:
@@ -238,7 +229,7 @@ class RedisSearchQueue:
             {
                 "state": "CANCELED",
                 "canceled": "1",
-                "completed_at": _utc_now(),
+                "completed_at": utc_now_iso(),
             },
         )
 
@@ -251,27 +242,437 @@ class RedisSearchQueue:
             },
         )
 
-    def _truncate_if_needed(self) -> None:
-        current = self.queue_depth()
-        if current <= self._config.queue_max_len:
+    @staticmethod
+    def _job_key(job_id: str) -> str:
+        return _JOB_KEY_PREFIX + job_id
+
+
+class AsyncRedisSearchQueue:
+    """워커 경로용 `redis.asyncio` 기반 검색 큐.
+
+    명령이 코루틴으로 실행되므로 Redis 왕복 동안 이벤트 루프가 다른 메시지를 처리할 수 있다.
+    커넥션은 처음 사용한 이벤트 루프에 묶이므로 루프마다 별도 인스턴스를 만든다.
+    같은 이유로 `_get_pool`의 프로세스 공유 풀을 쓰지 않고 인스턴스마다 전용 풀을 만든다.
+    공유하면 다른 루프의 커넥션을 재사용하게 되므로, 인스턴스를 버릴 때 `aclose()`로 풀을 함께 닫는다.
+    """
+
+    def __init__(self, config: RedisQueueConfig) -> None:
+        _require_result_codec(config)
+        self._config = config
+        self._redis = self._create_client(config)
+        self._begin_processing = self._redis.register_script(_BEGIN_PROCESSING_LUA)
+        self._promote_due = self._redis.register_script(_PROMOTE_DUE_LUA)
+        self._xreadgroup = _bind_xreadgroup(self._redis, config, claim=False)
+        self._read_claim_checked = False
+
+    @staticmethod
+    def _create_client(config: RedisQueueConfig):
+        try:
+            import redis.asyncio as redis_asyncio
+        except Exception as exc:  # pragma: no cover - 런타임 환경 의존
+            raise DependencyUnavailableError(f"redis 패키지를 불러오지 못했습니다: {exc}") from exc
+
+        connection_kwargs: dict[str, Any] = {
+            "host": config.host,
+            "port": config.port,
+            "db": config.db,
+            "username": config.username,
+            "password": config.password,
+            "decode_responses": True,
+        }
+        if config.use_ssl:
+            connection_kwargs["connection_class"] = redis_asyncio.SSLConnection
+        pool = redis_asyncio.BlockingConnectionPool(
+            max_connections=config.pool_max,
+            **connection_kwargs,
+        )
+        return redis_asyncio.Redis(connection_pool=pool)
+
+    @property
+    def config(self) -> RedisQueueConfig:
+        """큐 설정 객체를 반환한다."""
+        return self._config
+
+    async def read(self, consumer_name: str, count: int = 1, block_ms: int | None = None) -> list[QueueMessage]:
+        """소비자 그룹에서 작업을 읽는다. `block_ms`를 주면 이번 읽기의 BLOCK 시간만 바꾼다."""
+        if not self._read_claim_checked:
+            await self._enable_read_claim()
+        response = await self._xreadgroup(
+            consumername=consumer_name,
+            count=count,
+            block=self._config.worker_block_ms if block_ms is None else block_ms,
+        )
+        return _to_messages(response)
+
+    async def _enable_read_claim(self) -> None:
+        """서버가 XREADGROUP CLAIM을 지원하면 읽기 한 번으로 유휴 pending 항목도 회수하도록 전환한다.
+
+        확인에 성공할 때까지 읽기 전에 확인한다.
+
+        Raises:
+            ConfigurationError: 서버 버전 확인(`INFO server`)에 실패한 경우.
+        """
+        if self._config.claim_idle_ms == 0:
+            self._read_claim_checked = True
             return
+        try:
+            server_info = await self._redis.info("server")
+        except Exception as exc:
+            raise ConfigurationError(
+                f"XREADGROUP CLAIM 지원 확인(INFO server) 실패, claim_idle_ms=0으로 비활성화할 수 있습니다: {exc}"
+            ) from exc
+        self._read_claim_checked = True
+        if _supports_read_claim(server_info):
+            self._xreadgroup = _bind_xreadgroup(self._redis, self._config, claim=True)
+
+    async def begin_processing_many(
+        self,
+        jobs: list[tuple[str, str | None, bool]],
+    ) -> list[JobStart | None]:
+        """`(job_id, message_retries, with_payload)` 목록의 처리 시작을 파이프라인 한 번의 왕복으로 수행한다.
+
+        결과는 입력 순서를 유지하며, 스크립트가 아직 캐시되지 않았으면 파이프라인이 먼저 적재한다.
+        """
+        if not jobs:
+            return []
+
+        now = utc_now_iso()
+        pipe = self._redis.pipeline(transaction=False)
+        for job_id, message_retries, with_payload in jobs:
+            await self._begin_processing(
+                keys=[RedisSearchQueue._job_key(job_id)],
+                args=[now, message_retries or "", self._config.result_ttl_sec, "1" if with_payload else "0"],
+                client=pipe,
+            )
+        return [_to_job_start(response) for response in await pipe.execute()]
 
-        self._redis.xtrim(
-            name=self._config.stream_search,
-            maxlen=self._config.queue_max_len,
-            approximate=True,
+    async def requeue_for_retry(
+        self,
+        job_id: str,
+        payload_json: str,
+        retries: int,
+        error_message: str,
+        module_name: str = "",
+        delay_ms: int = 0,
+        *,
+        pipe: Any | None = None,
+    ) -> str | None:
+        """잡을 대기 상태로 되돌리고 재적재하는 작업을 파이프라인 한 번의 왕복으로 처리한다.
+
+        `delay_ms`가 0보다 크면 스트림 대신 지연 재시도 ZSET에 넣고 None을 반환한다.
+        실행 시각이 지난 항목은 `promote_due_retries`가 스트림으로 옮긴다.
+        `pipe`를 주면 명령을 그 파이프라인에 쌓기만 하고 None을 반환한다(실행은 호출부 몫).
+        """
+        if pipe is not None:
+            _stage_retry(pipe, self._config, job_id, payload_json, retries, error_message, module_name, delay_ms)
+            return None
+        pipe = self._redis.pipeline(transaction=False)
+        _stage_retry(pipe, self._config, job_id, payload_json, retries, error_message, module_name, delay_ms)
+        response = (await pipe.execute())[-1]
+        return None if delay_ms > 0 else str(response)
+
+    def pipeline(self) -> Any:
+        """워커 배치 하나의 후처리 명령을 모아 한 번에 보낼 비트랜잭션 파이프라인을 만든다."""
+        return self._redis.pipeline(transaction=False)
+
+    async def promote_due_retries(self, limit: int) -> int | None:
+        """실행 시각이 지난 지연 재시도를 최대 `limit`개 스트림으로 옮긴다.
+
+        Returns:
+            남은 지연 재시도 중 가장 이른 실행 시각(epoch ms). 남은 항목이 없으면 None.
+        """
+        _, next_due_ms = await self._promote_due(
+            keys=[self._config.stream_search_delayed, self._config.stream_search],
+            args=[time.time_ns() // 1_000_000, limit, self._config.queue_max_len],
         )
+        return None if next_due_ms is None else int(float(next_due_ms))
 
-    @staticmethod
-    def _job_key(job_id: str) -> str:
-        return f"job:{job_id}"
+    async def ack_many(self, messages: Sequence[QueueMessage], *, pipe: Any | None = None) -> None:
+        """메시지를 스트림별로 묶어 XACK + XDEL을 파이프라인 한 번의 왕복으로 처리한다.
 
+        처리가 끝난 항목은 스트림에서도 지워 XLEN이 실제 대기 적체만 반영하게 한다.
+        `pipe`를 주면 명령을 쌓기만 하고 실행하지 않는다.
+        """
+        if not messages:
+            return
 
-def _utc_now() -> str:
-    return datetime.now(tz=UTC).isoformat()
+        ids_by_stream: dict[str, list[str]] = {}
+        for message in messages:
+            ids_by_stream.setdefault(message.stream, []).append(message.message_id)
+
+        target = self._redis.pipeline(transaction=False) if pipe is None else pipe
+        for stream, message_ids in ids_by_stream.items():
+            target.xack(stream, self._config.consumer_group, *message_ids)
+            target.xdel(stream, *message_ids)
+        if pipe is None:
+            await target.execute()
+
+    async def finalize_success(
+        self,
+        message: QueueMessage,
+        job_id: str,
+        result: dict[str, Any],
+        *,
+        ack: bool = True,
+        pipe: Any | None = None,
+    ) -> None:
+        """성공 마킹과 메시지 ACK를 파이프라인 한 번의 왕복으로 처리한다.
+
+        `ack=False`면 ACK를 생략한다(호출부가 `ack_many`로 모아서 처리).
+        `pipe`를 주면 명령을 쌓기만 하고 실행하지 않는다.
+        """
+        now = utc_now_iso()
+        key = RedisSearchQueue._job_key(job_id)
+        target = self._redis.pipeline(transaction=False) if pipe is None else pipe
+        target.hset(key, "updated_at", now, mapping=_succeeded_mapping(result, now, self._config.result_compress_min_bytes))
+        target.expire(key, self._config.result_ttl_sec)
+        if ack:
+            target.xack(message.stream, self._config.consumer_group, message.message_id)
+        if pipe is None:
+            await target.execute()
+
+    async def finalize_failure(
+        self,
+        message: QueueMessage,
+        job_id: str,
+        *,
+        error_message: str,
+        retries: int,
+        dlq_error: str | None = None,
+        ack: bool = True,
+        pipe: Any | None = None,
+    ) -> None:
+        """실패 마킹, DLQ 이동, 메시지 ACK를 파이프라인 한 번의 왕복으로 처리한다.
+
+        `dlq_error`를 주지 않으면 DLQ 항목에도 `error_message`를 기록한다. `ack`/`pipe`는 `finalize_success`와 같다.
+        """
+        now = utc_now_iso()
+        key = RedisSearchQueue._job_key(job_id)
+        target = self._redis.pipeline(transaction=False) if pipe is None else pipe
+        target.hset(key, "updated_at", now, mapping=_failed_mapping(error_message, retries, now))
+        target.expire(key, self._config.result_ttl_sec)
+        target.xadd(
+            self._config.stream_search_dlq,
+            fields=_dlq_fields(message, error_message if dlq_error is None else dlq_error, now),
+        )
+        if ack:
+            target.xack(message.stream, self._config.consumer_group, message.message_id)
+        if pipe is None:
+            await target.execute()
+
+    async def aclose(self) -> None:
+        """클라이언트와 전용 커넥션 풀을 닫는다. 이 큐를 만든 이벤트 루프에서 호출해야 한다."""
+        # 풀을 직접 넘겨 만든 클라이언트는 기본값으로 풀을 닫지 않으므로 명시한다.
+        await self._redis.aclose(close_connection_pool=True)
+
+
+def _stage_retry(
+    pipe: Any,
+    config: RedisQueueConfig,
+    job_id: str,
+    payload_json: str,
+    retries: int,
+    error_message: str,
+    module_name: str,
+    delay_ms: int,
+) -> None:
+    """재시도 상태 갱신과 재적재(즉시 XADD 또는 지연 ZADD) 명령을 파이프라인에 쌓는다."""
+    now = utc_now_iso()
+    key = RedisSearchQueue._job_key(job_id)
+    fields = _message_fields(job_id, payload_json, retries, module_name, now)
+    pipe.hset(key, "updated_at", now, mapping=_pending_retry_mapping(retries, error_message))
+    pipe.expire(key, config.result_ttl_sec)
+    if delay_ms > 0:
+        available_at_ms = time.time_ns() // 1_000_000 + delay_ms
+        pipe.zadd(config.stream_search_delayed, {to_json(fields).decode(): available_at_ms})
+        return
+    pipe.xadd(
+        config.stream_search,
+        fields=fields,
+        maxlen=config.queue_max_len,
+        approximate=True,
+    )
+
+
+def _bind_xreadgroup(client: Any, config: RedisQueueConfig, *, claim: bool) -> Any:
+    """읽기마다 바뀌지 않는 XREADGROUP 인자(그룹, 스트림 맵, 블록 시간, CLAIM)를 한 번만 묶어 둔다."""
+    kwargs: dict[str, Any] = {
+        "groupname": config.consumer_group,
+        "streams": {config.stream_search: ">"},
+        "block": config.worker_block_ms,
+    }
+    if claim:
+        kwargs["claim_min_idle_time"] = config.claim_idle_ms
+    return partial(client.xreadgroup, **kwargs)
+
+
+def _supports_read_claim(server_info: dict[str, Any]) -> bool:
+    version = str(server_info.get("redis_version", ""))
+    try:
+        major_minor = tuple(int(part) for part in version.split(".")[:2])
+    except ValueError:
+        return False
+    return major_minor >= _READ_CLAIM_MIN_VERSION
+
+
+def _to_messages(response: Any) -> list[QueueMessage]:
+    # decode_responses=True 클라이언트는 스트림/ID/필드를 이미 str dict로 돌려주므로 복사 없이 그대로 담는다.
+    # CLAIM으로 회수된 항목은 (ID, 필드, 유휴 시간, 전달 횟수)이며, 스트림에서 지워진 항목은 필드가 비어 있다.
+    return [
+        QueueMessage(stream=stream, message_id=message_id, fields=fields or {})
+        for stream, items in response or []
+        for message_id, fields, *_ in items
+        if message_id is not None
+    ]
+
+
+def _to_job_start(response: Any) -> JobStart | None:
+    if response is None:
+        return None
+    state, retries, payload_json, module_name = (str(value) for value in response)
+    return JobStart(
+        state=state,
+        retries=int(retries or "0"),
+        payload_json=payload_json,
+        module_name=module_name,
+    )
+
+
+def _get_pool(redis_module: Any, config: RedisQueueConfig) -> Any:
+    """접속 정보가 같은 큐 인스턴스가 함께 쓰는 BlockingConnectionPool을 반환한다."""
+    pool_key = (
+        config.host,
+        config.port,
+        config.db,
+        config.use_ssl,
+        config.username,
+        config.password,
+        config.pool_max,
+    )
+    with _POOLS_LOCK:
+        pool = _POOLS.get(pool_key)
+        if pool is None:
+            connection_kwargs: dict[str, Any] = {
+                "host": config.host,
+                "port": config.port,
+                "db": config.db,
+                "username": config.username,
+                "password": config.password,
+                "decode_responses": True,
+            }
+            if config.use_ssl:
+                connection_kwargs["connection_class"] = redis_module.SSLConnection
+            pool = redis_module.BlockingConnectionPool(
+                max_connections=config.pool_max,
+                **connection_kwargs,
+            )
+            _POOLS[pool_key] = pool
+        return pool
+
+
+def _new_job_mapping(
+    job_id: str,
+    payload_json: str | bytes,
+    module_name: str,
+    now: str,
+) -> dict[str, str | bytes]:
+    return {
+        "job_id": job_id,
+        "state": "PENDING",
+        "retries": "0",
+        "canceled": "0",
+        "created_at": now,
+        "updated_at": now,
+        "module_name": module_name,
+        "payload_json": payload_json,
+        "last_error": "",
+        "result_json": "",
+    }
+
+
+def _message_fields(
+    job_id: str,
+    payload_json: str | bytes,
+    retries: int,
+    module_name: str,
+    now: str,
+) -> dict[str, str | bytes]:
+    return {
+        "job_id": job_id,
+        "payload_json": payload_json,
+        "retries": str(retries),
+        "module_name": module_name,
+        "enqueued_at": now,
+    }
+
+
+def _require_result_codec(config: RedisQueueConfig) -> None:
+    """result_json 압축이 켜져 있으면 `zstandard` 설치 여부를 큐 생성 시점에 확인한다.
+
+    압축을 켠 워커와 미설치 API가 섞이면 조회 시점에야 실패하므로, 설정 단계에서 먼저 드러낸다.
+
+    Raises:
+        DependencyUnavailableError: `result_compress_min_bytes > 0`인데 `zstandard`가 없는 경우.
+    """
+    if config.result_compress_min_bytes and zstandard is None:
+        raise DependencyUnavailableError(
+            "result_compress_min_bytes > 0 이면 zstandard 패키지가 필요합니다 "
+            "(`vtree-search[zstd]` 설치 또는 0으로 비활성화)"
+        )
 
 
-def _normalize(value: Any) -> str:
-    if value is None:
-        return ""
-    return str(value)
+def decode_result_json(value: str) -> str | bytes:
+    """저장된 result_json을 JSON 텍스트로 되돌린다. 압축되지 않은 값은 그대로 반환한다.
+
+    Raises:
+        ValueError: 압축 값의 base64/zstd 프레임이 손상된 경우.
+        DependencyUnavailableError: 압축 값인데 `zstandard`가 설치되어 있지 않은 경우.
+    """
+    if not value.startswith(_ZSTD_PREFIX):
+        return value
+    if zstandard is None:
+        raise DependencyUnavailableError("zstd로 압축된 result_json을 읽으려면 zstandard 패키지가 필요합니다")
+    try:
+        return zstandard.decompress(b64decode(value[len(_ZSTD_PREFIX) :], validate=True))
+    except (ValueError, zstandard.ZstdError) as exc:
+        raise ValueError(f"압축된 result_json 해제 실패: {exc}") from exc
+
+
+def _encode_result_json(result: dict[str, Any], compress_min_bytes: int) -> str:
+    raw = to_json(result)
+    if compress_min_bytes and len(raw) >= compress_min_bytes:
+        return _ZSTD_PREFIX + b64encode(zstandard.compress(raw, _ZSTD_LEVEL)).decode("ascii")
+    return raw.decode()
+
+
+def _succeeded_mapping(result: dict[str, Any], now: str, compress_min_bytes: int) -> dict[str, str]:
+    return {
+        "state": "SUCCEEDED",
+        "result_json": _encode_result_json(result, compress_min_bytes),
+        "completed_at": now,
+        "last_error": "",
+    }
+
+
+def _pending_retry_mapping(retries: int, error_message: str) -> dict[str, str]:
+    return {
+        "state": "PENDING",
+        "retries": str(retries),
+        "last_error": error_message,
+    }
+
+
+def _failed_mapping(error_message: str, retries: int, now: str) -> dict[str, str]:
+    return {
+        "state": "FAILED",
+        "retries": str(retries),
+        "last_error": error_message,
+        "completed_at": now,
+    }
+
+
+def _dlq_fields(message: QueueMessage, error_message: str, now: str) -> dict[str, str]:
+    fields = dict(message.fields)
+    fields["moved_at"] = now
+    fields["error"] = error_message
+    return fields
@@ -3,7 +3,8 @@
 - Python과 Rust 확장 모듈 간 호출 경계를 제공한다.
 
 설명:
-- JSON payload를 Rust 브릿지에 전달하고 결과 JSON을 dict로 변환한다.
+- JSON payload를 Rust 브릿지에 전달하고 결과 JSON(검색은 UTF-8 바이트, 적재는 문자열)을 dict로 변환한다.
+- 직렬화/역직렬화는 pydantic-core의 Rust JSON 구현(`to_json`/`from_json`)으로 처리한다.
 - Rust 모듈 미설치/호출 실패를 명시적 예외로 변환한다.
 
 디자인 패턴:
@@ -16,9 +17,10 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
+from pydantic_core import from_json, to_json
+
 from vtree_search.exceptions import DependencyUnavailableError, JobFailedError
 
 
@@ -40,9 +42,19 @@ class RustRuntimeBridge:
         """검색 작업을 Rust 브릿지로 실행한다."""
         return self._execute(self._search.execute, payload)
 
+    def execute_search_job_json(self, payload_json: str) -> dict[str, Any]:
+        """이미 직렬화된 검색 페이로드(JSON 문자열)를 dict 왕복 없이 Rust 브릿지로 실행한다."""
+        return self._execute_json(self._search.execute, payload_json)
+
     def execute_ingestion_job(self, payload: dict[str, Any]) -> dict[str, Any]:
         """적재 작업을 Rust 브릿지로 실행한다."""
-        return self._execute(self._ingestion.execute, payload)
+        return self._execute_json(self._ingestion.execute_bytes, to_json(payload))
+
+    def execute_ingestion_job_json(self, payload_json: str | bytes) -> dict[str, Any]:
+        """이미 직렬화된 적재 페이로드(JSON 문자열 또는 UTF-8 바이트)를 Rust 브릿지로 실행한다."""
+        if isinstance(payload_json, bytes):
+            return self._execute_json(self._ingestion.execute_bytes, payload_json)
+        return self._execute_json(self._ingestion.execute, payload_json)
 
     def search_status(self) -> str:
         """검색 브릿지 상태 문자열을 반환한다."""
@@ -52,15 +64,19 @@ class RustRuntimeBridge:
         """적재 브릿지 상태 문자열을 반환한다."""
         return str(self._ingestion.status())
 
+    @classmethod
+    def _execute(cls, callable_fn, payload: dict[str, Any]) -> dict[str, Any]:
+        # 검색 브릿지는 `&str`만 받으므로 UTF-8 바이트를 문자열로 한 번 디코딩해 넘긴다.
+        return cls._execute_json(callable_fn, to_json(payload).decode())
+
     @staticmethod
-    def _execute(callable_fn, payload: dict[str, Any]) -> dict[str, Any]:
-        payload_json = json.dumps(payload, ensure_ascii=False)
+    def _execute_json(callable_fn, payload_json: str | bytes) -> dict[str, Any]:
         try:
             response_json = callable_fn(payload_json)
         except RuntimeError as exc:
             raise JobFailedError(f"Rust 브릿지 실행 실패: {exc}") from exc
 
         try:
-            return json.loads(response_json)
-        except json.JSONDecodeError as exc:
+            return from_json(response_json)
+        except ValueError as exc:
             raise JobFailedError(f"Rust 응답 JSON 파싱 실패: {exc}") from exc
@@ -5,6 +5,7 @@
 설명:
 - 검색 요청을 큐에 적재하고 잡 상태/결과를 조회한다.
 - 워커에서 Rust 검색 브릿지를 호출한 뒤, LLM 배치 필터를 적용해 최종 결과를 생성한다.
+- 제출/조회 API는 동기 큐를, 워커 경로는 `redis.asyncio` 기반 큐를 사용해 이벤트 루프를 막지 않는다.
 
 디자인 패턴:
 - 서비스 레이어(Service Layer) + 큐 소비자(Worker).
@@ -19,10 +20,16 @@
 from __future__ import annotations
 
 import asyncio
-import json
-from datetime import UTC, datetime
+import secrets
+import time
+from base64 import b64encode
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any
-from uuid import uuid4
+
+from pydantic_core import from_json, to_json
 
 from vtree_search.config.models import SearchConfig
 from vtree_search.contracts.job_models import (
@@ -31,8 +38,15 @@ from vtree_search.contracts.job_models import (
     SearchJobCanceled,
     SearchJobResult,
     SearchJobStatus,
+    SearchMetrics,
 )
 from vtree_search.contracts.search_models import SearchSubmission
+from vtree_search.contracts.vector_types import (
+    EmbeddingInput,
+    embedding_length,
+    encode_embedding_f32,
+    quantize_embedding_f32,
+)
 from vtree_search.exceptions import (
     ConfigurationError,
     JobExpiredError,
@@ -41,8 +55,37 @@ from vtree_search.exceptions import (
 )
 from vtree_search.llm.contracts import SearchFilterCandidate, SearchFilterDecision
 from vtree_search.llm.langchain_search import LangChainSearchFilterLLM
-from vtree_search.queue.redis_streams import QueueMessage, RedisSearchQueue
+from vtree_search.queue.redis_streams import (
+    AsyncRedisSearchQueue,
+    JobStart,
+    QueueMessage,
+    RedisSearchQueue,
+    decode_result_json,
+)
 from vtree_search.runtime.bridge import RustRuntimeBridge
+from vtree_search.shared.clock import utc_now_iso
+
+# 조회 API는 잡 해시 전체(HGETALL) 대신 필요한 필드만 HMGET으로 읽어 payload_json 전송을 피한다.
+_STATUS_FIELDS = ("state", "retries", "canceled", "updated_at", "last_error")
+_RESULT_FIELDS = ("state", "last_error", "result_json", "completed_at")
+_STATE_FIELDS = ("state",)
+# 취소 요청을 받지 않는 종결 상태.
+_TERMINAL_STATES = frozenset({"SUCCEEDED", "FAILED", "CANCELED"})
+# 워커가 만든 결과 JSON 표식. 이 표식이 있는 결과는 조회 시 Pydantic 검증 없이 모델을 만든다.
+_WORKER_RESULT_MARK = "_vtree_worker"
+
+
+@dataclass(slots=True)
+class _PreparedSearch:
+    """Rust 검색을 마치고 LLM 필터 판정을 기다리는 워커 잡."""
+
+    message: QueueMessage
+    job_id: str
+    started: JobStart
+    payload_json: str
+    payload: dict[str, Any]
+    rust_result: dict[str, Any]
+    filter_candidates: list[SearchFilterCandidate]
 
 
 class VTreeSearchEngine:
@@ -54,79 +97,99 @@ class VTreeSearchEngine:
         llm,
         runtime_bridge: RustRuntimeBridge | None = None,
         queue: RedisSearchQueue | None = None,
+        worker_queue: AsyncRedisSearchQueue | None = None,
     ) -> None:
         self._config = config
         self._filter_llm = LangChainSearchFilterLLM(chat_model=llm)
         self._runtime_bridge = runtime_bridge or RustRuntimeBridge()
+        # 배치 내 Rust 검색은 동시에 실행하되, 애플리케이션의 기본 executor 대신
+        # `worker_concurrency` 크기의 전용 스레드 풀에서 돌려 CPU 사용량을 설정으로 제한한다.
+        # 풀은 워커 경로에서 처음 쓸 때 만들고 `aclose()`에서 종료한다.
+        self._bridge_executor: ThreadPoolExecutor | None = None
+        # DSN 인코딩을 포함해 설정에만 의존하는 요청 항목은 한 번만 만들고, 변경되지 않도록 읽기 전용으로 고정한다.
+        self._payload_template: Mapping[str, Any] = MappingProxyType(
+            {
+                "entry_limit": config.entry_limit,
+                "page_limit": config.page_limit,
+                "worker_concurrency": config.worker_concurrency,
+                "postgres": config.postgres.to_bridge_payload(),
+            }
+        )
         self._queue = queue or RedisSearchQueue(config.redis)
         self._queue.ensure_consumer_group()
+        # 비동기 클라이언트 커넥션은 이벤트 루프에 묶이므로, 주입되지 않았다면 루프별로 지연 생성한다.
+        self._pinned_worker_queue = worker_queue
+        self._loop_worker_queue: tuple[asyncio.AbstractEventLoop, AsyncRedisSearchQueue] | None = None
 
     def submit_search(
         self,
         query_text: str,
-        query_embedding: list[float],
+        query_embedding: EmbeddingInput,
         top_k: int = 5,
         metadata: dict[str, object] | None = None,
     ) -> SearchJobAccepted:
-        """검색 작업을 큐에 제출한다."""
+        """검색 작업을 큐에 제출한다.
+
+        `query_embedding`은 `list[float]`, 1차원 `numpy.ndarray`, `array.array`,
+        또는 float32 little-endian 원시 바이트를 받는다.
+        """
         if top_k < 1:
             raise ConfigurationError("top_k는 1 이상이어야 합니다")
 
-        if len(query_embedding) != self._config.postgres.embedding_dim:
-            raise ConfigurationError(
-                "query_embedding 길이가 embedding_dim과 일치하지 않습니다: "
-                f"expected={self._config.postgres.embedding_dim}, actual={len(query_embedding)}"
-            )
-
+        embedding = _encode_query_embedding(query_embedding, self._config.postgres.embedding_dim)
         self._queue.guard_capacity()
 
-        job_id = uuid4().hex
-        submission = SearchSubmission(
-            job_id=job_id,
-            query_text=query_text,
-            query_embedding=query_embedding,
-            top_k=top_k,
-            metadata=metadata,
-        )
+        job_id = _make_job_id()
+        fields = {
+            "job_id": job_id,
+            "query_text": query_text,
+            "query_embedding": embedding,
+            "top_k": top_k,
+            "metadata": metadata,
+        }
+        # 위에서 이미 검증/정규화한 정형 입력은 Pydantic 검증을 다시 돌리지 않고 바로 모델을 만든다.
+        if (
+            type(embedding) is bytes
+            and type(query_text) is str
+            and query_text
+            and type(top_k) is int
+            and (metadata is None or type(metadata) is dict)
+        ):
+            submission = SearchSubmission.model_construct(**fields)
+        else:
+            submission = SearchSubmission.model_validate(fields)
 
         payload = self._build_rust_payload(submission)
-        payload_json = json.dumps(payload, ensure_ascii=False)
+        payload_json = to_json(payload)
         module_name = self._config.redis.module_name_search
 
-        self._queue.create_job_record(job_id, payload_json, module_name=module_name)
-        self._queue.enqueue(
-            job_id=job_id,
-            payload_json=payload_json,
-            retries=0,
-            module_name=module_name,
-        )
+        self._queue.submit_job(job_id, payload_json, module_name=module_name)
 
         return SearchJobAccepted(
             job_id=job_id,
             state="PENDING",
-            submitted_at=_utc_now(),
+            submitted_at=utc_now_iso(),
         )
 
     def get_job(self, job_id: str) -> SearchJobStatus:
         """잡 상태를 조회한다."""
-        record = self._queue.get_job_record(job_id)
+        record = self._queue.get_job_fields(job_id, _STATUS_FIELDS)
         if record is None:
             raise JobNotFoundError(f"job_id={job_id}를 찾을 수 없습니다")
 
-        return SearchJobStatus.model_validate(
-            {
-                "job_id": job_id,
-                "state": record.get("state", "PENDING"),
-                "retries": int(record.get("retries", "0") or "0"),
-                "canceled": record.get("canceled", "0") == "1",
-                "updated_at": str(record.get("updated_at", _utc_now())),
-                "last_error": record.get("last_error") or None,
-            }
+        # 잡 해시는 큐 계층만 기록하고 값도 여기서 정규화하므로 다시 검증하지 않는다.
+        return SearchJobStatus.model_construct(
+            job_id=job_id,
+            state=record.get("state", "PENDING"),
+            retries=int(record.get("retries", "0") or "0"),
+            canceled=record.get("canceled", "0") == "1",
+            updated_at=record.get("updated_at") or utc_now_iso(),
+            last_error=record.get("last_error") or None,
         )
 
     def fetch_result(self, job_id: str) -> SearchJobResult:
         """성공한 잡의 결과를 조회한다."""
-        record = self._queue.get_job_record(job_id)
+        record = self._queue.get_job_fields(job_id, _RESULT_FIELDS)
         if record is None:
             raise JobExpiredError(f"job_id={job_id} 결과가 만료되었거나 존재하지 않습니다")
 
@@ -140,23 +203,31 @@ class VTreeSearchEngine:
         if not result_json:
             raise JobFailedError(f"job_id={job_id}의 result_json이 비어 있습니다")
 
+        # SUCCEEDED 전이는 completed_at과 같은 HSET으로 기록된다. 구버전 워커나 수동 HSET으로
+        # 누락된 레코드는 다른 시각으로 대체하지 않고 잡 실패로 드러낸다.
+        completed_at = record.get("completed_at")
+        if not completed_at:
+            raise JobFailedError(f"job_id={job_id}의 completed_at이 없습니다")
+
         try:
-            payload = json.loads(result_json)
-        except json.JSONDecodeError as exc:
+            payload = from_json(decode_result_json(result_json))
+        except ValueError as exc:
             raise JobFailedError(f"job_id={job_id} 결과 JSON 파싱 실패: {exc}") from exc
 
-        payload["state"] = "SUCCEEDED"
-        payload["completed_at"] = record.get("completed_at") or record.get("updated_at") or _utc_now()
+        if payload.pop(_WORKER_RESULT_MARK, None) == 1:
+            return _construct_job_result(payload, completed_at)
+
+        payload.update(state="SUCCEEDED", completed_at=completed_at)
         return SearchJobResult.model_validate(payload)
 
     def cancel_job(self, job_id: str) -> SearchJobCanceled:
         """잡 취소를 요청한다."""
-        record = self._queue.get_job_record(job_id)
+        record = self._queue.get_job_fields(job_id, _STATE_FIELDS)
         if record is None:
             raise JobNotFoundError(f"job_id={job_id}를 찾을 수 없습니다")
 
         state = str(record.get("state", "PENDING"))
-        if state in {"SUCCEEDED", "FAILED", "CANCELED"}:
+        if state in _TERMINAL_STATES:
             return SearchJobCanceled(
                 job_id=job_id,
                 state="CANCELED",
@@ -173,207 +244,388 @@ class VTreeSearchEngine:
             message="취소 요청이 접수되었습니다",
         )
 
-    async def run_worker_once(self, worker_name: str, max_items: int = 1) -> int:
-        """큐에서 최대 max_items개 작업을 처리한다."""
+    async def run_worker_once(self, worker_name: str, max_items: int | None = None) -> int:
+        """큐에서 최대 max_items개 작업을 처리한다. 생략하면 `worker_batch_size`만큼 가져온다."""
+        if max_items is None:
+            max_items = self._config.worker_batch_size
         if max_items < 1:
             raise ConfigurationError("max_items는 1 이상이어야 합니다")
-
-        messages = self._queue.read(consumer_name=worker_name, count=max_items)
-        processed = 0
-
-        for message in messages:
-            await self._process_message(message)
-            processed += 1
-
-        return processed
+        return await self._run_worker_batch(worker_name, max_items, block_ms=None)
+
+    async def _run_worker_batch(self, worker_name: str, max_items: int, *, block_ms: int | None) -> int:
+        worker_queue = await self._get_worker_queue()
+        # 실행 시각이 지난 지연 재시도를 먼저 스트림으로 옮기고, 다음 재시도 시각을 넘겨 BLOCK하지 않게 줄인다.
+        next_due_ms = await worker_queue.promote_due_retries(max_items)
+        if block_ms is None:
+            block_ms = self._config.redis.worker_block_ms
+        if next_due_ms is not None:
+            block_ms = min(block_ms, max(1, next_due_ms - time.time_ns() // 1_000_000))
+        messages = await worker_queue.read(consumer_name=worker_name, count=max_items, block_ms=block_ms)
+        if not messages:
+            return 0
+
+        # 잡 상태 전이(Lua)는 배치 전체를 한 번의 파이프라인으로 보내고, Rust 검색은 메시지별로 동시에 실행한다.
+        runnable = [message for message in messages if message.fields.get("job_id")]
+        started_jobs = await worker_queue.begin_processing_many(
+            [
+                (message.fields["job_id"], message.fields.get("retries"), not message.fields.get("payload_json"))
+                for message in runnable
+            ]
+        )
+        started_by_message = {
+            message.message_id: started for message, started in zip(runnable, started_jobs, strict=True)
+        }
+        # 잡 종결(성공/실패/재적재)과 ACK 명령은 배치 하나의 파이프라인에 쌓았다가 끝에서 한 번에 보낸다.
+        pipe = worker_queue.pipeline()
+        prepared = await asyncio.gather(
+            *(
+                self._prepare_message(worker_queue, pipe, message, started_by_message.get(message.message_id))
+                for message in messages
+            )
+        )
+        jobs = [job for job in prepared if job is not None]
+
+        # 후보가 있는 잡의 LLM 필터는 배치 전체를 채팅 모델 `abatch` 한 번으로 모아 제출한다.
+        # 필터가 꺼져 있으면 LLM을 호출하지 않고 Rust 후보를 그대로 통과시킨다.
+        if self._config.llm_filter_enabled:
+            filter_jobs = [job for job in jobs if job.filter_candidates]
+        else:
+            filter_jobs = []
+        filter_outcomes = await self._filter_llm.filter_many(
+            [(str(job.payload["question"]), job.filter_candidates) for job in filter_jobs]
+        )
+        outcome_by_message = {
+            job.message.message_id: outcome for job, outcome in zip(filter_jobs, filter_outcomes, strict=True)
+        }
+        await asyncio.gather(
+            *(
+                self._complete_job(worker_queue, pipe, job, outcome_by_message.get(job.message.message_id, []))
+                for job in jobs
+            )
+        )
+        # 모든 메시지는 위에서 종결(성공/실패/재적재/건너뜀)되었으므로 ACK + XDEL까지 쌓아 한 번의 왕복으로 보낸다.
+        await worker_queue.ack_many(messages, pipe=pipe)
+        await pipe.execute()
+        return len(messages)
 
     async def run_worker_forever(self, worker_name: str) -> None:
-        """큐 작업을 지속적으로 처리한다."""
+        """큐 작업을 지속적으로 처리한다.
+
+        유휴 대기는 sleep 대신 XREADGROUP의 BLOCK에 맡겨 새 메시지가 오면 바로 깨어난다.
+        빈 읽기가 이어지면 BLOCK 시간을 `worker_block_max_ms`까지 두 배씩 늘려 유휴 폴링을 줄이고,
+        메시지를 처리하면 `worker_block_ms`로 되돌린다.
+        """
+        redis_config = self._config.redis
+        block_ms = redis_config.worker_block_ms
         while True:
-            processed = await self.run_worker_once(worker_name=worker_name, max_items=1)
-            if processed == 0:
-                await asyncio.sleep(0.05)
-
-    async def _process_message(self, message: QueueMessage) -> None:
+            processed = await self._run_worker_batch(
+                worker_name,
+                self._config.worker_batch_size,
+                block_ms=block_ms,
+            )
+            if processed:
+                block_ms = redis_config.worker_block_ms
+            else:
+                block_ms = min(block_ms * 2, redis_config.worker_block_max_ms)
+
+    async def aclose(self) -> None:
+        """엔진이 만든 워커 큐 커넥션과 Rust 검색 스레드 풀을 닫는다. 워커를 실행한 이벤트 루프를 닫기 전에 호출한다.
+
+        생성자로 주입한 `worker_queue`는 호출자 소유이므로 닫지 않는다.
+        닫은 뒤 워커를 다시 실행하면 큐와 스레드 풀을 새로 만든다.
+        """
+        current, self._loop_worker_queue = self._loop_worker_queue, None
+        if current is not None:
+            await _close_worker_queue(*current)
+        executor, self._bridge_executor = self._bridge_executor, None
+        if executor is not None:
+            # 실행 중인 검색은 끝까지 돌고 스레드는 그 뒤 종료되므로, 이벤트 루프를 막지 않도록 기다리지 않는다.
+            executor.shutdown(wait=False)
+
+    def _get_bridge_executor(self) -> ThreadPoolExecutor:
+        if self._bridge_executor is None:
+            self._bridge_executor = ThreadPoolExecutor(
+                max_workers=self._config.worker_concurrency,
+                thread_name_prefix="vtree-search-bridge",
+            )
+        return self._bridge_executor
+
+    async def _get_worker_queue(self) -> AsyncRedisSearchQueue:
+        if self._pinned_worker_queue is not None:
+            return self._pinned_worker_queue
+        loop = asyncio.get_running_loop()
+        current = self._loop_worker_queue
+        if current is not None and current[0] is loop:
+            return current[1]
+        worker_queue = AsyncRedisSearchQueue(self._config.redis)
+        self._loop_worker_queue = (loop, worker_queue)
+        if current is not None:
+            # 루프가 바뀌면 이전 루프에 묶인 클라이언트를 버리기 전에 닫는다.
+            await _close_worker_queue(*current)
+        return worker_queue
+
+    async def _prepare_message(
+        self,
+        queue: AsyncRedisSearchQueue,
+        pipe: Any,
+        message: QueueMessage,
+        started: JobStart | None,
+    ) -> _PreparedSearch | None:
+        """Rust 검색까지 실행한다. 더 처리할 필요가 없거나 실패한 메시지는 여기서 정리하고 None을 돌려준다.
+
+        정리 명령은 `pipe`에 쌓기만 하고 ACK는 하지 않는다.
+        배치의 모든 메시지는 `run_worker_once` 끝에서 `ack_many`와 함께 한 번에 보낸다.
+        """
         job_id = message.fields.get("job_id", "")
-        if not job_id:
-            self._queue.ack(message)
-            return
+        if not job_id or started is None or started.state == "CANCELED":
+            return None
 
-        record = self._queue.get_job_record(job_id)
-        if record is None:
-            self._queue.ack(message)
-            return
+        payload_json = message.fields.get("payload_json") or started.payload_json
+        if not payload_json:
+            await queue.finalize_failure(
+                message,
+                job_id,
+                error_message="payload_json이 비어 있습니다",
+                retries=started.retries,
+                dlq_error="payload_json-empty",
+                ack=False,
+                pipe=pipe,
+            )
+            return None
 
-        if record.get("canceled", "0") == "1":
-            self._queue.mark_canceled(job_id)
-            self._queue.ack(message)
-            return
+        try:
+            payload = from_json(payload_json)
+            # 큐에 저장된 JSON을 그대로 Rust에 넘겨 dict -> JSON 재직렬화를 건너뛴다.
+            rust_result = await asyncio.get_running_loop().run_in_executor(
+                self._get_bridge_executor(),
+                self._runtime_bridge.execute_search_job_json,
+                payload_json,
+            )
+            filter_candidates = _to_filter_candidates(rust_result)
+        except Exception as exc:  # noqa: BLE001
+            await self._retry_or_fail(queue, pipe, message, job_id, started, payload_json, exc)
+            return None
 
-        retries = int(message.fields.get("retries", record.get("retries", "0") or "0") or "0")
-        self._queue.mark_running(job_id, retries)
+        return _PreparedSearch(
+            message=message,
+            job_id=job_id,
+            started=started,
+            payload_json=payload_json,
+            payload=payload,
+            rust_result=rust_result,
+            filter_candidates=filter_candidates,
+        )
 
-        payload_json = message.fields.get("payload_json") or record.get("payload_json") or ""
-        if not payload_json:
-            self._queue.mark_failed(job_id, "payload_json이 비어 있습니다", retries)
-            self._queue.move_to_dlq(message, "payload_json-empty")
-            self._queue.ack(message)
+    async def _complete_job(
+        self,
+        queue: AsyncRedisSearchQueue,
+        pipe: Any,
+        job: _PreparedSearch,
+        outcome: list[SearchFilterDecision] | Exception,
+    ) -> None:
+        if isinstance(outcome, Exception):
+            await self._retry_or_fail(queue, pipe, job.message, job.job_id, job.started, job.payload_json, outcome)
             return
 
         try:
-            payload = json.loads(payload_json)
-            rust_result = await asyncio.to_thread(self._runtime_bridge.execute_search_job, payload)
-            result = await self._build_filtered_result(payload=payload, rust_result=rust_result)
+            result = _build_filtered_result(
+                job=job,
+                decisions=outcome if self._config.llm_filter_enabled else None,
+            )
         except Exception as exc:  # noqa: BLE001
-            next_retry = retries + 1
-            error_message = str(exc)
-
-            if next_retry <= self._config.max_retries:
-                backoff_ms = min(
-                    self._config.retry_base_ms * (2 ** max(0, next_retry - 1)),
-                    self._config.retry_max_ms,
-                )
-                self._queue.mark_pending_retry(job_id, next_retry, error_message)
-                self._queue.enqueue(
-                    job_id=job_id,
-                    payload_json=payload_json,
-                    retries=next_retry,
-                    module_name=record.get("module_name", self._config.redis.module_name_search),
-                )
-                await asyncio.sleep(backoff_ms / 1000.0)
-            else:
-                self._queue.mark_failed(job_id, error_message, next_retry)
-                self._queue.move_to_dlq(message, error_message)
-
-            self._queue.ack(message)
+            await self._retry_or_fail(queue, pipe, job.message, job.job_id, job.started, job.payload_json, exc)
             return
 
-        self._queue.mark_succeeded(job_id, result)
-        self._queue.ack(message)
+        await queue.finalize_success(job.message, job.job_id, result, ack=False, pipe=pipe)
 
-    async def _build_filtered_result(
+    async def _retry_or_fail(
         self,
-        *,
-        payload: dict[str, Any],
-        rust_result: dict[str, Any],
-    ) -> dict[str, Any]:
-        question = str(payload["question"])
-        top_k = int(payload["top_k"])
-
-        raw_candidates = rust_result.get("candidates")
-        if not isinstance(raw_candidates, list):
-            raise JobFailedError("Rust 검색 결과 candidates가 배열이 아닙니다")
-
-        candidates = [SearchCandidate.model_validate(item) for item in raw_candidates]
-        if not candidates:
-            raw_metrics = rust_result.get("metrics")
-            if not isinstance(raw_metrics, dict):
-                raise JobFailedError("Rust 검색 결과 metrics가 객체가 아닙니다")
-            return {
-                "job_id": str(payload["job_id"]),
-                "candidates": [],
-                "metrics": {
-                    "entry_count": int(raw_metrics["entry_count"]),
-                    "page_count": int(raw_metrics["page_count"]),
-                    "kept_count": 0,
-                    "elapsed_ms": int(raw_metrics["elapsed_ms"]),
-                },
-            }
+        queue: AsyncRedisSearchQueue,
+        pipe: Any,
+        message: QueueMessage,
+        job_id: str,
+        started: JobStart,
+        payload_json: str,
+        exc: Exception,
+    ) -> None:
+        next_retry = started.retries + 1
+        error_message = str(exc)
 
-        filter_candidates = [
-            SearchFilterCandidate(node_id=candidate.node_id, content=candidate.content)
-            for candidate in candidates
-        ]
-
-        decisions = await self._filter_llm.filter(question=question, candidates=filter_candidates)
-        decision_map = _to_decision_map(candidates=filter_candidates, decisions=decisions)
-
-        kept: list[SearchCandidate] = []
-        for candidate in candidates:
-            decision = decision_map[candidate.node_id]
-            if not decision.keep:
-                continue
-            kept.append(
-                SearchCandidate(
-                    node_id=candidate.node_id,
-                    path=candidate.path,
-                    score=candidate.score,
-                    content=candidate.content,
-                    image_url=candidate.image_url,
-                    reason=decision.reason,
-                )
+        if next_retry <= self._config.max_retries:
+            backoff_ms = min(
+                self._config.retry_base_ms * (2 ** max(0, next_retry - 1)),
+                self._config.retry_max_ms,
             )
+            await queue.requeue_for_retry(
+                job_id=job_id,
+                payload_json=payload_json,
+                retries=next_retry,
+                error_message=error_message,
+                module_name=started.module_name or self._config.redis.module_name_search,
+                delay_ms=backoff_ms,
+                pipe=pipe,
+            )
+            return
 
-        kept.sort(
-            key=lambda item: (-item.score, item.path),
+        await queue.finalize_failure(
+            message,
+            job_id,
+            error_message=error_message,
+            retries=next_retry,
+            ack=False,
+            pipe=pipe,
         )
-        if len(kept) > top_k:
-            kept = kept[:top_k]
-
-        raw_metrics = rust_result.get("metrics")
-        if not isinstance(raw_metrics, dict):
-            raise JobFailedError("Rust 검색 결과 metrics가 객체가 아닙니다")
 
-        entry_count = int(raw_metrics["entry_count"])
-        page_count = int(raw_metrics["page_count"])
-        elapsed_ms = int(raw_metrics["elapsed_ms"])
-
-        return {
-            "job_id": str(payload["job_id"]),
-            "candidates": [candidate.model_dump() for candidate in kept],
-            "metrics": {
-                "entry_count": entry_count,
-                "page_count": page_count,
-                "kept_count": len(kept),
-                "elapsed_ms": elapsed_ms,
-            },
+    def _query_embedding_fields(self, embedding: bytes) -> dict[str, Any]:
+        quantization = self._config.query_quantization
+        if quantization == "fp32":
+            # fp32는 dtype 필드 없이 보내 이전 페이로드와 바이트 단위로 같게 유지한다.
+            return {"query_embedding_b64": b64encode(embedding).decode("ascii")}
+        encoded, scale = quantize_embedding_f32(embedding, quantization)
+        fields: dict[str, Any] = {
+            "query_embedding_b64": b64encode(encoded).decode("ascii"),
+            "query_embedding_dtype": quantization,
         }
+        if quantization == "int8":
+            fields["query_embedding_scale"] = scale
+        return fields
 
     def _build_rust_payload(self, submission: SearchSubmission) -> dict[str, Any]:
         return {
+            **self._payload_template,
             "job_id": submission.job_id,
             "question": submission.query_text,
-            "query_embedding": submission.query_embedding,
+            # 질의 벡터는 float 목록 대신 (양자화한) 원시 바이트의 base64로 보내 페이로드 크기와 파싱 비용을 줄인다.
+            **self._query_embedding_fields(submission.query_embedding),
             "top_k": submission.top_k,
-            "entry_limit": self._config.entry_limit,
-            "page_limit": self._config.page_limit,
-            "worker_concurrency": self._config.worker_concurrency,
-            "postgres": {
-                "dsn": self._config.postgres.to_dsn(),
-                "summary_table": self._config.postgres.summary_table,
-                "page_table": self._config.postgres.page_table,
-                "pool_min": self._config.postgres.pool_min,
-                "pool_max": self._config.postgres.pool_max,
-                "connect_timeout_ms": self._config.postgres.connect_timeout_ms,
-                "statement_timeout_ms": self._config.postgres.statement_timeout_ms,
-            },
             "metadata": submission.metadata,
         }
 
 
+def _to_filter_candidates(rust_result: dict[str, Any]) -> list[SearchFilterCandidate]:
+    raw_candidates = rust_result.get("candidates")
+    if not isinstance(raw_candidates, list):
+        raise JobFailedError("Rust 검색 결과 candidates가 배열이 아닙니다")
+    return [
+        SearchFilterCandidate(node_id=candidate["node_id"], content=candidate["content"])
+        for candidate in raw_candidates
+    ]
+
+
+def _build_filtered_result(
+    *,
+    job: _PreparedSearch,
+    decisions: list[SearchFilterDecision] | None,
+) -> dict[str, Any]:
+    """LLM 판정으로 후보를 거른다. `decisions`가 None이면 모든 후보를 빈 reason으로 통과시킨다."""
+    payload = job.payload
+    rust_result = job.rust_result
+    top_k = int(payload["top_k"])
+
+    raw_metrics = rust_result.get("metrics")
+    if not isinstance(raw_metrics, dict):
+        raise JobFailedError("Rust 검색 결과 metrics가 객체가 아닙니다")
+
+    # Rust 후보는 serde가 형태를 보장(점수는 0~1로 절삭)하므로 중간 모델 없이 dict 그대로 다룬다.
+    # 결과에는 워커 표식을 남겨, 조회 시에도 검증 없이 `SearchJobResult`를 만들게 한다.
+    kept: list[dict[str, Any]] = []
+    if decisions is None:
+        kept = [{**candidate, "reason": ""} for candidate in rust_result["candidates"]]
+    elif job.filter_candidates:
+        decision_map = _to_decision_map(candidates=job.filter_candidates, decisions=decisions)
+        for candidate in rust_result["candidates"]:
+            decision = decision_map[candidate["node_id"]]
+            if decision.keep:
+                kept.append({**candidate, "reason": decision.reason})
+
+    kept.sort(
+        key=lambda item: (-item["score"], item["path"]),
+    )
+    if len(kept) > top_k:
+        kept = kept[:top_k]
+
+    return {
+        _WORKER_RESULT_MARK: 1,
+        "job_id": str(payload["job_id"]),
+        "candidates": kept,
+        "metrics": {
+            "entry_count": int(raw_metrics["entry_count"]),
+            "page_count": int(raw_metrics["page_count"]),
+            "kept_count": len(kept),
+            "elapsed_ms": int(raw_metrics["elapsed_ms"]),
+        },
+    }
+
+
+def _construct_job_result(payload: dict[str, Any], completed_at: str) -> SearchJobResult:
+    """워커가 만든 결과 dict로 검증 없이 `SearchJobResult`를 만든다. 중첩 모델도 직접 구성한다."""
+    return SearchJobResult.model_construct(
+        job_id=payload["job_id"],
+        state="SUCCEEDED",
+        candidates=[SearchCandidate.model_construct(**candidate) for candidate in payload["candidates"]],
+        metrics=SearchMetrics.model_construct(**payload["metrics"]),
+        completed_at=completed_at,
+    )
+
+
 def _to_decision_map(
     *,
     candidates: list[SearchFilterCandidate],
     decisions: list[SearchFilterDecision],
 ) -> dict[str, SearchFilterDecision]:
+    mapped = {decision.node_id: decision for decision in decisions}
     expected_ids = {candidate.node_id for candidate in candidates}
-    mapped: dict[str, SearchFilterDecision] = {}
+    if len(mapped) == len(decisions) and mapped.keys() == expected_ids:
+        return mapped
 
+    # 불일치할 때만 응답 순서대로 다시 훑어 첫 번째 원인을 보고한다.
+    seen_ids: set[str] = set()
     for decision in decisions:
         node_id = decision.node_id
         if node_id not in expected_ids:
             raise JobFailedError(f"검색 필터 응답 node_id가 후보 집합에 없습니다: {node_id}")
-        if node_id in mapped:
+        if node_id in seen_ids:
             raise JobFailedError(f"검색 필터 응답 node_id가 중복되었습니다: {node_id}")
-        mapped[node_id] = decision
+        seen_ids.add(node_id)
+
+    missing_joined = ", ".join(sorted(expected_ids - seen_ids))
+    raise JobFailedError(f"검색 필터 응답에 누락된 node_id가 있습니다: {missing_joined}")
+
+
+def _encode_query_embedding(query_embedding: object, expected_dim: int) -> bytes:
+    """질의 임베딩을 float32 LE 바이트로 정규화하고 차원을 확인한다.
+
+    Raises:
+        ConfigurationError: 지원하지 않는 입력 타입이거나, 형태/값/차원이 올바르지 않은 경우.
+    """
+    try:
+        embedding = encode_embedding_f32(query_embedding)
+        if not isinstance(embedding, bytes):
+            raise TypeError(f"지원하지 않는 query_embedding 타입입니다: {type(query_embedding).__name__}")
+        dim = embedding_length(embedding)
+    except (TypeError, ValueError) as exc:
+        raise ConfigurationError(str(exc)) from exc
+    if dim != expected_dim:
+        raise ConfigurationError(
+            f"query_embedding 길이가 embedding_dim과 일치하지 않습니다: expected={expected_dim}, actual={dim}"
+        )
+    return embedding
+
 
-    missing_ids = expected_ids - mapped.keys()
-    if missing_ids:
-        missing_joined = ", ".join(sorted(missing_ids))
-        raise JobFailedError(f"검색 필터 응답에 누락된 node_id가 있습니다: {missing_joined}")
+def _make_job_id() -> str:
+    """48비트 밀리초 시각 + 80비트 난수로 32자 16진수 잡 ID를 만든다(생성 순서대로 정렬됨)."""
+    return f"{time.time_ns() // 1_000_000:012x}{secrets.token_hex(10)}"
 
-    return mapped
 
+async def _close_worker_queue(loop: asyncio.AbstractEventLoop, queue: AsyncRedisSearchQueue) -> None:
+    """워커 큐를 그 큐가 묶인 이벤트 루프에서 닫는다.
 
-def _utc_now() -> str:
-    return datetime.now(tz=UTC).isoformat()
+    `redis.asyncio` 커넥션은 만든 루프에서만 닫을 수 있다. 현재 루프면 바로 닫고,
+    다른 스레드에서 실행 중인 루프면 그 루프에 닫기를 맡겨 완료를 기다린다.
+    이미 멈추거나 닫힌 루프의 커넥션은 정상 종료할 수 없으므로 참조만 놓으며,
+    이때는 수거 시점에 소켓이 닫히면서 `ResourceWarning`이 남는다.
+    """
+    if loop is asyncio.get_running_loop():
+        await queue.aclose()
+    elif loop.is_running():
+        await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(queue.aclose(), loop))
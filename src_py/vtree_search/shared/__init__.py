@@ -10,8 +10,10 @@
 
 참조:
 - src_py/vtree_search/shared/settings.py
+- src_py/vtree_search/shared/clock.py
 """
 
+from .clock import utc_now_iso
 from .settings import ProjectSettings, default_settings
 
-__all__ = ["ProjectSettings", "default_settings"]
+__all__ = ["ProjectSettings", "default_settings", "utc_now_iso"]
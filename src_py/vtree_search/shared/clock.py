@@ -0,0 +1,47 @@
+"""
+목적:
+- 잡 상태/메시지에 기록하는 UTC 시각 문자열을 빠르게 만든다.
+
+설명:
+- 같은 밀리초 안의 호출은 직전 문자열을 재사용하고, 초가 바뀔 때만 날짜/시각 부분을 다시 포맷한다.
+- 그 외에는 밀리초 세 자리만 붙여 `datetime` 객체 생성과 `isoformat` 호출을 건너뛴다.
+- 캐시는 튜플 한 개를 통째로 교체하므로 스레드 간에도 잠금 없이 일관된 값을 읽는다.
+
+디자인 패턴:
+- 메모이제이션(Memoization).
+
+참조:
+- src_py/vtree_search/queue/redis_streams.py
+- src_py/vtree_search/search/engine.py
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import UTC, datetime
+
+# (epoch 밀리초, ISO 문자열)
+_LAST_NOW: tuple[int, str] = (-1, "")
+# (epoch 초, "YYYY-MM-DDTHH:MM:SS" 접두어)
+_LAST_SECOND: tuple[int, str] = (-1, "")
+
+
+def utc_now_iso() -> str:
+    """현재 UTC 시각을 밀리초 정밀도 ISO 8601 문자열(`...T12:34:56.789+00:00`)로 반환한다."""
+    global _LAST_NOW, _LAST_SECOND
+    millis = time.time_ns() // 1_000_000
+    last_millis, last_now = _LAST_NOW
+    if millis == last_millis:
+        return last_now
+
+    second, milli = divmod(millis, 1000)
+    last_second, prefix = _LAST_SECOND
+    if second != last_second:
+        prefix = datetime.fromtimestamp(second, tz=UTC).strftime("%Y-%m-%dT%H:%M:%S")
+        _LAST_SECOND = (second, prefix)
+    now = f"{prefix}.{milli:03d}+00:00"
+    _LAST_NOW = (millis, now)
+    return now
+
+
+__all__ = ["utc_now_iso"]
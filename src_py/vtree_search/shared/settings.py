@@ -4,6 +4,7 @@
 
 설명:
 - 문서/로그/진단에서 공통으로 사용할 식별자 정보를 유지한다.
+- 검증할 입력이 없는 고정 문자열 묶음이므로 Pydantic 모델 대신 불변 dataclass로 둔다.
 
 디자인 패턴:
 - 값 객체(Value Object).
@@ -14,18 +15,22 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from dataclasses import dataclass
 
 
-class ProjectSettings(BaseModel):
-    """Vtree Search 기본 메타 설정 모델."""
+@dataclass(frozen=True, slots=True)
+class ProjectSettings:
+    """Vtree Search 기본 메타 설정 값 객체."""
 
-    project_name: str = Field(default="Vtree Search")
-    python_package: str = Field(default="vtree_search")
-    rust_module: str = Field(default="_vtree_search")
-    phase: str = Field(default="phase2-runtime")
+    project_name: str = "Vtree Search"
+    python_package: str = "vtree_search"
+    rust_module: str = "_vtree_search"
+    phase: str = "phase2-runtime"
+
+
+_DEFAULT_SETTINGS = ProjectSettings()
 
 
 def default_settings() -> ProjectSettings:
-    """기본 설정 객체를 생성한다."""
-    return ProjectSettings()
+    """기본 설정 객체를 반환한다. 불변 객체이므로 하나를 공유한다."""
+    return _DEFAULT_SETTINGS
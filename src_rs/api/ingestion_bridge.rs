@@ -13,9 +13,9 @@
 
 use pyo3::exceptions::PyRuntimeError;
 use pyo3::prelude::*;
-use tokio::runtime::{Builder, Runtime};
 
 use crate::core::ingestion_pipeline::{execute_ingestion, IngestionRequestPayload};
+use crate::core::runtime::shared_runtime;
 
 /// Python에 노출되는 적재 브릿지 클래스다.
 #[pyclass(name = "IngestionBridge")]
@@ -39,28 +39,37 @@ impl PyIngestionBridge {
     }
 
     /// 적재 작업 페이로드(JSON)를 실행하고 결과 JSON을 반환한다.
-    pub fn execute(&self, payload_json: &str) -> PyResult<String> {
+    ///
+    /// DB 작업 동안에는 GIL을 풀어, 스레드에서 호출한 경우 다른 Python 작업이 함께 진행되게 한다.
+    pub fn execute(&self, py: Python<'_>, payload_json: &str) -> PyResult<String> {
         let payload: IngestionRequestPayload =
-            serde_json::from_str(payload_json).map_err(|error| {
-                PyRuntimeError::new_err(format!(
-                    "적재 페이로드 JSON 파싱에 실패했습니다: {}",
-                    error
-                ))
-            })?;
-
-        let runtime = create_runtime().map_err(PyRuntimeError::new_err)?;
-        let result = runtime
-            .block_on(execute_ingestion(payload))
-            .map_err(|error| PyRuntimeError::new_err(error.to_string()))?;
+            serde_json::from_str(payload_json).map_err(parse_error)?;
+        py.detach(|| run_ingestion(payload))
+    }
 
-        serde_json::to_string(&result)
-            .map_err(|error| PyRuntimeError::new_err(format!("적재 결과 직렬화 실패: {}", error)))
+    /// UTF-8 JSON 바이트 페이로드를 실행하고 결과 JSON을 반환한다.
+    ///
+    /// Python `bytes`를 복사 없이 빌려 바로 역직렬화하므로 문자열 변환 비용이 없다.
+    pub fn execute_bytes(&self, py: Python<'_>, payload_json: &[u8]) -> PyResult<String> {
+        let payload: IngestionRequestPayload =
+            serde_json::from_slice(payload_json).map_err(parse_error)?;
+        py.detach(|| run_ingestion(payload))
     }
 }
 
-fn create_runtime() -> Result<Runtime, String> {
-    Builder::new_multi_thread()
-        .enable_all()
-        .build()
-        .map_err(|error| format!("Tokio 런타임 생성 실패: {}", error))
+fn run_ingestion(payload: IngestionRequestPayload) -> PyResult<String> {
+    let runtime = shared_runtime().map_err(PyRuntimeError::new_err)?;
+    let result = runtime
+        .block_on(execute_ingestion(payload))
+        .map_err(|error| PyRuntimeError::new_err(error.to_string()))?;
+
+    serde_json::to_string(&result)
+        .map_err(|error| PyRuntimeError::new_err(format!("적재 결과 직렬화 실패: {}", error)))
+}
+
+fn parse_error(error: serde_json::Error) -> PyErr {
+    PyRuntimeError::new_err(format!(
+        "적재 페이로드 JSON 파싱에 실패했습니다: {}",
+        error
+    ))
 }
@@ -3,7 +3,7 @@
 //
 // 설명:
 // - JSON 페이로드를 입력받아 Rust 검색 파이프라인을 실행하고,
-//   결과를 JSON 문자열로 반환한다.
+//   결과를 UTF-8 JSON 바이트로 반환한다.
 //
 // 디자인 패턴:
 // - 파사드(Facade) + 실패 빠르게(Fail Fast).
@@ -13,8 +13,9 @@
 
 use pyo3::exceptions::PyRuntimeError;
 use pyo3::prelude::*;
-use tokio::runtime::{Builder, Runtime};
+use pyo3::types::PyBytes;
 
+use crate::core::runtime::shared_runtime;
 use crate::core::search_pipeline::{execute_search, SearchRequestPayload};
 
 /// Python에 노출되는 검색 브릿지 클래스다.
@@ -38,28 +39,32 @@ impl PySearchBridge {
         self.phase.clone()
     }
 
-    /// 검색 작업 페이로드(JSON)를 실행하고 결과 JSON을 반환한다.
-    pub fn execute(&self, payload_json: &str) -> PyResult<String> {
-        let payload: SearchRequestPayload = serde_json::from_str(payload_json).map_err(|error| {
-            PyRuntimeError::new_err(format!(
-                "검색 페이로드 JSON 파싱에 실패했습니다: {}",
-                error
-            ))
-        })?;
+    /// 검색 작업 페이로드(JSON)를 실행하고 결과 JSON을 UTF-8 바이트로 반환한다.
+    ///
+    /// 페이로드 파싱 후 DB 검색 동안에는 GIL을 풀어, 워커 스레드 풀의 여러 검색이 실제로 병렬 실행되게 한다.
+    /// 결과는 `str` 대신 `bytes`로 넘겨, 후보 본문이 긴 응답에서 Python 문자열 변환과
+    /// `from_json`의 UTF-8 재인코딩을 모두 건너뛴다.
+    pub fn execute<'py>(&self, py: Python<'py>, payload_json: &str) -> PyResult<Bound<'py, PyBytes>> {
+        let payload: SearchRequestPayload =
+            serde_json::from_str(payload_json).map_err(parse_error)?;
+        let result_json = py.detach(|| run_search(payload))?;
+        Ok(PyBytes::new(py, &result_json))
+    }
+}
 
-        let runtime = create_runtime().map_err(PyRuntimeError::new_err)?;
-        let result = runtime
-            .block_on(execute_search(payload))
-            .map_err(|error| PyRuntimeError::new_err(error.to_string()))?;
+fn run_search(payload: SearchRequestPayload) -> PyResult<Vec<u8>> {
+    let runtime = shared_runtime().map_err(PyRuntimeError::new_err)?;
+    let result = runtime
+        .block_on(execute_search(payload))
+        .map_err(|error| PyRuntimeError::new_err(error.to_string()))?;
 
-        serde_json::to_string(&result)
-            .map_err(|error| PyRuntimeError::new_err(format!("검색 결과 직렬화 실패: {}", error)))
-    }
+    serde_json::to_vec(&result)
+        .map_err(|error| PyRuntimeError::new_err(format!("검색 결과 직렬화 실패: {}", error)))
 }
 
-fn create_runtime() -> Result<Runtime, String> {
-    Builder::new_multi_thread()
-        .enable_all()
-        .build()
-        .map_err(|error| format!("Tokio 런타임 생성 실패: {}", error))
+fn parse_error(error: serde_json::Error) -> PyErr {
+    PyRuntimeError::new_err(format!(
+        "검색 페이로드 JSON 파싱에 실패했습니다: {}",
+        error
+    ))
 }
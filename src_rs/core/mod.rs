@@ -11,7 +11,9 @@
 // - src_rs/core/errors.rs
 // - src_rs/core/search_pipeline.rs
 // - src_rs/core/ingestion_pipeline.rs
+// - src_rs/core/runtime.rs
 
 pub mod errors;
 pub mod ingestion_pipeline;
+pub mod runtime;
 pub mod search_pipeline;
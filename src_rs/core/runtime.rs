@@ -0,0 +1,34 @@
+// 목적:
+// - 브릿지 호출이 공유하는 프로세스 단일 Tokio 런타임을 제공한다.
+//
+// 설명:
+// - 호출마다 런타임을 새로 만들지 않고 최초 1회 생성한 런타임을 재사용한다.
+// - 커넥션 풀은 생성한 런타임에 묶이므로, 풀 캐시를 쓰려면 런타임도 공유해야 한다.
+//
+// 디자인 패턴:
+// - 지연 초기화 싱글턴(Lazy Singleton).
+//
+// 참조:
+// - src_rs/api/search_bridge.rs
+// - src_rs/api/ingestion_bridge.rs
+// - src_rs/index/postgres_repo.rs
+
+use std::sync::OnceLock;
+
+use tokio::runtime::{Builder, Runtime};
+
+static SHARED_RUNTIME: OnceLock<Runtime> = OnceLock::new();
+
+/// 프로세스 공용 Tokio 런타임을 반환한다. 최초 호출 시에만 생성한다.
+pub fn shared_runtime() -> Result<&'static Runtime, String> {
+    if let Some(runtime) = SHARED_RUNTIME.get() {
+        return Ok(runtime);
+    }
+
+    let runtime = Builder::new_multi_thread()
+        .enable_all()
+        .build()
+        .map_err(|error| format!("Tokio 런타임 생성 실패: {}", error))?;
+    // 동시에 초기화된 경우 먼저 등록된 런타임을 사용하고 나머지는 폐기한다.
+    Ok(SHARED_RUNTIME.get_or_init(|| runtime))
+}
@@ -4,6 +4,8 @@
 // 설명:
 // - pgvector 엔트리 탐색 -> ltree 하위 페이지 확장까지 수행한다.
 // - LLM 필터링/상위 k 절삭은 Python 계층에서 수행한다.
+// - 질의 벡터는 float 배열(`query_embedding`) 또는 little-endian 바이트의 base64(`query_embedding_b64`)로 받는다.
+// - base64 벡터는 `query_embedding_dtype`(fp32 기본/fp16/int8)에 따라 f32로 복원하며, int8은 `query_embedding_scale`을 곱한다.
 //
 // 디자인 패턴:
 // - 파이프라인(Pipeline).
@@ -11,6 +13,9 @@
 // 참조:
 // - src_rs/index/postgres_repo.rs
 
+use base64::engine::general_purpose::STANDARD as BASE64;
+use base64::Engine as _;
+use half::f16;
 use serde::{Deserialize, Serialize};
 use serde_json::Value;
 use std::collections::HashMap;
@@ -34,7 +39,14 @@ pub struct PostgresConfigPayload {
 pub struct SearchRequestPayload {
     pub job_id: String,
     pub question: String,
+    #[serde(default)]
     pub query_embedding: Vec<f32>,
+    #[serde(default)]
+    pub query_embedding_b64: Option<String>,
+    #[serde(default)]
+    pub query_embedding_dtype: Option<String>,
+    #[serde(default)]
+    pub query_embedding_scale: Option<f32>,
     pub top_k: usize,
     pub entry_limit: usize,
     pub page_limit: usize,
@@ -67,7 +79,14 @@ pub struct SearchResultPayload {
 }
 
 /// 검색 파이프라인을 실행한다.
-pub async fn execute_search(payload: SearchRequestPayload) -> CoreResult<SearchResultPayload> {
+pub async fn execute_search(mut payload: SearchRequestPayload) -> CoreResult<SearchResultPayload> {
+    if let Some(encoded) = payload.query_embedding_b64.take() {
+        payload.query_embedding = decode_query_embedding(
+            &encoded,
+            payload.query_embedding_dtype.as_deref(),
+            payload.query_embedding_scale,
+        )?;
+    }
     validate_payload(&payload)?;
 
     let started = Instant::now();
@@ -142,6 +161,57 @@ fn to_candidate(
     }
 }
 
+/// base64로 인코딩된 little-endian 질의 벡터를 dtype에 맞춰 f32 벡터로 복원한다.
+fn decode_query_embedding(
+    encoded: &str,
+    dtype: Option<&str>,
+    scale: Option<f32>,
+) -> CoreResult<Vec<f32>> {
+    let bytes = BASE64.decode(encoded).map_err(|error| {
+        CoreError::InvalidInput(format!("query_embedding_b64 디코딩 실패: {}", error))
+    })?;
+    match dtype.unwrap_or("fp32") {
+        "fp32" => {
+            check_width(&bytes, 4)?;
+            Ok(bytes
+                .chunks_exact(4)
+                .map(|chunk| f32::from_le_bytes([chunk[0], chunk[1], chunk[2], chunk[3]]))
+                .collect())
+        }
+        "fp16" => {
+            check_width(&bytes, 2)?;
+            Ok(bytes
+                .chunks_exact(2)
+                .map(|chunk| f16::from_le_bytes([chunk[0], chunk[1]]).to_f32())
+                .collect())
+        }
+        "int8" => {
+            let scale = scale.ok_or_else(|| {
+                CoreError::InvalidInput("int8 질의 벡터에는 query_embedding_scale이 필요합니다".to_string())
+            })?;
+            Ok(bytes
+                .iter()
+                .map(|&value| f32::from(value as i8) * scale)
+                .collect())
+        }
+        other => Err(CoreError::InvalidInput(format!(
+            "지원하지 않는 query_embedding_dtype입니다: {}",
+            other
+        ))),
+    }
+}
+
+fn check_width(bytes: &[u8], width: usize) -> CoreResult<()> {
+    if bytes.len() % width != 0 {
+        return Err(CoreError::InvalidInput(format!(
+            "query_embedding_b64 바이트 길이는 {}의 배수여야 합니다: {}",
+            width,
+            bytes.len()
+        )));
+    }
+    Ok(())
+}
+
 fn validate_payload(payload: &SearchRequestPayload) -> CoreResult<()> {
     if payload.job_id.trim().is_empty() {
         return Err(CoreError::InvalidInput(
@@ -4,6 +4,7 @@
 // 설명:
 // - summary/page 조회와 upsert를 제공한다.
 // - 테이블명은 실행 시 검증해 SQL 주입 위험을 줄인다.
+// - 커넥션 풀은 접속 설정 단위로 프로세스 안에서 캐시해 호출 간 재사용한다.
 //
 // 디자인 패턴:
 // - 저장소 패턴(Repository Pattern).
@@ -12,9 +13,12 @@
 // - src_rs/index/sql.rs
 // - src_rs/core/search_pipeline.rs
 
+use std::collections::HashMap;
+use std::sync::{Mutex, OnceLock};
+
 use serde_json::Value;
 use sqlx::postgres::{PgPoolOptions, PgRow};
-use sqlx::{PgPool, Row};
+use sqlx::{Executor, PgPool, Row};
 
 use crate::core::errors::{CoreError, CoreResult};
 use crate::index::sql::{to_pgvector_literal, validate_identifier};
@@ -56,6 +60,18 @@ pub struct IngestionPageNodeRecord {
     pub metadata: Value,
 }
 
+/// 커넥션 풀 캐시 키다. 풀 동작에 영향을 주는 접속 설정만 포함한다.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+struct PoolKey {
+    dsn: String,
+    pool_min: u32,
+    pool_max: u32,
+    connect_timeout_ms: u64,
+    statement_timeout_ms: u64,
+}
+
+static POOL_CACHE: OnceLock<Mutex<HashMap<PoolKey, PgPool>>> = OnceLock::new();
+
 pub struct PostgresRepository {
     pool: PgPool,
     summary_table: String,
@@ -82,19 +98,14 @@ impl PostgresRepository {
         validate_identifier(summary_table, "postgres.summary_table")?;
         validate_identifier(page_table, "postgres.page_table")?;
 
-        let pool = PgPoolOptions::new()
-            .min_connections(pool_min)
-            .max_connections(pool_max.max(pool_min))
-            .acquire_timeout(std::time::Duration::from_millis(connect_timeout_ms.max(1)))
-            .connect(dsn)
-            .await
-            .map_err(|error| CoreError::Db(format!("Postgres 연결 실패: {}", error)))?;
-
-        let timeout_statement = format!("SET statement_timeout = {}", statement_timeout_ms.max(1));
-        sqlx::query(&timeout_statement)
-            .execute(&pool)
-            .await
-            .map_err(|error| CoreError::Db(format!("statement_timeout 설정 실패: {}", error)))?;
+        let pool = acquire_pool(PoolKey {
+            dsn: dsn.to_string(),
+            pool_min,
+            pool_max,
+            connect_timeout_ms,
+            statement_timeout_ms,
+        })
+        .await?;
 
         Ok(Self {
             pool,
@@ -243,6 +254,51 @@ impl PostgresRepository {
     }
 }
 
+/// 캐시된 풀을 반환하고, 없으면 새로 연결해 캐시에 등록한다.
+async fn acquire_pool(key: PoolKey) -> CoreResult<PgPool> {
+    let cache = POOL_CACHE.get_or_init(|| Mutex::new(HashMap::new()));
+    if let Some(pool) = lock_pool_cache(cache)?.get(&key) {
+        if !pool.is_closed() {
+            return Ok(pool.clone());
+        }
+    }
+
+    // 풀 재사용 시 모든 커넥션에 적용되도록 statement_timeout은 연결 직후 훅에서 설정한다.
+    let timeout_statement = format!("SET statement_timeout = {}", key.statement_timeout_ms.max(1));
+    let pool = PgPoolOptions::new()
+        .min_connections(key.pool_min)
+        .max_connections(key.pool_max.max(key.pool_min))
+        .acquire_timeout(std::time::Duration::from_millis(key.connect_timeout_ms.max(1)))
+        .after_connect(move |conn, _meta| {
+            let statement = timeout_statement.clone();
+            Box::pin(async move {
+                conn.execute(statement.as_str()).await?;
+                Ok(())
+            })
+        })
+        .connect(&key.dsn)
+        .await
+        .map_err(|error| CoreError::Db(format!("Postgres 연결 실패: {}", error)))?;
+
+    // 연결 중 다른 호출이 먼저 등록했다면 기존 풀을 사용한다.
+    let mut guard = lock_pool_cache(cache)?;
+    if let Some(existing) = guard.get(&key) {
+        if !existing.is_closed() {
+            return Ok(existing.clone());
+        }
+    }
+    guard.insert(key, pool.clone());
+    Ok(pool)
+}
+
+fn lock_pool_cache(
+    cache: &Mutex<HashMap<PoolKey, PgPool>>,
+) -> CoreResult<std::sync::MutexGuard<'_, HashMap<PoolKey, PgPool>>> {
+    cache
+        .lock()
+        .map_err(|_| CoreError::Runtime("커넥션 풀 캐시 잠금 실패".to_string()))
+}
+
 fn map_summary_row(row: PgRow) -> CoreResult<SummaryNodeRecord> {
     let node_id = row
         .try_get::<String, _>("node_id")
@@ -0,0 +1,129 @@
+"""
+목적:
+- 여러 파일을 동시에 파싱해도 주석 LLM 동시 호출 수가 `annotation_concurrency`를 넘지 않는지 검증한다.
+- 같은 파서를 서로 다른 이벤트 루프에서 재사용해도 동시성 제어 객체가 이전 루프에 묶이지 않는지 검증한다.
+
+설명:
+- python-docx로 표가 여러 개 들어 있는 DOCX 파일을 실제로 만들고 `SourceParser`로 파싱한다.
+- 채팅 모델은 LangChain `BaseChatModel`을 구현해 호출마다 진행 중 호출 수를 세고 `[TBL]` 블록을 돌려준다.
+
+참조:
+- src_py/vtree_search/ingestion/source_parser.py
+- src_py/vtree_search/llm/langchain_ingestion.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import docx
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from vtree_search.config.models import IngestionConfig
+from vtree_search.ingestion.source_parser import build_source_parser
+from vtree_search.llm.langchain_ingestion import LangChainIngestionAnnotationLLM
+
+_FILE_COUNT = 4
+_TABLES_PER_FILE = 5
+_ANNOTATION_CONCURRENCY = 3
+
+
+class _InFlightCountingChatModel(BaseChatModel):
+    """비동기 호출마다 진행 중 호출 수를 기록하는 채팅 모델."""
+
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "in-flight-counting"
+
+    def _generate(self, messages: list[BaseMessage], stop: list[str] | None = None, **kwargs: Any) -> ChatResult:
+        raise NotImplementedError("비동기 경로만 사용한다")
+
+    async def _agenerate(self, messages: list[BaseMessage], stop: list[str] | None = None, **kwargs: Any) -> ChatResult:
+        self.in_flight += 1
+        self.calls += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content="[TBL]표 요약[/TBL]"))])
+
+
+def _write_docx_with_tables(path: Path, table_count: int) -> None:
+    document = docx.Document()
+    for index in range(table_count):
+        document.add_paragraph(f"{path.stem} 문단 {index}")
+        table = document.add_table(rows=2, cols=2)
+        table.cell(0, 0).text = "항목"
+        table.cell(0, 1).text = "값"
+        table.cell(1, 0).text = f"표 {index}"
+        table.cell(1, 1).text = str(index)
+    document.save(str(path))
+
+
+def _build_config(tmp_path: Path, *, max_parallel_files: int) -> IngestionConfig:
+    return IngestionConfig.model_validate(
+        {
+            "postgres": {
+                "host": "localhost",
+                "user": "u",
+                "database": "d",
+                "summary_table": "s",
+                "page_table": "p",
+                "embedding_dim": 4,
+            },
+            "preprocess": {
+                "annotation_concurrency": _ANNOTATION_CONCURRENCY,
+                "max_parallel_files": max_parallel_files,
+                "asset_output_dir": str(tmp_path / "assets"),
+            },
+        }
+    )
+
+
+def test_annotation_calls_share_one_concurrency_budget(tmp_path: Path) -> None:
+    for index in range(_FILE_COUNT):
+        _write_docx_with_tables(tmp_path / f"doc_{index}.docx", _TABLES_PER_FILE)
+    config = _build_config(tmp_path, max_parallel_files=_FILE_COUNT)
+    chat_model = _InFlightCountingChatModel()
+    parser = build_source_parser(config, annotation_llm=LangChainIngestionAnnotationLLM(chat_model))
+
+    nodes = asyncio.run(
+        parser.build_page_nodes_from_files(
+            document_id="doc",
+            parent_node_id="doc",
+            input_root=tmp_path,
+        )
+    )
+
+    assert nodes
+    assert chat_model.calls == _FILE_COUNT * _TABLES_PER_FILE
+    assert chat_model.peak_in_flight == _ANNOTATION_CONCURRENCY
+
+
+def test_parser_is_reusable_across_event_loops(tmp_path: Path) -> None:
+    for index in range(_FILE_COUNT):
+        _write_docx_with_tables(tmp_path / f"doc_{index}.docx", _TABLES_PER_FILE)
+    # 파일 슬롯을 1개로 두어 매 호출마다 슬롯 대기(경합)가 생기게 한다.
+    config = _build_config(tmp_path, max_parallel_files=1)
+    chat_model = _InFlightCountingChatModel()
+    parser = build_source_parser(config, annotation_llm=LangChainIngestionAnnotationLLM(chat_model))
+
+    for _ in range(2):
+        nodes = asyncio.run(
+            parser.build_page_nodes_from_files(
+                document_id="doc",
+                parent_node_id="doc",
+                input_root=tmp_path,
+            )
+        )
+        assert nodes
+
+    assert chat_model.calls == 2 * _FILE_COUNT * _TABLES_PER_FILE
@@ -0,0 +1,32 @@
+"""
+목적:
+- 설정 모델의 교차 필드 검증을 확인한다.
+
+설명:
+- 한쪽 값만 지정하고 다른 쪽은 기본값을 쓰는 경우에도 범위 불변식이 검사되는지 본다.
+
+참조:
+- src_py/vtree_search/config/models.py
+"""
+
+from __future__ import annotations
+
+import pytest
+from pydantic import ValidationError
+from vtree_search.config.models import RedisQueueConfig
+
+
+def test_block_window_rejects_block_ms_above_defaulted_max() -> None:
+    with pytest.raises(ValidationError, match="worker_block_max_ms는 worker_block_ms 이상"):
+        RedisQueueConfig(host="localhost", worker_block_ms=20_000)
+
+
+def test_block_window_rejects_explicit_max_below_block_ms() -> None:
+    with pytest.raises(ValidationError, match="worker_block_max_ms는 worker_block_ms 이상"):
+        RedisQueueConfig(host="localhost", worker_block_ms=2_000, worker_block_max_ms=1_000)
+
+
+def test_block_window_accepts_equal_bounds() -> None:
+    config = RedisQueueConfig(host="localhost", worker_block_ms=20_000, worker_block_max_ms=20_000)
+
+    assert config.worker_block_ms == config.worker_block_max_ms == 20_000
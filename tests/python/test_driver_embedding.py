@@ -0,0 +1,61 @@
+"""
+목적:
+- 드라이버 공용 유틸의 `parse_embedding` 정상/오류 경로를 검증한다.
+
+설명:
+- `scripts/`는 패키지가 아니므로 `_driver.py`를 파일 경로로 불러온다.
+- 차원 불일치, 숫자가 아닌 토큰, 빈 토큰은 모두 `RuntimeError`로 거절되어야 한다.
+
+참조:
+- scripts/_driver.py
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+_DRIVER_PATH = Path(__file__).resolve().parents[2] / "scripts" / "_driver.py"
+_spec = importlib.util.spec_from_file_location("vtree_search_driver", _DRIVER_PATH)
+assert _spec is not None and _spec.loader is not None
+driver = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(driver)
+
+
+def test_parse_embedding_returns_float_list() -> None:
+    values = driver.parse_embedding(" 0.5, -1,2e-3 ,4", expected_dim=4)
+
+    assert values == [0.5, -1.0, 0.002, 4.0]
+    assert all(isinstance(value, float) for value in values)
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected_dim"),
+    [
+        ("0.1,0.2,0.3", 4),
+        ("0.1,0.2,0.3,0.4,0.5", 4),
+        ("", 2),
+    ],
+)
+def test_parse_embedding_rejects_dimension_mismatch(
+    raw: str, expected_dim: int
+) -> None:
+    with pytest.raises(RuntimeError, match="--summary-embedding 길이"):
+        driver.parse_embedding(
+            raw, expected_dim=expected_dim, option_name="--summary-embedding"
+        )
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "0.1,abc,0.3",
+        "0.1,,0.3",
+        "0.1,0.2,",
+    ],
+)
+def test_parse_embedding_rejects_malformed_tokens(raw: str) -> None:
+    with pytest.raises(RuntimeError, match="--embedding"):
+        driver.parse_embedding(raw, expected_dim=3)
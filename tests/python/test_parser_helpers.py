@@ -0,0 +1,71 @@
+"""
+목적:
+- 표 셀 행렬을 HTML로 만드는 `_rows_to_html` 결과를 검증한다.
+
+설명:
+- 변환 테이블 기반 이스케이프가 `html.escape(quote=True)`와 같은 결과를 내는지 기준 구현과 비교한다.
+- 빈 행 생략, 여러 줄 셀의 `<br/>` 결합, 빈 표의 빈 문자열 반환을 확인한다.
+
+참조:
+- src_py/vtree_search/ingestion/parser_helpers.py
+"""
+
+from __future__ import annotations
+
+from html import escape
+
+from vtree_search.ingestion.parser_helpers import _rows_to_html, table_matrix_to_html
+
+
+def _reference_html(rows: list[list[str]]) -> str:
+    """문자열 이어 붙이기로 만든 기준 HTML. 빈 행은 생략하고 셀 줄은 `<br/>`로 잇는다."""
+    rows_html: list[str] = []
+    for cells in rows:
+        if not cells or not any(value.strip() for value in cells):
+            continue
+        cells_html = [
+            "<td>"
+            + "<br/>".join(
+                escape(line.strip()) for line in value.splitlines() if line.strip()
+            )
+            + "</td>"
+            for value in cells
+        ]
+        rows_html.append(f"<tr>{''.join(cells_html)}</tr>")
+    if not rows_html:
+        return ""
+    return f"<table><tbody>{''.join(rows_html)}</tbody></table>"
+
+
+def test_rows_to_html_matches_html_escape() -> None:
+    rows = [
+        ["이름", "값 <단위>"],
+        ["A & B", "\"따옴표\" 'quote'"],
+        ["", "  "],
+        ["여러\n 줄\n\n셀", ""],
+    ]
+
+    html = _rows_to_html(rows)
+
+    assert html == _reference_html(rows)
+    assert html == (
+        "<table><tbody>"
+        "<tr><td>이름</td><td>값 &lt;단위&gt;</td></tr>"
+        "<tr><td>A &amp; B</td><td>&quot;따옴표&quot; &#x27;quote&#x27;</td></tr>"
+        "<tr><td>여러<br/>줄<br/>셀</td><td></td></tr>"
+        "</tbody></table>"
+    )
+
+
+def test_rows_to_html_returns_empty_string_without_text() -> None:
+    assert _rows_to_html([]) == ""
+    assert _rows_to_html([[], ["", " \n "]]) == ""
+
+
+def test_table_matrix_to_html_treats_none_as_empty_cell() -> None:
+    html = table_matrix_to_html([[None, "1"], [None, None], [2.5, None]])
+
+    assert (
+        html
+        == "<table><tbody><tr><td></td><td>1</td></tr><tr><td>2.5</td><td></td></tr></tbody></table>"
+    )
@@ -0,0 +1,76 @@
+"""
+목적:
+- 잡 해시에 저장하는 result_json의 압축 인코딩/복원 왕복 동작을 검증한다.
+
+설명:
+- 임계값 미만 결과는 원문 JSON으로, 이상이면 `zstd:` 접두어 값으로 저장되는지 확인한다.
+- 압축 경로는 선택 의존성 `zstandard`(`vtree-search[zstd]`)가 설치된 환경에서만 실행한다.
+
+참조:
+- src_py/vtree_search/queue/redis_streams.py
+"""
+
+from __future__ import annotations
+
+import pytest
+from pydantic_core import from_json
+from vtree_search.queue.redis_streams import _encode_result_json, decode_result_json
+
+_COMPRESS_MIN_BYTES = 1_024
+
+
+def _large_result() -> dict[str, object]:
+    candidates = [
+        {
+            "node_id": f"node-{index}",
+            "path": f"doc.page_{index}",
+            "score": 0.5,
+            "content": "본문 " * 20,
+        }
+        for index in range(40)
+    ]
+    return {
+        "job_id": "job-1",
+        "candidates": candidates,
+        "metrics": {"kept_count": len(candidates)},
+    }
+
+
+def test_small_result_is_stored_as_plain_json() -> None:
+    result = {"job_id": "job-1", "candidates": []}
+
+    stored = _encode_result_json(result, _COMPRESS_MIN_BYTES)
+
+    assert not stored.startswith("zstd:")
+    assert decode_result_json(stored) == stored
+    assert from_json(stored) == result
+
+
+def test_compression_disabled_keeps_large_result_plain() -> None:
+    result = _large_result()
+
+    stored = _encode_result_json(result, 0)
+
+    assert not stored.startswith("zstd:")
+    assert from_json(decode_result_json(stored)) == result
+
+
+def test_large_result_round_trips_through_zstd() -> None:
+    pytest.importorskip("zstandard")
+    result = _large_result()
+
+    stored = _encode_result_json(result, _COMPRESS_MIN_BYTES)
+
+    assert stored.startswith("zstd:")
+    assert stored.isascii()
+    assert from_json(decode_result_json(stored)) == result
+
+
+def test_corrupted_compressed_result_raises_value_error() -> None:
+    pytest.importorskip("zstandard")
+    stored = _encode_result_json(_large_result(), _COMPRESS_MIN_BYTES)
+
+    with pytest.raises(ValueError):
+        decode_result_json(stored[:-16])
+    with pytest.raises(ValueError):
+        decode_result_json("zstd:!!not-base64!!")
@@ -0,0 +1,51 @@
+"""
+목적:
+- 검색 제출 시 질의 임베딩 입력 정규화가 잘못된 입력을 `ConfigurationError`로 거절하는지 검증한다.
+
+설명:
+- `submit_search`가 큐에 넣기 전에 거치는 `_encode_query_embedding`을 직접 호출한다.
+- 지원하지 않는 타입(`None`, `str`, 딕셔너리), 중첩 리스트, 숫자가 아닌 값, 차원 불일치를 확인한다.
+
+참조:
+- src_py/vtree_search/search/engine.py
+- src_py/vtree_search/contracts/vector_types.py
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from vtree_search.exceptions import ConfigurationError
+from vtree_search.search.engine import _encode_query_embedding
+
+_DIM = 4
+
+
+def test_encode_query_embedding_accepts_float_list() -> None:
+    embedding = _encode_query_embedding([0.1, 0.2, 0.3, 0.4], _DIM)
+
+    np.testing.assert_array_equal(
+        np.frombuffer(embedding, dtype="<f4"),
+        np.asarray([0.1, 0.2, 0.3, 0.4], dtype=np.float32),
+    )
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        "0.1,0.2,0.3,0.4",
+        {"values": [0.1, 0.2, 0.3, 0.4]},
+        [[0.1, 0.2], [0.3, 0.4]],
+        [[0.1, 0.2], [0.3]],
+        ["a", 0.2, 0.3, 0.4],
+    ],
+)
+def test_encode_query_embedding_rejects_unsupported_input(value: object) -> None:
+    with pytest.raises(ConfigurationError):
+        _encode_query_embedding(value, _DIM)
+
+
+def test_encode_query_embedding_rejects_dimension_mismatch() -> None:
+    with pytest.raises(ConfigurationError, match="expected=4, actual=3"):
+        _encode_query_embedding([0.1, 0.2, 0.3], _DIM)
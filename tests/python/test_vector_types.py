@@ -0,0 +1,128 @@
+"""
+목적:
+- 질의 임베딩 float32 인코딩과 fp16/int8 양자화의 왕복 동작을 검증한다.
+
+설명:
+- 인코딩 결과를 numpy로 다시 읽어 원본 값과 비교한다.
+- 양자화는 Rust(`search_pipeline.rs`)와 같은 규칙(`q * scale`)으로 복원해 오차 한도를 확인한다.
+
+참조:
+- src_py/vtree_search/contracts/vector_types.py
+"""
+
+from __future__ import annotations
+
+from array import array
+
+import numpy as np
+import pytest
+from vtree_search.contracts.vector_types import (
+    encode_embedding_f32,
+    quantize_embedding_f32,
+)
+
+_VECTOR = [0.25, -1.5, 3.0, 0.0, 1e-3, -0.75, 2.5, -3.0]
+
+
+def _as_f32(data: bytes) -> np.ndarray:
+    return np.frombuffer(data, dtype="<f4")
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        _VECTOR,
+        tuple(_VECTOR),
+        np.asarray(_VECTOR, dtype=np.float64),
+        np.asarray(_VECTOR, dtype=np.float32),
+        array("d", _VECTOR),
+    ],
+)
+def test_encode_embedding_f32_round_trip(value: object) -> None:
+    encoded = encode_embedding_f32(value)
+
+    assert isinstance(encoded, bytes)
+    np.testing.assert_array_equal(
+        _as_f32(encoded), np.asarray(_VECTOR, dtype=np.float32)
+    )
+
+
+def test_encode_embedding_f32_non_contiguous_array() -> None:
+    strided = np.asarray(_VECTOR * 2, dtype=np.float32)[::2]
+
+    encoded = encode_embedding_f32(strided)
+
+    np.testing.assert_array_equal(_as_f32(encoded), strided)
+
+
+def test_encode_embedding_f32_keeps_bytes_and_copies_buffers() -> None:
+    raw = np.asarray(_VECTOR, dtype="<f4").tobytes()
+
+    assert encode_embedding_f32(raw) is raw
+    assert encode_embedding_f32(bytearray(raw)) == raw
+    assert encode_embedding_f32(memoryview(raw)) == raw
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        b"\x00\x00\x80",
+        bytearray(b"\x00" * 6),
+        np.zeros((2, 2), dtype=np.float32),
+    ],
+)
+def test_encode_embedding_f32_rejects_malformed_input(value: object) -> None:
+    with pytest.raises(ValueError):
+        encode_embedding_f32(value)
+
+
+def test_quantize_fp32_is_identity() -> None:
+    raw = encode_embedding_f32(_VECTOR)
+
+    quantized, scale = quantize_embedding_f32(raw, "fp32")
+
+    assert quantized is raw
+    assert scale == 1.0
+
+
+def test_quantize_fp16_round_trip() -> None:
+    raw = encode_embedding_f32(_VECTOR)
+
+    quantized, scale = quantize_embedding_f32(raw, "fp16")
+
+    assert scale == 1.0
+    assert len(quantized) == len(_VECTOR) * 2
+    restored = np.frombuffer(quantized, dtype="<f2").astype(np.float32)
+    np.testing.assert_allclose(restored, _as_f32(raw), rtol=1e-3, atol=1e-4)
+
+
+def test_quantize_int8_round_trip() -> None:
+    vector = np.random.default_rng(7).standard_normal(768).astype(np.float32)
+    raw = encode_embedding_f32(vector)
+
+    quantized, scale = quantize_embedding_f32(raw, "int8")
+
+    assert len(quantized) == vector.size
+    codes = np.frombuffer(quantized, dtype=np.int8)
+    assert int(np.max(np.abs(codes))) == 127
+    restored = codes.astype(np.float32) * np.float32(scale)
+    # 대칭 양자화의 반올림 오차는 scale의 절반을 넘지 않는다.
+    assert float(np.max(np.abs(restored - vector))) <= scale / 2 + 1e-6
+    cosine = float(
+        np.dot(restored, vector) / (np.linalg.norm(restored) * np.linalg.norm(vector))
+    )
+    assert cosine > 0.999
+
+
+def test_quantize_int8_zero_vector_keeps_unit_scale() -> None:
+    raw = encode_embedding_f32([0.0, 0.0, 0.0])
+
+    quantized, scale = quantize_embedding_f32(raw, "int8")
+
+    assert scale == 1.0
+    assert quantized == b"\x00\x00\x00"
+
+
+def test_quantize_rejects_unknown_dtype() -> None:
+    with pytest.raises(ValueError):
+        quantize_embedding_f32(encode_embedding_f32(_VECTOR), "bf16")